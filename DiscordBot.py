@@ -4,6 +4,7 @@ from discord import Intents
 from colorama import Fore, init
 
 from utils.tools import Helpers
+from cogs.utils.explorerQueue import ExplorerQueue
 
 CONST_SEPARATOR = '+++++++++++++++++++++++++++++++++++++++'
 # init colorama :
@@ -44,6 +45,7 @@ class DiscordBot(commands.Bot):
             intents=Intents.all())
         self.remove_command('help')  # removing the old help command
         self.backoffice = backoffice
+        self.explorer_queue = ExplorerQueue(self)
         self.load_cogs()
 
     def load_cogs(self):
@@ -104,6 +106,8 @@ class DiscordBot(commands.Bot):
             """
 
         await self.change_presence(status=discord.Status.online, activity=discord.Game('Online and ready'))
+        channels = await self.backoffice.guild_profiles.load_explorer_channels()
+        print(Fore.GREEN + f'Explorer feed registry loaded with {len(channels)} channels')
         print(Fore.GREEN + 'DISCORD BOT : Logged in as')
         print(self.user.name)
         print(self.user.id)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import time
 from datetime import datetime
 import tweepy
@@ -9,15 +10,21 @@ import discord
 from discord import Embed, Color
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from colorama import Fore, init
+from pymongo import errors
 
 from cogs.utils.systemMessaages import CustomMessages
+from cogs.utils.priceCache import price_cache
 from utils.tools import Helpers
 
 init(autoreset=True)
 custom_messages = CustomMessages()
 helper = Helpers()
 channels = helper.read_json_file(file_name='autoMessagingChannels.json')
+CONST_STREAM_BACKOFF_MIN = 1  # Seconds before first reconnect attempt of deposit stream
+CONST_STREAM_BACKOFF_MAX = 60  # Upper limit of seconds between reconnect attempts
+CONST_MEMO_RELOAD_INTERVAL = 600  # Seconds between memo index reloads when change streams are not available
 
 
 def get_time():
@@ -34,6 +41,11 @@ class PeriodicTasks:
         self.backoffice = backoffice
         self.twitter_cred = self.backoffice.twitter_details
         self.notification_channels = self.backoffice.auto_messaging_channels["depositNotifications"]
+        self.deposit_stream = self.backoffice.deposit_settings.get("stream", False)
+        self.memo_index_enabled = self.backoffice.deposit_settings.get("memoIndex", True)
+        self.deposit_endpoint = self.backoffice.deposit_settings.get("endpoint", "transactions")
+        price_cache.track_integrated_coins(integrated_coins=self.backoffice.integrated_coins)
+        self.deposit_max_pages = int(self.backoffice.deposit_settings.get("maxPagesPerTick", 10))
         self.bot = bot
         self.twitter_acc = self.backoffice.twitter_details
         auth = tweepy.OAuthHandler(self.twitter_cred["apiKey"], self.twitter_cred["apiSecret"])
@@ -48,25 +60,45 @@ class PeriodicTasks:
         await self.backoffice.stats_manager.update_cl_on_chain_stats(ticker=tx['asset_type']['code'].lower(),
                                                                      stat_details=bot_stats)
 
-    def filter_transaction(self, new_transactions: list):
-        # Building list of deposits if memo included
+    async def resolve_memo_owners(self, memos: list) -> dict:
+        """
+        Resolve deposit memos to Discord user ids. In memory index is used when enabled and loaded, while memos
+        unknown to it are checked in database only if change stream is not keeping it current.
+        """
+        memo_index = self.backoffice.memo_index
         stellar_manager = self.backoffice.stellar_manager
+        if not self.memo_index_enabled or not memo_index.loaded:
+            return await stellar_manager.get_memo_owners(memos=memos)
+
+        memo_owners = memo_index.resolve(memos=memos)
+        if not memo_index.live:
+            missing = [memo for memo in memos if memo not in memo_owners]
+            if missing:
+                found = await stellar_manager.get_memo_owners(memos=missing)
+                for memo, user_id in found.items():
+                    memo_index.add(memo=memo, user_id=user_id)
+                memo_owners.update(found)
+        return memo_owners
+
+    @staticmethod
+    def filter_transaction(new_transactions: list, memo_owners: dict):
+        # Building list of deposits if memo included
         tx_with_memo_special = [tx for tx in new_transactions if
                                 'memo' in tx.keys() and helper.check_for_special_char(tx["memo"])]
         tx_with_memo = [tx for tx in new_transactions if 'memo' in tx.keys() and not helper.check_for_special_char(
             tx["memo"])]  # GET Transactions who have memo
         tx_with_no_memo = [tx for tx in new_transactions if tx not in tx_with_memo]  # GET transactions without memo
-        tx_with_registered_memo = [tx for tx in tx_with_memo if stellar_manager.check_if_stellar_memo_exists(
-            tx_memo=tx['memo'])]  # GET tx with registered memo
+        tx_with_registered_memo = [tx for tx in tx_with_memo if
+                                   tx['memo'] in memo_owners]  # GET tx with registered memo
         tx_with_not_registered_memo = [tx for tx in tx_with_memo if
                                        tx not in tx_with_registered_memo]  # GET tx with not registered memo
         return tx_with_registered_memo, tx_with_not_registered_memo, tx_with_no_memo, tx_with_memo_special
 
-    async def process_tx_with_no_memo(self, channel, no_memo_transaction):
+    async def process_tx_with_no_memo(self, channel, no_memo_transaction, processed_deposits: set):
         stellar_manager = self.backoffice.stellar_manager
         for tx in no_memo_transaction:
-            if not stellar_manager.check_if_deposit_hash_processed_unprocessed_deposits(tx_hash=tx['hash']):
-                if stellar_manager.stellar_deposit_history(deposit_type=2, tx_data=tx):
+            if stellar_manager.deposit_key(tx) not in processed_deposits:
+                if await stellar_manager.stellar_deposit_history(deposit_type=2, tx_data=tx):
                     await self.global_bot_stats_update(tx=tx)
                     await custom_messages.send_unidentified_deposit_msg(channel=channel, tx_details=tx)
                 else:
@@ -75,70 +107,55 @@ class PeriodicTasks:
             else:
                 print(Fore.YELLOW + 'Unknown processed already')
 
-    async def process_tx_with_memo(self, channel, memo_transactions):
+    async def process_tx_with_memo(self, channel, memo_transactions, processed_deposits: set, memo_owners: dict):
         bot = self.bot
         stellar_manager = self.backoffice.stellar_manager
         stats_manager = self.backoffice.stats_manager
-        wallet_manager = self.backoffice.wallet_manager
-        guild_profiles = self.backoffice.guild_profiles
-        for tx in memo_transactions:
-            # check if processed if not process them
-            if not stellar_manager.check_if_deposit_hash_processed_succ_deposits(tx['hash']):
-                if stellar_manager.stellar_deposit_history(deposit_type=1, tx_data=tx):
-                    # Update balance based on incoming asset
-                    if not helper.check_for_special_char(tx["memo"]):
-                        if wallet_manager.update_coin_balance_by_memo(memo=tx['memo'], coin=tx['asset_type']["code"],
-                                                                      amount=int(tx['asset_type']["amount"])):
-                            # If balance updated successfully send the message to user of processed deposit
-                            user_id = wallet_manager.get_discord_id_from_memo(memo=tx['memo'])  # Return usr int number
-                            dest = await bot.fetch_user(user_id=int(user_id))
-
-                            on_chain_stats = {
-                                f"{tx['asset_type']['code'].lower()}.depositsCount": 1,
-                                f"{tx['asset_type']['code'].lower()}.totalDeposited": round(
-                                    int(tx['asset_type']["amount"]) / 10000000,
-                                    7)}
-
-                            await stats_manager.update_user_on_chain_stats(user_id=dest.id, stats_data=on_chain_stats)
-
-                            await self.global_bot_stats_update(tx=tx)
-
-                            await custom_messages.deposit_notification_message(recipient=dest, tx_details=tx)
-
-                            # Channel system message on deposit
-                            await custom_messages.sys_deposit_notifications(channel=channel,
-                                                                            user=dest, tx_details=tx)
-
-                            # Explorer messages
-                            load_channels = [bot.get_channel(id=int(chn)) for chn in
-                                             guild_profiles.get_all_explorer_applied_channels()]
-
-                            explorer_msg = f':inbox_tray: Someone deposited {round(tx["asset_type"]["amount"] / (10 ** 7), 7)} ' \
-                                           f'{tx["asset_type"]["code"].upper()} to {bot.user}'
-
-                            await custom_messages.explorer_messages(applied_channels=load_channels,
-                                                                    message=explorer_msg,
-                                                                    on_chain=True, tx_type='deposit')
 
-                        else:
-                            print(Fore.RED + f'TX Processing error: \n'
-                                             f'{tx}')
-                    else:
-                        print(Fore.RED + f'Special characters in Memo write to file: \n'
-                                         f'{tx}')
-                        await custom_messages.send_special_char_notification(channel=channel, tx=tx)
+        # check if processed if not process them
+        new_deposits = [tx for tx in memo_transactions if stellar_manager.deposit_key(tx) not in processed_deposits]
+        if not new_deposits:
+            print(Fore.LIGHTCYAN_EX + 'No new legit tx')
+            return
 
-                else:
-                    print(Fore.RED + 'Could not store to history')
-            else:
-                print(Fore.LIGHTCYAN_EX + 'No new legit tx')
+        # History entry and balance credit are written atomically, already stored deposits are skipped
+        stored_deposits = await stellar_manager.credit_deposits(deposits=new_deposits)
+        if len(stored_deposits) != len(new_deposits):
+            print(Fore.YELLOW + f'{len(new_deposits) - len(stored_deposits)} deposits have been processed already')
+
+        for tx in stored_deposits:
+            # If balance updated successfully send the message to user of processed deposit
+            user_id = memo_owners[tx['memo']]
+            dest = await bot.fetch_user(user_id=int(user_id))
 
-    async def process_tx_with_not_registered_memo(self, channel, no_registered_memo):
+            on_chain_stats = {
+                f"{tx['asset_type']['code'].lower()}.depositsCount": 1,
+                f"{tx['asset_type']['code'].lower()}.totalDeposited": round(
+                    int(tx['asset_type']["amount"]) / 10000000,
+                    7)}
+
+            await stats_manager.update_user_on_chain_stats(user_id=dest.id, stats_data=on_chain_stats)
+
+            await self.global_bot_stats_update(tx=tx)
+
+            await custom_messages.deposit_notification_message(recipient=dest, tx_details=tx)
+
+            # Channel system message on deposit
+            await custom_messages.sys_deposit_notifications(channel=channel,
+                                                            user=dest, tx_details=tx)
+
+            # Explorer messages
+            explorer_msg = f':inbox_tray: Someone deposited {round(tx["asset_type"]["amount"] / (10 ** 7), 7)} ' \
+                           f'{tx["asset_type"]["code"].upper()} to {bot.user}'
+
+            await bot.explorer_queue.publish(message=explorer_msg, on_chain=True)
+
+    async def process_tx_with_not_registered_memo(self, channel, no_registered_memo, processed_deposits: set):
         stellar_manager = self.backoffice.stellar_manager
         for tx in no_registered_memo:
-            if not stellar_manager.check_if_deposit_hash_processed_unprocessed_deposits(tx_hash=tx['hash']):
+            if stellar_manager.deposit_key(tx) not in processed_deposits:
                 if not helper.check_for_special_char(tx["memo"]):
-                    if stellar_manager.stellar_deposit_history(deposit_type=2, tx_data=tx):
+                    if await stellar_manager.stellar_deposit_history(deposit_type=2, tx_data=tx):
                         await self.global_bot_stats_update(tx=tx)
                         await custom_messages.send_unidentified_deposit_msg(channel=channel, tx_details=tx)
                     else:
@@ -154,46 +171,147 @@ class PeriodicTasks:
     async def process_tx_with_special_chart(self, channel):
         pass
 
-    async def check_stellar_hot_wallet(self):
+    async def process_incoming_transactions(self, new_transactions: list):
         """
-        Functions initiates the check for stellar incoming deposits and processes them
+        Filters incoming transactions and dispatches them to processing based on the memo
         """
         bot = self.bot
+        # Owners of all memos in the batch resolved at once
+        memo_owners = await self.resolve_memo_owners(
+            memos=[tx['memo'] for tx in new_transactions if 'memo' in tx.keys()])
+        filtered = self.filter_transaction(new_transactions=new_transactions, memo_owners=memo_owners)
+        tx_with_registered_memo, tx_with_not_registered_memo, tx_with_no_memo, tx_with_memo_special = filtered
+
+        # Deposits of the whole batch already stored in the system
+        processed_deposits = await self.backoffice.stellar_manager.get_processed_deposits(deposits=new_transactions)
+
+        if tx_with_registered_memo:
+            channel = bot.get_channel(id=int(self.notification_channels['memoRegistered']))
+            await self.process_tx_with_memo(channel=channel, memo_transactions=tx_with_registered_memo,
+                                            processed_deposits=processed_deposits, memo_owners=memo_owners)
+        if tx_with_not_registered_memo:
+            channel = bot.get_channel(id=int(self.notification_channels['memoNotRegistered']))
+            await self.process_tx_with_not_registered_memo(channel=channel,
+                                                           no_registered_memo=tx_with_not_registered_memo,
+                                                           processed_deposits=processed_deposits)
+        if tx_with_no_memo:
+            channel = bot.get_channel(id=int(self.notification_channels['memoNone']))
+            await self.process_tx_with_no_memo(channel=channel, no_memo_transaction=tx_with_no_memo,
+                                               processed_deposits=processed_deposits)
+
+        if tx_with_memo_special:
+            channel = bot.get_channel(id=int(self.notification_channels['memoSpecialChar']))
+            await self.process_tx_with_special_chart(channel=channel)
+
+    async def check_stellar_hot_wallet(self):
+        """
+        Functions initiates the check for stellar incoming deposits and processes them. If system is behind the
+        chain head, pages are drained till the head or page limit per run is reached.
+        """
         print(Fore.GREEN + f"{get_time()} --> CHECKING STELLAR CHAIN FOR DEPOSITS")
         pag = helper.read_json_file('stellarPag.json')
-        new_transactions = self.backoffice.stellar_wallet.get_incoming_transactions(pag=int(pag['pag']))
-        if new_transactions:
-            # Filter transactions
-
-            tx_with_registered_memo, tx_with_not_registered_memo, tx_with_no_memo, tx_with_memo_special = self.filter_transaction(
-                new_transactions)
-            if tx_with_registered_memo:
-                channel = bot.get_channel(id=int(self.notification_channels['memoRegistered']))
-                await self.process_tx_with_memo(channel=channel, memo_transactions=tx_with_registered_memo)
-            if tx_with_not_registered_memo:
-                channel = bot.get_channel(id=int(self.notification_channels['memoNotRegistered']))
-                await self.process_tx_with_not_registered_memo(channel=channel,
-                                                               no_registered_memo=tx_with_not_registered_memo)
-            if tx_with_no_memo:
-                channel = bot.get_channel(id=int(self.notification_channels['memoNone']))
-                await self.process_tx_with_no_memo(channel=channel, no_memo_transaction=tx_with_no_memo)
-
-            if tx_with_memo_special:
-                channel = bot.get_channel(id=int(self.notification_channels['memoSpecialChar']))
-                await self.process_tx_with_special_chart(channel=channel)
-
-            last_checked_pag = new_transactions[-1]["paging_token"]
+        last_checked_pag = pag['pag']
+        pages_processed = 0
+        tx_processed = 0
+        async for new_transactions, last_checked_pag in self.backoffice.stellar_wallet.get_incoming_transaction_pages(
+                pag=int(pag['pag']), max_pages=self.deposit_max_pages, endpoint=self.deposit_endpoint):
+            pages_processed += 1
+            if new_transactions:
+                await self.process_incoming_transactions(new_transactions=new_transactions)
+                tx_processed += len(new_transactions)
+
+            # Cursor is stored after every page so nothing gets lost if system crashes in the middle of draining
             if helper.update_json_file(file_name='stellarPag.json', key='pag', value=int(last_checked_pag)):
-                print(Fore.GREEN + f'Peg updated successfully from {pag} --> {last_checked_pag}')
+                print(Fore.GREEN + f'Page {pages_processed}/{self.deposit_max_pages}: {len(new_transactions)} '
+                                   f'incoming --> Peg updated to {last_checked_pag}')
             else:
                 print(Fore.RED + 'There was an issue with updating pag')
 
-            print(Fore.GREEN + '==============DONE=================\n'
+        if pages_processed:
+            if pages_processed == self.deposit_max_pages:
+                print(Fore.YELLOW + f'Catching up with chain head: {pages_processed} pages drained from {pag} --> '
+                                    f'{last_checked_pag}. Continuing on next run')
+            print(Fore.GREEN + f'==============DONE ({tx_processed} incoming)=================\n'
                                '==========GOING TO SLEEP FOR 1 MINUTE=====')
         else:
             print(Fore.CYAN + 'No new incoming transactions in range...Going to sleep for 60 seconds')
             print('==============================================')
 
+    async def stream_stellar_hot_wallet(self):
+        """
+        Long lived deposit ingestion following Horizon stream of hot wallet transactions. Stream resumes from the
+        stored paging token and reconnects with backoff once it gets interrupted.
+        """
+        await self.bot.wait_until_ready()
+        backoff = CONST_STREAM_BACKOFF_MIN
+        while True:
+            pag = helper.read_json_file('stellarPag.json')
+            print(Fore.GREEN + f"{get_time()} --> STREAMING STELLAR CHAIN FOR DEPOSITS FROM {pag['pag']}")
+            try:
+                async for paging_token, deposits in self.backoffice.stellar_wallet.stream_incoming_transactions(
+                        pag=int(pag['pag']), endpoint=self.deposit_endpoint):
+                    backoff = CONST_STREAM_BACKOFF_MIN
+                    if deposits:
+                        await self.process_incoming_transactions(new_transactions=deposits)
+
+                    if not helper.update_json_file(file_name='stellarPag.json', key='pag', value=int(paging_token)):
+                        print(Fore.RED + 'There was an issue with updating pag')
+            except Exception as e:
+                print(Fore.RED + f'Deposit stream interrupted: {e}')
+
+            print(Fore.YELLOW + f'Reconnecting deposit stream in {backoff} seconds')
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, CONST_STREAM_BACKOFF_MAX)
+
+    async def follow_memo_index(self):
+        """
+        Loads deposit memo index and keeps it current with userWallets change stream. If deployment does not support
+        change streams registration hook adds new memos, while index is reloaded periodically to drop memos of deleted
+        wallets.
+        """
+        memo_index = self.backoffice.memo_index
+        backoff = CONST_STREAM_BACKOFF_MIN
+        while True:
+            try:
+                await memo_index.watch()
+                backoff = CONST_STREAM_BACKOFF_MIN
+            except errors.OperationFailure as e:
+                print(Fore.YELLOW + f'Change streams not available for memo index ({e}). Using registration hook')
+                while True:
+                    try:
+                        await memo_index.load()
+                    except Exception as e:
+                        print(Fore.RED + f'Memo index could not be reloaded: {e}')
+                    await asyncio.sleep(CONST_MEMO_RELOAD_INTERVAL)
+            except Exception as e:
+                print(Fore.RED + f'Memo index change stream interrupted: {e}')
+
+            print(Fore.YELLOW + f'Reconnecting memo index change stream in {backoff} seconds')
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, CONST_STREAM_BACKOFF_MAX)
+
+    async def refresh_prices(self):
+        """
+        Refresh shared price cache so commands read conversion rates from memory
+        """
+        if not await price_cache.refresh():
+            print(Fore.YELLOW + f"{get_time()} --> Using last known prices")
+
+    async def refresh_base_fee(self):
+        """
+        Refresh base fee used for transactions from Horizon fee stats
+        """
+        fee_oracle = self.backoffice.stellar_wallet.fee_oracle
+        if await fee_oracle.refresh() and fee_oracle.congested:
+            print(Fore.YELLOW + f"{get_time()} --> Network congested, base fee set to {fee_oracle.base_fee} stroops")
+
+    async def flush_global_stats(self):
+        """
+        Write global stats aggregated in memory since last flush
+        """
+        if not await self.backoffice.stats_manager.flush_global_stats():
+            print(Fore.YELLOW + f"{get_time()} --> Global stats kept in memory until next flush")
+
     async def check_expired_roles(self):
         """
         Function checks for expired users on community nad removes them if necessary
@@ -201,7 +319,7 @@ class PeriodicTasks:
         print(Fore.GREEN + f"{get_time()} --> CHECKING FOR USERS WITH EXPIRED ROLES ")
         now = datetime.utcnow().timestamp()  # Gets current time of the system in unix format
         merchant_manager = self.backoffice.merchant_manager
-        overdue_members = merchant_manager.get_over_due_users(
+        overdue_members = await merchant_manager.get_over_due_users(
             timestamp=int(now))  # Gets all overdue members from database
         bot = self.bot
         if overdue_members:
@@ -222,8 +340,8 @@ class PeriodicTasks:
                         if role:
                             if role in member.roles:
                                 await member.remove_roles(role, reason='Merchant notification -> Role expired')
-                                if merchant_manager.remove_overdue_user_role(community_id=mem_role_community_id,
-                                                                             role_id=mem_role_id, user_id=mem_id):
+                                if await merchant_manager.remove_overdue_user_role(community_id=mem_role_community_id,
+                                                                                   role_id=mem_role_id, user_id=mem_id):
                                     expired = discord.Embed(name=':timer: Expired Role :timer: ',
                                                             title='__Role Expiration Notification__',
                                                             description='Your membership has expired. Please check '
@@ -259,17 +377,17 @@ class PeriodicTasks:
                                     merch_channel = bot.get_channel(id=int(channel_sys))
                                     await merch_channel.send(embed=expired_sys)
                             else:
-                                merchant_manager.remove_overdue_user_role(community_id=mem_role_community_id,
-                                                                          user_id=mem_id, role_id=mem_role_id)
+                                await merchant_manager.remove_overdue_user_role(community_id=mem_role_community_id,
+                                                                                user_id=mem_id, role_id=mem_role_id)
                         else:
-                            merchant_manager.remove_monetized_role_from_system(role_id=mem_role_id,
-                                                                               community_id=mem_role_community_id)
-                            merchant_manager.bulk_user_clear(community_id=mem_role_community_id, role_id=mem_role_id)
+                            await merchant_manager.remove_monetized_role_from_system(role_id=mem_role_id,
+                                                                                     community_id=mem_role_community_id)
+                            await merchant_manager.bulk_user_clear(community_id=mem_role_community_id, role_id=mem_role_id)
                     else:
-                        merchant_manager.delete_user_from_applied(community_id=mem_role_community_id, user_id=mem_id)
+                        await merchant_manager.delete_user_from_applied(community_id=mem_role_community_id, user_id=mem_id)
                 else:
-                    merchant_manager.bulk_user_clear(community_id=mem_role_community_id, role_id=mem_role_id)
-                    merchant_manager.remove_all_monetized_roles(guild_id=mem_role_community_id)
+                    await merchant_manager.bulk_user_clear(community_id=mem_role_community_id, role_id=mem_role_id)
+                    await merchant_manager.remove_all_monetized_roles(guild_id=mem_role_community_id)
 
         else:
             print(Fore.GREEN + 'There are no overdue members in the system going to sleep!')
@@ -277,7 +395,7 @@ class PeriodicTasks:
 
     async def send_marketing_messages(self):
         print(Fore.GREEN + f"{get_time()} --> Sending report to Discord ")
-        stats = self.backoffice.stats_manager.get_all_stats()
+        stats = await self.backoffice.stats_manager.get_all_stats()
         off_chain_xlm = stats["xlm"]["offChain"]
         total_tx = off_chain_xlm["totalTx"]
         total_moved = round(off_chain_xlm["totalMoved"], 7)
@@ -341,7 +459,7 @@ class PeriodicTasks:
             print(Fore.RED + f"{e} ")
 
     async def send_builder_ranks(self):
-        stats = self.backoffice.stats_manager.get_top_builders(limit=5)
+        stats = await self.backoffice.stats_manager.get_top_builders(limit=5)
         bridges = '\U0001F309'
         string = ''
         rank = 1
@@ -370,8 +488,23 @@ def start_scheduler(timed_updater):
     scheduler = AsyncIOScheduler()
     print(Fore.LIGHTBLUE_EX + 'Started Chron Monitors')
 
-    scheduler.add_job(timed_updater.check_stellar_hot_wallet,
-                      CronTrigger(second='00'), misfire_grace_time=10, max_instances=20)
+    if timed_updater.memo_index_enabled:
+        # Long lived job loading memo index and following changes of registered wallets
+        scheduler.add_job(timed_updater.follow_memo_index, misfire_grace_time=None)
+
+    if timed_updater.deposit_stream:
+        # Long lived job started once, which follows Horizon stream
+        scheduler.add_job(timed_updater.stream_stellar_hot_wallet, misfire_grace_time=None)
+    else:
+        scheduler.add_job(timed_updater.check_stellar_hot_wallet,
+                          CronTrigger(second='00'), misfire_grace_time=10, max_instances=1)
+    scheduler.add_job(timed_updater.refresh_prices, CronTrigger(second='*/30'), misfire_grace_time=10,
+                      max_instances=1, next_run_time=datetime.now())
+    scheduler.add_job(timed_updater.refresh_base_fee, IntervalTrigger(seconds=10), misfire_grace_time=10,
+                      max_instances=1, next_run_time=datetime.now())
+    scheduler.add_job(timed_updater.flush_global_stats,
+                      IntervalTrigger(seconds=timed_updater.backoffice.stats_manager.flush_interval),
+                      misfire_grace_time=10, max_instances=1)
     scheduler.add_job(timed_updater.check_expired_roles, CronTrigger(
         second='00'), misfire_grace_time=10, max_instances=20)
 
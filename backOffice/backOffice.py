@@ -10,6 +10,9 @@ from backOffice.stellarActivityManager import StellarManager
 from backOffice.statsManager import StatsManager
 from backOffice.userWalletManager import UserWalletManager
 from backOffice.guildServicesManager import GuildProfileManager
+from backOffice.memoIndex import MemoIndex
+from backOffice.registrationCache import RegistrationCache
+from backOffice.withdrawalQueue import WithdrawalQueue
 from backOffice.profileRegistrations import AccountManager
 from backOffice.botManager import BotManager
 from backOffice.corpHistory import CorporateHistoryManager
@@ -26,23 +29,35 @@ class BackOffice:
         self.as_connection = motor.motor_asyncio.AsyncIOMotorClient(bot_data['database']['connection'])
         self.twitter_details = bot_data["twitter"]
         self.horizon_url = bot_data['horizonServer']
+        self.deposit_settings = bot_data.get('depositSettings', {})
+        self.stats_settings = bot_data.get('statsSettings', {})
+        self.fee_settings = bot_data.get('feeSettings', {})
         self.creator_id = bot_data["creator"]
         self.auto_messaging_channels = self.helper.read_json_file(file_name='autoMessagingChannels.json')
 
         self.backend_check = BotStructureCheck(self.connection)
-        self.second_level_manager = SecondLevelWalletManager(self.connection)
-        self.third_level_manager = ThirdLevelWalletManager(self.connection)
-        self.stellar_wallet = StellarWallet(horizon_url=self.horizon_url, integrated_coins=self.integrated_coins)
-        self.merchant_manager = MerchantManager(self.connection)
+        self.registration_cache = RegistrationCache()
+        self.second_level_manager = SecondLevelWalletManager(self.connection, self.as_connection,
+                                                             registration_cache=self.registration_cache)
+        self.third_level_manager = ThirdLevelWalletManager(self.connection, self.as_connection,
+                                                           registration_cache=self.registration_cache)
+        self.stellar_wallet = StellarWallet(horizon_url=self.horizon_url, integrated_coins=self.integrated_coins,
+                                            fee_settings=self.fee_settings)
+        self.withdrawal_queue = WithdrawalQueue(self.stellar_wallet)
+        self.merchant_manager = MerchantManager(self.connection, self.as_connection,
+                                                registration_cache=self.registration_cache)
         self.stellar_manager = StellarManager(self.connection, self.as_connection)
-        self.stats_manager = StatsManager(self.connection, self.as_connection)
+        self.stats_manager = StatsManager(self.connection, self.as_connection, stats_settings=self.stats_settings)
         self.wallet_manager = UserWalletManager(self.connection, self.as_connection)
         self.guild_profiles = GuildProfileManager(self.connection, self.as_connection)
-        self.account_mng = AccountManager(self.connection)
-        self.bot_manager = BotManager(self.connection)
-        self.corporate_hist_mng = CorporateHistoryManager(self.connection)
+        self.memo_index = MemoIndex(self.as_connection)
+        self.account_mng = AccountManager(self.connection, self.as_connection, memo_index=self.memo_index,
+                                          registration_cache=self.registration_cache)
+        self.bot_manager = BotManager(self.connection, self.as_connection)
+        self.corporate_hist_mng = CorporateHistoryManager(self.connection, self.as_connection)
 
     def check_backend(self):
         self.backend_check.check_collections()
+        self.backend_check.check_indexes()
         self.backend_check.checking_stats_documents()
         self.backend_check.checking_bot_wallets()
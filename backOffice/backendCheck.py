@@ -6,6 +6,7 @@ import os
 import sys
 
 from colorama import Fore, init
+from pymongo import errors, ASCENDING
 
 project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_path)
@@ -38,6 +39,19 @@ class BotStructureCheck(object):
                                      "userHotWallets",
                                      "thirdLevelWallets"]
 
+        # Collections which need unique index on the keys to be safe from double processing. Deposit is identified
+        # by transaction hash and index of payment operation inside transaction, user can hold only one wallet
+        self.unique_indexes = {"StellarDeposits": [("hash", ASCENDING), ("opIndex", ASCENDING)],
+                               "StellarUnprocessedDeposits": [("hash", ASCENDING), ("opIndex", ASCENDING)],
+                               "userWallets": [("userId", ASCENDING)]}
+        # Values set on documents stored before the key became part of unique index, so older documents collide
+        # with new ones of same key instead of being inserted again
+        self.index_defaults = {"StellarDeposits": {"opIndex": 0},
+                               "StellarUnprocessedDeposits": {"opIndex": 0}}
+        # Indexes replaced with the ones above
+        self.obsolete_indexes = {"StellarDeposits": ["hash_1"],
+                                 "StellarUnprocessedDeposits": ["hash_1"]}
+
     def check_collections(self):
         """
         Check all required collections
@@ -53,6 +67,28 @@ class BotStructureCheck(object):
                 print(Fore.GREEN + f'{collection.upper()} already exists')
         print(Fore.LIGHTGREEN_EX + "====DONE====")
 
+    def check_indexes(self):
+        """
+        Check that unique indexes exist on collections
+        """
+        print(Fore.GREEN + "2. Checking indexes")
+        for collection, keys in self.unique_indexes.items():
+            existing = self.crypto_link[collection].index_information()
+            for obsolete in self.obsolete_indexes.get(collection, []):
+                if obsolete in existing:
+                    self.crypto_link[collection].drop_index(obsolete)
+                    print(Fore.YELLOW + f'{collection.upper()} obsolete index {obsolete} dropped')
+            for key, default in self.index_defaults.get(collection, {}).items():
+                result = self.crypto_link[collection].update_many({key: {"$exists": False}}, {"$set": {key: default}})
+                if result.modified_count:
+                    print(Fore.YELLOW + f'{collection.upper()} {key} set on {result.modified_count} documents')
+            try:
+                index = self.crypto_link[collection].create_index(keys, unique=True)
+                print(Fore.GREEN + f'{collection.upper()} unique index {index} OK')
+            except errors.OperationFailure as e:
+                print(Fore.RED + f'Could not create unique index on {collection.upper()} {keys}: {e}')
+        print(Fore.LIGHTGREEN_EX + "====DONE====")
+
     def checking_stats_documents(self):
         """
         Checking document for statistical entry
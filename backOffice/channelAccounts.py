@@ -0,0 +1,60 @@
+"""
+Pool of channel accounts used as transaction sources for hot wallet payments
+"""
+
+import asyncio
+import os
+import sys
+
+project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_path)
+
+from stellar_sdk import Keypair
+
+from backOffice.sequenceManager import SequenceManager
+
+
+class ChannelAccount:
+    """
+    Account paying the fee and providing sequence number for transaction in which hot wallet is source of operations
+    """
+
+    def __init__(self, as_server, secret: str):
+        self.keypair = Keypair.from_secret(secret)
+        self.public_key = self.keypair.public_key
+        self.sequence = SequenceManager(as_server=as_server, account_id=self.public_key)
+
+
+class ChannelPool:
+    """
+    Channel accounts are checked out one per transaction so transactions from the hot wallet are submitted in
+    parallel, each with its own sequence number space.
+    """
+
+    def __init__(self, as_server, secrets: list):
+        self.channels = [ChannelAccount(as_server=as_server, secret=secret) for secret in secrets]
+        self.available = None  # Queue of idle channels, created lazily so it binds to the running loop
+
+    def __len__(self):
+        return len(self.channels)
+
+    async def acquire(self):
+        """
+        Wait for idle channel account
+        :return: ChannelAccount or None if no channel accounts are configured
+        """
+        if not self.channels:
+            return None
+
+        if self.available is None:
+            self.available = asyncio.Queue()
+            for channel in self.channels:
+                self.available.put_nowait(channel)
+        return await self.available.get()
+
+    def release(self, channel: ChannelAccount):
+        """
+        Return channel account to the pool
+        """
+        if channel is not None:
+            self.available.put_nowait(channel)
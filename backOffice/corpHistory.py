@@ -13,12 +13,13 @@ sys.path.append(project_path)
 class CorporateHistoryManager:
     """Class dealing with corporate withdrawal history"""
 
-    def __init__(self, connection):
+    def __init__(self, connection, as_connection):
         self.connection = connection
-        self.corp_activity = self.connection['CryptoLink']
-        self.corp_withdrawals = self.corp_activity.CORPFromTransactions
+        self.as_connection = as_connection
+        self.as_corp_activity = self.as_connection['CryptoLink']
+        self.as_corp_withdrawals = self.as_corp_activity.CORPFromTransactions
 
-    def store_transfer_from_corp_wallet(self, time_utc, author, destination, amount_atomic, amount, currency):
+    async def store_transfer_from_corp_wallet(self, time_utc, author, destination, amount_atomic, amount, currency):
         """
         Stores to history when transactions is done from corp wallet to certain user
         :param time_utc: utc unix timestamp
@@ -40,7 +41,7 @@ class CorporateHistoryManager:
         }
 
         try:
-            self.corp_withdrawals.insert_one(data)
+            await self.as_corp_withdrawals.insert_one(data)
             return True
         except errors.PyMongoError as e:
             print(e)
@@ -0,0 +1,61 @@
+"""
+Network fee oracle serving base fee for transactions from memory
+"""
+
+import os
+import sys
+
+from colorama import Fore, init
+
+project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_path)
+
+init(autoreset=True)
+
+CONST_MIN_BASE_FEE = 100  # Stroops, network minimum used until fee stats are obtained
+CONST_FEE_PERCENTILE = 'p70'  # Percentile of max fees bid in recent ledgers used under congestion
+CONST_CONGESTION_THRESHOLD = 0.5  # Ledger capacity usage above which network is considered congested
+CONST_MAX_BASE_FEE = 10000  # Stroops, upper limit of fee per operation paid by the bot
+
+
+class FeeOracle:
+    """
+    Base fee per operation derived from Horizon fee stats polled in the background. Network base fee is used while
+    ledgers have spare capacity, percentile of max fees bid in recent ledgers once they fill up, so transactions get
+    included on first try during surges. Under surge pricing all transactions in ledger are charged the same clearing
+    fee, so fees charged only tell the price at the margin while max fee bids tell what it takes to get ahead of it.
+    """
+
+    def __init__(self, as_server, fee_settings: dict = None):
+        fee_settings = fee_settings or {}
+        self.as_server = as_server
+        self.percentile = fee_settings.get("percentile", CONST_FEE_PERCENTILE)
+        self.congestion_threshold = float(fee_settings.get("congestionThreshold", CONST_CONGESTION_THRESHOLD))
+        self.max_fee = int(fee_settings.get("maxFee", CONST_MAX_BASE_FEE))
+        self.base_fee = CONST_MIN_BASE_FEE
+        self.congested = False
+
+    def get_base_fee(self):
+        """
+        Base fee per operation in stroops
+        """
+        return self.base_fee
+
+    async def refresh(self):
+        """
+        Obtain fee stats and recalculate base fee. Last known fee is kept on failure
+        """
+        try:
+            stats = await self.as_server.fee_stats().call()
+        except Exception as e:
+            print(Fore.RED + f'Could not obtain fee stats from Horizon: {e}')
+            return False
+
+        network_fee = int(stats["last_ledger_base_fee"])
+        self.congested = float(stats["ledger_capacity_usage"]) > self.congestion_threshold
+        if self.congested:
+            fee = max(network_fee, int(stats["max_fee"][self.percentile]))
+        else:
+            fee = network_fee
+        self.base_fee = min(fee, max(self.max_fee, network_fee))
+        return True
@@ -13,27 +13,81 @@ class GuildProfileManager:
 
     def __init__(self, connection, as_connection):
         self.connection = connection
-        self.cl_db_access = self.connection['CryptoLink']
-        self.guild_profiles = self.cl_db_access.guildProfiles
-
         self.as_connection = as_connection
         self.as_cl_db_access = self.as_connection['CryptoLink']
         self.as_guild_profiles = self.as_cl_db_access.guildProfiles  # Connection to user profiles
         self.as_stellar_community_wallets = self.as_cl_db_access.StellarCommunityWallets
 
-    def check_guild_registration_stats(self, guild_id: int):
-        result = list(self.guild_profiles.find({"guildId": guild_id}))
+        # Registry of explorer feed channels per guild, kept in memory so fan out does not scan guild profiles
+        self.explorer_channels = {}  # guildId --> channelId
+        self.explorer_digests = {}  # guildId --> digest interval in seconds, 0 streams messages as they come
+        self.explorer_channels_loaded = False
+
+    async def check_guild_registration_stats(self, guild_id: int):
+        result = await self.as_guild_profiles.find({"guildId": guild_id}).to_list(length=None)
         return result
 
     async def register_guild(self, guild_data: dict):
-        result = self.as_guild_profiles.insert_one(guild_data)
+        result = await self.as_guild_profiles.insert_one(guild_data)
         return result
 
-    def get_all_explorer_applied_channels(self):
-        result = [guild["explorerSettings"]["channelId"] for guild in
-                  self.guild_profiles.find({}, {"_id": 0, "explorerSettings.channelId": 1}) if
-                  guild["explorerSettings"]["channelId"] > 0]
-        return result
+    async def load_explorer_channels(self):
+        """
+        Load explorer feed channels of all guilds into registry
+        """
+        channels = {}
+        digests = {}
+        async for guild in self.as_guild_profiles.find({}, {"_id": 0, "guildId": 1, "explorerSettings": 1}):
+            if guild["explorerSettings"]["channelId"] > 0:
+                channels[guild["guildId"]] = guild["explorerSettings"]["channelId"]
+            if guild["explorerSettings"].get("digestInterval", 0) > 0:
+                digests[guild["guildId"]] = guild["explorerSettings"]["digestInterval"]
+        self.explorer_channels = channels
+        self.explorer_digests = digests
+        self.explorer_channels_loaded = True
+        return channels
+
+    def set_explorer_channel(self, guild_id: int, channel_id: int):
+        """
+        Update registry of explorer feed channels. Channel id 0 removes the guild from the feed
+        """
+        if channel_id > 0:
+            self.explorer_channels[guild_id] = channel_id
+        else:
+            self.explorer_channels.pop(guild_id, None)
+
+    def set_explorer_digest(self, guild_id: int, interval: int):
+        """
+        Update registry of explorer digest intervals. Interval 0 turns digest mode off
+        """
+        if interval > 0:
+            self.explorer_digests[guild_id] = interval
+        else:
+            self.explorer_digests.pop(guild_id, None)
+
+    async def get_explorer_feed(self):
+        """
+        Get explorer applied channels with their digest intervals
+        :return: dictionary of channelId --> digest interval in seconds
+        """
+        if not self.explorer_channels_loaded:
+            await self.load_explorer_channels()
+        return {chn: self.explorer_digests.get(guild_id, 0) for guild_id, chn in self.explorer_channels.items()}
+
+    async def remove_explorer_channel(self, channel_id: int):
+        """
+        Remove channel from explorer feed of every guild which has it applied
+        """
+        guild_ids = [guild_id for guild_id, chn in self.explorer_channels.items() if chn == channel_id]
+        for guild_id in guild_ids:
+            if not await self.update_guild_profile(guild_id=guild_id,
+                                                   data_to_update={"explorerSettings.channelId": int(0)}):
+                self.set_explorer_channel(guild_id=guild_id, channel_id=0)
+
+    async def get_all_explorer_applied_channels(self):
+        if not self.explorer_channels_loaded:
+            await self.load_explorer_channels()
+        return list(self.explorer_channels.values())
 
     async def get_guild_stats(self, guild_id: int):
         stats = await self.as_guild_profiles.find_one({"guildId": guild_id},
@@ -49,6 +103,10 @@ class GuildProfileManager:
     async def update_guild_profile(self, guild_id, data_to_update: dict):
         result = await self.as_guild_profiles.update_one({"guildId": guild_id},
                                                          {"$set": data_to_update})
+        if result.matched_count > 0 and "explorerSettings.channelId" in data_to_update:
+            self.set_explorer_channel(guild_id=guild_id, channel_id=int(data_to_update["explorerSettings.channelId"]))
+        if result.matched_count > 0 and "explorerSettings.digestInterval" in data_to_update:
+            self.set_explorer_digest(guild_id=guild_id, interval=int(data_to_update["explorerSettings.digestInterval"]))
         return result.matched_count > 0
 
     async def get_service_statuses(self, guild_id: int):
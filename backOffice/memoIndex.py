@@ -0,0 +1,98 @@
+"""
+In memory index of deposit memos used to route incoming deposits without querying database
+"""
+
+import os
+import sys
+
+from colorama import Fore, init
+
+project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_path)
+
+init(autoreset=True)
+
+
+class MemoIndex:
+    """
+    Process wide deposit memo --> Discord user id index. Loaded once at startup and kept current by change stream
+    on userWallets collection or by registration hook when change streams are not available.
+    """
+
+    def __init__(self, as_connection):
+        self.as_connection = as_connection
+        self.as_user_wallets = self.as_connection['CryptoLink'].userWallets
+
+        self.memos = {}  # depositId --> userId
+        self.documents = {}  # document _id --> depositId, required to resolve deletions
+        self.loaded = False  # True once all memos have been loaded
+        self.live = False  # True while change stream is following the collection
+
+    async def load(self):
+        """
+        Load all registered memos into memory
+        """
+        memos = {}
+        documents = {}
+        async for wallet in self.as_user_wallets.find({}, {"_id": 1, "depositId": 1, "userId": 1}):
+            memos[wallet["depositId"]] = int(wallet["userId"])
+            documents[wallet["_id"]] = wallet["depositId"]
+        self.memos = memos
+        self.documents = documents
+        self.loaded = True
+        print(Fore.GREEN + f'Memo index loaded with {len(self.memos)} memos')
+
+    def add(self, memo: str, user_id: int, document_id=None):
+        """
+        Add memo to the index
+        """
+        self.memos[memo] = int(user_id)
+        if document_id is not None:
+            self.documents[document_id] = memo
+
+    def remove(self, document_id):
+        """
+        Remove memo from index based on the document id
+        """
+        memo = self.documents.pop(document_id, None)
+        if memo:
+            self.memos.pop(memo, None)
+
+    def resolve(self, memos: list) -> dict:
+        """
+        Resolve memos to owners from memory
+        :param memos: list of deposit ids
+        :return: dictionary of memo --> Discord user id for memos present in index
+        """
+        return {memo: self.memos[memo] for memo in memos if memo in self.memos}
+
+    def apply(self, change: dict):
+        """
+        Apply change stream event to the index
+        """
+        if change["operationType"] == "delete":
+            self.remove(document_id=change["documentKey"]["_id"])
+        else:
+            wallet = change["fullDocument"]
+            self.add(memo=wallet["depositId"], user_id=wallet["userId"], document_id=wallet["_id"])
+
+    async def watch(self):
+        """
+        Follow userWallets change stream and apply inserts, replacements and deletions to the index. Motor opens the
+        stream on first fetch, so stream is opened with try_next before index is loaded and no registration done
+        between the snapshot and the stream slips through. Returns once the stream gets closed and raises
+        OperationFailure if server does not support change streams (stand alone deployment).
+        """
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "replace", "delete"]}}}]
+        try:
+            async with self.as_user_wallets.watch(pipeline=pipeline) as stream:
+                first_change = await stream.try_next()
+                await self.load()
+                self.live = True
+                print(Fore.GREEN + 'Memo index following userWallets change stream')
+                if first_change is not None:
+                    self.apply(change=first_change)
+                async for change in stream:
+                    self.apply(change=change)
+        finally:
+            self.live = False
@@ -13,13 +13,16 @@ class AccountManager(object):
     Class handling discord user accounts
     """
 
-    def __init__(self, connection):
+    def __init__(self, connection, as_connection, memo_index=None, registration_cache=None):
         # main db connection
         self.connection = connection
+        self.as_connection = as_connection
+        self.memo_index = memo_index  # In memory deposit memo index to be updated on registration
+        self.registration_cache = registration_cache  # Cache of registration statuses for command checks
         # Database of bot users
-        self.cl_connection = self.connection['CryptoLink']
-        self.user_profiles = self.cl_connection.userProfiles
-        self.user_wallets = self.cl_connection.userWallets
+        self.as_cl_connection = self.as_connection['CryptoLink']
+        self.as_user_profiles = self.as_cl_connection.userProfiles
+        self.as_user_wallets = self.as_cl_connection.userWallets
 
     @staticmethod
     def generate_user_memo():
@@ -32,7 +35,7 @@ class AccountManager(object):
         memo = random_string.upper().lower()[0:string_length]
         return str(memo)
 
-    def __create_user_wallet(self, discord_id: int, discord_username: str, deposit_id):
+    async def __create_user_wallet(self, discord_id: int, discord_username: str, deposit_id):
         """
         Creates stellar wallet for the user
         :param discord_id:
@@ -48,54 +51,22 @@ class AccountManager(object):
             "clt": int(0)
         }
 
-        result = self.user_wallets.insert_one(create_multi_wallet)
+        result = await self.as_user_wallets.insert_one(create_multi_wallet)
 
         if result.inserted_id:
             return True
         else:
             return False
 
-    def update_user_wallet_balance(self, discord_id: int, ticker: str, direction: int, amount: int):
-        """
-        Updating the user wallet balance used with merchant system
-        """
-        if direction != 0:
-            amount = amount * (-1)
-
-        try:
-            self.user_wallets.update_one({"userId": int(discord_id)},
-                                         {"$inc": {f"{ticker}": amount}})
-            return True
-        except errors.PyMongoError as e:
-            print(f' Could not update user wallet with xlm: {e}')
-            return False
-
-    def get_account_stats(self, discord_id: int):
-        """Get basic account details from user"""
-        result = self.user_profiles.find_one({"userId": discord_id},
-                                             {"_id": 0,
-                                              "xlm": 1,
-                                              "clt": 1,
-                                              "bridges": 1})
-
-        return result
-
-    def register_user(self, discord_id: int, discord_username: str):
+    @staticmethod
+    def build_user_profile(discord_id: int, discord_username: str, deposit_id: str):
         """
-        Registers user into the system
-        :param discord_id: Discord Unique ID
-        :param discord_username: Discord Current username
-        :return: bool
-
+        Profile with zeroed stats for newly registered user
         """
-        stellar_deposit_id = self.generate_user_memo()
-
-        self.__create_user_wallet(discord_id=discord_id, discord_username=discord_username,
-                                  deposit_id=stellar_deposit_id)
-        new_user_stats = {
+        return {
             "userId": discord_id,
             "userName": discord_username,
-            "stellarDepositId": stellar_deposit_id,
+            "stellarDepositId": deposit_id,
             "bridges": int(0),
             "xlm": {"depositsCount": int(0),
                     "totalDeposited": float(0.0),
@@ -118,44 +89,166 @@ class AccountManager(object):
                     }
         }
 
+    async def update_user_wallet_balance(self, discord_id: int, ticker: str, direction: int, amount: int):
+        """
+        Updating the user wallet balance used with merchant system
+        """
+        if direction != 0:
+            amount = amount * (-1)
+
         try:
-            self.user_profiles.insert_one(new_user_stats)
+            await self.as_user_wallets.update_one({"userId": int(discord_id)},
+                                                  {"$inc": {f"{ticker}": amount}})
+            return True
+        except errors.PyMongoError as e:
+            print(f' Could not update user wallet with xlm: {e}')
+            return False
+
+    async def get_account_stats(self, discord_id: int):
+        """Get basic account details from user"""
+        result = await self.as_user_profiles.find_one({"userId": discord_id},
+                                                      {"_id": 0,
+                                                       "xlm": 1,
+                                                       "clt": 1,
+                                                       "bridges": 1})
+
+        return result
+
+    async def register_user(self, discord_id: int, discord_username: str):
+        """
+        Registers user into the system
+        :param discord_id: Discord Unique ID
+        :param discord_username: Discord Current username
+        :return: bool
+
+        """
+        stellar_deposit_id = self.generate_user_memo()
+
+        try:
+            wallet_created = await self.__create_user_wallet(discord_id=discord_id, discord_username=discord_username,
+                                                             deposit_id=stellar_deposit_id)
+        except errors.DuplicateKeyError:
+            # Wallet has been created by concurrent registration
+            if self.registration_cache:
+                self.registration_cache.set(kind='account', key=discord_id, registered=True)
+            return True
+
+        if wallet_created:
+            if self.registration_cache:
+                self.registration_cache.set(kind='account', key=discord_id, registered=True)
+            if self.memo_index:
+                # Registration hook keeps memo index current when change stream is not following wallets
+                self.memo_index.add(memo=stellar_deposit_id, user_id=discord_id)
+        new_user_stats = self.build_user_profile(discord_id=discord_id, discord_username=discord_username,
+                                                 deposit_id=stellar_deposit_id)
+
+        try:
+            await self.as_user_profiles.insert_one(new_user_stats)
             return True
         except errors.PyMongoError:
             return False
 
-    def check_user_existence(self, user_id: int):
+    async def register_users(self, users: list):
+        """
+        Registers multiple users with one insert per collection. Wallets rejected by database are skipped.
+        :param users: list of tuples (Discord Unique ID, Discord Current username)
+        :return: list of Discord ids registered in this call
+        """
+        wallets = []
+        profiles = []
+        for discord_id, discord_username in users:
+            deposit_id = self.generate_user_memo()
+            wallets.append({
+                "userId": discord_id,
+                "userName": discord_username,
+                "depositId": deposit_id,
+                "xlm": int(0),
+                "clt": int(0)
+            })
+            profiles.append(self.build_user_profile(discord_id=discord_id, discord_username=discord_username,
+                                                    deposit_id=deposit_id))
+        if not wallets:
+            return []
+
+        registered = [wallet["userId"] for wallet in wallets]
+        try:
+            await self.as_user_wallets.insert_many(wallets, ordered=False)
+        except errors.BulkWriteError as e:
+            failed = {wallets[error["index"]]["userId"] for error in e.details["writeErrors"]}
+            registered = [user_id for user_id in registered if user_id not in failed]
+            wallets = [wallet for wallet in wallets if wallet["userId"] not in failed]
+            profiles = [profile for profile in profiles if profile["userId"] not in failed]
+
+        if self.registration_cache:
+            for discord_id in registered:
+                self.registration_cache.set(kind='account', key=discord_id, registered=True)
+
+        if self.memo_index:
+            for wallet in wallets:
+                self.memo_index.add(memo=wallet["depositId"], user_id=wallet["userId"])
+
+        try:
+            if profiles:
+                await self.as_user_profiles.insert_many(profiles, ordered=False)
+        except errors.PyMongoError as e:
+            print(f'Profiles of bulk registered users could not be stored: {e}')
+        return registered
+
+    async def get_registered_users(self, user_ids: list):
+        """
+        Check which of the users are registered with one query
+        :param user_ids: list of Discord ids
+        :return: set of registered Discord ids
         """
-        Checks if the user is already registered into the system
+        registered = set()
+        async for wallet in self.as_user_wallets.find({"userId": {"$in": list(user_ids)}}, {"_id": 0, "userId": 1}):
+            registered.add(int(wallet["userId"]))
+        return registered
+
+    async def check_user_existence(self, user_id: int):
+        """
+        Checks if the user is already registered into the system. User is registered once wallet exists, same as in
+        get_registered_users.
         :param user_id: Discord unique ID
         :return: bool
         """
 
-        result = self.user_profiles.find_one({"userId": user_id})
+        if self.registration_cache:
+            cached = self.registration_cache.get(kind='account', key=user_id)
+            if cached is not None:
+                return cached
+            # Taken before database read so status changed meanwhile is not cached
+            generation = self.registration_cache.generation(kind='account', key=user_id)
+
+        result = await self.as_user_wallets.find_one({"userId": user_id}, {"_id": 1})
+
+        if self.registration_cache:
+            self.registration_cache.set(kind='account', key=user_id, registered=bool(result),
+                                        generation=generation)
 
         if result:
             return True
         else:
             return False
 
-    def count_registrations(self):
-        result = self.user_profiles.count_documents({})
+    async def count_registrations(self):
+        result = await self.as_user_profiles.count_documents({})
         return result
 
-    def get_user_memo(self, user_id: int):
+    async def get_user_memo(self, user_id: int):
         """
         Gets whole user profile data based on the ID
         :param user_id: Unique Discord ID
         :return: dictionary of data
         """
-        result = self.user_profiles.find_one({"userId": user_id},
-                                             {"_id": 0,
-                                              "stellarDepositId": 1})
+        result = await self.as_user_profiles.find_one({"userId": user_id},
+                                                      {"_id": 0,
+                                                       "stellarDepositId": 1})
 
         return result
 
-    def get_balance_based_on_ticker(self, user_id, ticker):
-        balance = self.user_wallets.find_one({"userId": int(user_id)},
-                                             {"_id": 0,
-                                              f"{ticker}": 1})
+    async def get_balance_based_on_ticker(self, user_id, ticker):
+        balance = await self.as_user_wallets.find_one({"userId": int(user_id)},
+                                                      {"_id": 0,
+                                                       f"{ticker}": 1})
         return balance[f'{ticker}']
@@ -0,0 +1,84 @@
+"""
+In memory cache of registration statuses used by command checks
+"""
+
+import os
+import sys
+import time
+
+project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_path)
+
+CONST_NEGATIVE_TTL = 30  # Seconds for which missing registration is remembered
+
+
+class RegistrationCache:
+    """
+    Registration status per kind of registration (account, second and third level wallet, merchant community) and id.
+    Registrations are remembered for the lifetime of the process, missing registrations only for short time so
+    registrations done by other processes are picked up. Managers set entries when they register and invalidate them
+    when they remove. Every such change moves generation of the entry, so status read from database by lookup started
+    before the change is not cached.
+    """
+
+    def __init__(self, negative_ttl: int = CONST_NEGATIVE_TTL):
+        self.negative_ttl = negative_ttl
+        self.registered = set()  # (kind, id) of registered entries
+        self.missing = {}  # (kind, id) --> time after which missing entry expires
+        self.generations = {}  # (kind, id) --> number of registration changes of the entry
+
+    def get(self, kind: str, key: int):
+        """
+        Get cached registration status
+        :param kind: kind of registration
+        :param key: Discord user or community id
+        :return: True if registered, False if recently not registered, None if unknown
+        """
+        entry = (kind, int(key))
+        if entry in self.registered:
+            return True
+
+        expires = self.missing.get(entry)
+        if expires is not None:
+            if expires > time.monotonic():
+                return False
+            self.missing.pop(entry, None)
+        return None
+
+    def generation(self, kind: str, key: int):
+        """
+        Generation of the entry, taken by lookup before registration status is read from database
+        """
+        return self.generations.get((kind, int(key)), 0)
+
+    def set(self, kind: str, key: int, registered: bool, generation: int = None):
+        """
+        Store registration status
+        :param kind: kind of registration
+        :param key: Discord user or community id
+        :param registered: registration status
+        :param generation: generation taken before status has been read from database, None when status is set by
+        registration itself
+        """
+        entry = (kind, int(key))
+        if generation is None:
+            self.generations[entry] = self.generation(kind=kind, key=key) + 1
+        elif generation != self.generation(kind=kind, key=key):
+            # Registered or removed while status was read from database
+            return
+
+        if registered:
+            self.missing.pop(entry, None)
+            self.registered.add(entry)
+        else:
+            self.registered.discard(entry)
+            self.missing[entry] = time.monotonic() + self.negative_ttl
+
+    def invalidate(self, kind: str, key: int):
+        """
+        Forget registration status so next check goes to database
+        """
+        entry = (kind, int(key))
+        self.generations[entry] = self.generation(kind=kind, key=key) + 1
+        self.registered.discard(entry)
+        self.missing.pop(entry, None)
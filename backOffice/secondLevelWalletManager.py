@@ -8,59 +8,75 @@ sys.path.append(project_path)
 class SecondLevelWalletManager:
     """Class dealing with the Layer two wallets"""
 
-    def __init__(self, connection):
+    def __init__(self, connection, as_connection, registration_cache=None):
         """Connection to Database and Crypto Link collections"""
         self.connection = connection
-        self.bot_stuff = self.connection['CryptoLink']
-        self.hot_wallets = self.bot_stuff.userHotWallets
+        self.as_connection = as_connection
+        self.registration_cache = registration_cache  # Cache of registration statuses for command checks
+        self.as_bot_stuff = self.as_connection['CryptoLink']
+        self.as_hot_wallets = self.as_bot_stuff.userHotWallets
 
-    def second_level_user_reg_status(self, user_id: int):
+    async def second_level_user_reg_status(self, user_id: int):
         """
         Check user registration status
         """
-        data = self.hot_wallets.find_one({"userId": int(user_id)})
+        if self.registration_cache:
+            cached = self.registration_cache.get(kind='secondLevel', key=user_id)
+            if cached is not None:
+                return cached
+            # Taken before database read so status changed meanwhile is not cached
+            generation = self.registration_cache.generation(kind='secondLevel', key=user_id)
+
+        data = await self.as_hot_wallets.find_one({"userId": int(user_id)}, {"_id": 1})
+
+        if self.registration_cache:
+            self.registration_cache.set(kind='secondLevel', key=user_id, registered=bool(data),
+                                        generation=generation)
+
         if data:
             return True
         else:
             return False
 
-    def create_user_wallet(self, data_to_store: dict):
+    async def create_user_wallet(self, data_to_store: dict):
         """
         Creates the user hot wallet into the database. Decryption happens in COGS
         """
-        result = self.hot_wallets.insert_one(data_to_store)
+        result = await self.as_hot_wallets.insert_one(data_to_store)
+        if self.registration_cache and result.inserted_id:
+            self.registration_cache.set(kind='secondLevel', key=data_to_store["userId"], registered=True)
 
         if result.inserted_id:
             return True
         else:
             return False
 
-    def get_account_details(self, user_id: int):
+    async def get_account_details(self, user_id: int):
         """
         Get user hot wallet details for decription in cogs
         """
-        data = self.hot_wallets.find_one({"userId": int(user_id)},
-                                         {"_id": 0})
+        data = await self.as_hot_wallets.find_one({"userId": int(user_id)},
+                                                  {"_id": 0})
         if data:
             return data
         else:
             return {}
 
-    def get_custodial_hot_wallet_addr(self, user_id: int):
+    async def get_custodial_hot_wallet_addr(self, user_id: int):
         """
         Get user hot wallet details for decription in cogs
         """
-        data = self.hot_wallets.find_one({"userId": int(user_id)},
-                                         {"_id": 0,
-                                         "publicAddress": 1})
+        data = await self.as_hot_wallets.find_one({"userId": int(user_id)},
+                                                  {"_id": 0,
+                                                  "publicAddress": 1})
         if data:
             return data["publicAddress"]
         else:
             return {}
 
-    def get_private_key(self, user_id):
-        data = self.hot_wallets.find_one({"userId": int(user_id)},
-                                         {"_id": 0,
-                                         "privateKey": 1,
-                                         "publicAddress": 1})
+    async def get_private_key(self, user_id):
+        data = await self.as_hot_wallets.find_one({"userId": int(user_id)},
+                                                  {"_id": 0,
+                                                  "privateKey": 1,
+                                                  "publicAddress": 1})
         return data
@@ -0,0 +1,62 @@
+"""
+Local sequence number source for accounts submitting transactions
+"""
+
+import asyncio
+import os
+import sys
+
+from colorama import Fore, init
+
+project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_path)
+
+from stellar_sdk import Account
+
+init(autoreset=True)
+
+CONST_BAD_SEQUENCE = 'tx_bad_seq'  # Horizon transaction result code of stale sequence number
+
+
+class SequenceManager:
+    """
+    Holds sequence number of the account in memory. Account is loaded from Horizon only on first use and after
+    resync, every transaction gets next sequence number under lock so concurrent submissions never share one.
+    """
+
+    def __init__(self, as_server, account_id: str):
+        self.as_server = as_server
+        self.account_id = account_id
+        self.sequence = None  # Last sequence number handed out, None when it needs to be loaded
+        self.lock = None  # Created lazily so it binds to the running loop
+
+    async def next_account(self):
+        """
+        Source account for new transaction. Transaction builder increments sequence of returned account once when
+        transaction is built, so each caller gets its own account object with reserved sequence.
+        :return: stellar_sdk Account
+        """
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+
+        async with self.lock:
+            if self.sequence is None:
+                account = await self.as_server.load_account(self.account_id)
+                self.sequence = account.sequence
+                print(Fore.LIGHTBLUE_EX + f'Sequence of {self.account_id} loaded at {self.sequence}')
+            account = Account(account_id=self.account_id, sequence=self.sequence)
+            self.sequence += 1
+            return account
+
+    def resync(self):
+        """
+        Drop local sequence so it is loaded from Horizon with next transaction
+        """
+        self.sequence = None
+
+    @staticmethod
+    def is_bad_sequence(result_codes: dict):
+        """
+        Check if transaction has been rejected due to stale sequence number
+        """
+        return result_codes.get('transaction') == CONST_BAD_SEQUENCE
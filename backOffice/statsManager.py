@@ -2,14 +2,19 @@
 Script to handle statistics of the bot
 """
 
+import asyncio
+import json
 import os
 import sys
-from pymongo import errors, DESCENDING
+from pymongo import errors, DESCENDING, UpdateOne
 
 project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_path)
 
 CONST_INC = '$inc'
+CONST_STATS_FLUSH_INTERVAL = 5  # Seconds between flushes of aggregated global stats
+CONST_STATS_JOURNAL = 'statsJournal.jsonl'  # Local journal of global stats deltas not yet flushed
+CONST_JOURNAL_SYNC_INTERVAL = 1  # Seconds deltas are collected before they are appended to journal together
 
 
 class StatsManager(object):
@@ -17,16 +22,11 @@ class StatsManager(object):
     Class handling Crypto Link statistics
     """
 
-    def __init__(self, connection, as_connectin):
+    def __init__(self, connection, as_connectin, stats_settings: dict = None):
         # main db connection
         self.connection = connection
         self.as_connection = as_connectin
-
-        # Database of bot users
-        self.cl_connection = self.connection['CryptoLink']
-        self.user_profiles = self.cl_connection.userProfiles
-        self.chain_activities = self.cl_connection.CLOnChainStats
-        self.off_chain_activities = self.cl_connection.CLOffChainStats
+        stats_settings = stats_settings or {}
 
         # Async support
         self.as_cl_connection = self.as_connection['CryptoLink']
@@ -36,6 +36,175 @@ class StatsManager(object):
         self.as_cl_guild_profiles = self.as_cl_connection.guildProfiles
         self.as_cl_earnings = self.as_cl_connection.CLEarning
         self.as_user_wallets = self.as_cl_connection.userWallets
+        self.as_community_wallets = self.as_cl_connection.StellarCommunityWallets
+
+        # Write behind aggregation of global stats documents which are written by every activity
+        self.flush_interval = int(stats_settings.get("flushInterval", CONST_STATS_FLUSH_INTERVAL))
+        self.journal = f'{project_path}/{CONST_STATS_JOURNAL}' if stats_settings.get("journal", False) else None
+        self.pending_global = {"offChain": {}, "onChain": {}}  # stats kind --> ticker --> field --> delta
+        self.journal_buffer = []  # Journal lines of deltas not yet appended to journal
+        self.journal_sync = None  # Task appending buffered lines to journal
+        self.journal_lock = None  # Serializes journal file writes, created lazily so it binds to the running loop
+        self.flush_lock = None  # Serializes flushes of global stats
+        self.replay_journal()
+
+    def __global_collection(self, kind: str, sync: bool = False):
+        """
+        Collection of global stats for kind of stats
+        """
+        name = "CLOffChainStats" if kind == "offChain" else "CLOnChainStats"
+        if sync:
+            return self.connection['CryptoLink'][name]
+        return self.as_cl_connection[name]
+
+    def __merge_global(self, pending: dict):
+        """
+        Add deltas into pending global stats
+        """
+        for kind, tickers in pending.items():
+            for ticker, deltas in tickers.items():
+                fields = self.pending_global[kind].setdefault(ticker, {})
+                for field, delta in deltas.items():
+                    fields[field] = fields.get(field, 0) + delta
+
+    def __write_journal(self, lines: list, mode: str = 'a'):
+        """
+        Write lines to local journal and sync it to disk. Blocking, runs in executor while event loop is running
+        """
+        with open(self.journal, mode) as journal:
+            journal.writelines(lines)
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    async def __sync_journal(self):
+        """
+        Append deltas collected during sync interval to journal with single write off the event loop
+        """
+        await asyncio.sleep(CONST_JOURNAL_SYNC_INTERVAL)
+        if self.journal_lock is None:
+            self.journal_lock = asyncio.Lock()
+        async with self.journal_lock:
+            lines = self.journal_buffer
+            self.journal_buffer = []
+            if lines:
+                await asyncio.get_event_loop().run_in_executor(None, self.__write_journal, lines)
+
+    def replay_journal(self):
+        """
+        Load deltas which have not been flushed before last shutdown
+        """
+        if not self.journal or not os.path.exists(self.journal):
+            return
+        with open(self.journal) as journal:
+            for line in journal:
+                if line.strip():
+                    self.__merge_global(pending=json.loads(line))
+
+    def aggregate_global_stats(self, kind: str, ticker: str, stats: dict):
+        """
+        Accumulate increments of global stats in memory until next flush
+        :param kind: offChain or onChain
+        :param ticker: ticker of global stats document
+        :param stats: field --> increment
+        """
+        entry = {kind: {ticker: stats}}
+        if self.journal:
+            self.journal_buffer.append(json.dumps(entry) + '\n')
+            if self.journal_sync is None or self.journal_sync.done():
+                self.journal_sync = asyncio.get_event_loop().create_task(self.__sync_journal())
+        self.__merge_global(pending=entry)
+
+    def __take_pending_global(self):
+        pending = self.pending_global
+        self.pending_global = {"offChain": {}, "onChain": {}}
+        return pending
+
+    @staticmethod
+    def __global_ops(tickers: dict):
+        """
+        Update operation per ticker of aggregated global stats, in order of tickers
+        """
+        return [UpdateOne({"ticker": ticker}, {f"{CONST_INC}": deltas}) for ticker, deltas in tickers.items()]
+
+    @staticmethod
+    def __unapplied(tickers: dict, error: Exception):
+        """
+        Deltas of tickers not written by failed bulk write. Unordered bulk write reports operations which failed while
+        others are applied, on any other error it is unknown what has been written so all deltas are kept.
+        """
+        if isinstance(error, errors.BulkWriteError):
+            failed = {write_error["index"] for write_error in error.details.get("writeErrors", [])}
+            return {ticker: deltas for index, (ticker, deltas) in enumerate(tickers.items()) if index in failed}
+        return tickers
+
+    async def flush_global_stats(self):
+        """
+        Write aggregated global stats with one bulk write per collection. Deltas which have not been written are kept
+        for next flush on failure. Flushes requested by scheduler and by stats command run one after another.
+        """
+        if self.flush_lock is None:
+            self.flush_lock = asyncio.Lock()
+
+        async with self.flush_lock:
+            pending = self.__take_pending_global()
+            kinds = [kind for kind, tickers in pending.items() if tickers]
+            if not kinds:
+                return True
+
+            results = await asyncio.gather(*[self.__global_collection(kind=kind).bulk_write(
+                self.__global_ops(tickers=pending[kind]), ordered=False) for kind in kinds], return_exceptions=True)
+
+            unapplied = {}
+            for kind, result in zip(kinds, results):
+                if isinstance(result, Exception):
+                    print(f'Global {kind} stats could not be flushed: {result}')
+                    unapplied[kind] = self.__unapplied(tickers=pending[kind], error=result)
+
+            self.__merge_global(pending=unapplied)
+            await self.__rewrite_journal()
+            return not unapplied
+
+    def flush_global_stats_sync(self):
+        """
+        Flush aggregated global stats with blocking client, used on shutdown once event loop is closed
+        """
+        pending = self.__take_pending_global()
+        unapplied = {}
+        for kind, tickers in pending.items():
+            if not tickers:
+                continue
+            try:
+                self.__global_collection(kind=kind, sync=True).bulk_write(self.__global_ops(tickers=tickers),
+                                                                          ordered=False)
+            except errors.PyMongoError as e:
+                print(f'Global {kind} stats could not be flushed on shutdown: {e}')
+                unapplied[kind] = self.__unapplied(tickers=tickers, error=e)
+
+        self.__merge_global(pending=unapplied)
+        if self.journal:
+            self.__write_journal(lines=self.__journal_snapshot(), mode='w')
+        return not unapplied
+
+    def __journal_snapshot(self):
+        """
+        Journal content holding all deltas not yet flushed. Buffered lines are part of it, so buffer is emptied
+        """
+        self.journal_buffer = []
+        if any(self.pending_global.values()):
+            return [json.dumps(self.pending_global) + '\n']
+        return []
+
+    async def __rewrite_journal(self):
+        """
+        Leave only deltas not yet flushed in the journal, written off the event loop
+        """
+        if not self.journal:
+            return
+        if self.journal_lock is None:
+            self.journal_lock = asyncio.Lock()
+        async with self.journal_lock:
+            lines = self.__journal_snapshot()
+            await asyncio.get_event_loop().run_in_executor(None, self.__write_journal, lines, 'w')
 
     async def create_bridge(self, user_id: int):
         """
@@ -66,29 +235,21 @@ class StatsManager(object):
             return False
 
     async def update_cl_merchant_stats(self, ticker: str, merchant_stats: dict, ticker_stats: dict):
-        await self.as_cl_off_chain_stats.update_one({"ticker": ticker},
-                                                    {f"{CONST_INC}": ticker_stats})
-
-        await self.as_cl_off_chain_stats.update_one({"ticker": "merchant"},
-                                                    {f"{CONST_INC}": merchant_stats})
+        self.aggregate_global_stats(kind="offChain", ticker=ticker, stats=ticker_stats)
+        self.aggregate_global_stats(kind="offChain", ticker="merchant", stats=merchant_stats)
 
     async def update_cl_off_chain_stats(self, ticker: str, ticker_stats: dict):
         """
-        Updating crypto link transaction stats
+        Updating crypto link transaction stats. Written on next flush of global stats
         """
-        await self.as_cl_off_chain_stats.update_one({"ticker": ticker},
-                                                    {f"{CONST_INC}": ticker_stats})
+        self.aggregate_global_stats(kind="offChain", ticker=ticker, stats=ticker_stats)
 
     async def update_cl_on_chain_stats(self, ticker: str, stat_details: dict):
         """
-        Update stats when on chain activity happens.
+        Update stats when on chain activity happens. Written on next flush of global stats
         """
-        try:
-            result = await self.as_on_chain_activities.update_one({"ticker": ticker},
-                                                                  {f"$inc": stat_details})
-            return result.matched_count > 0
-        except errors.PyMongoError:
-            return False
+        self.aggregate_global_stats(kind="onChain", ticker=ticker, stats=stat_details)
+        return True
 
     async def update_user_on_chain_stats(self, user_id: int, stats_data: dict):
         """
@@ -114,26 +275,55 @@ class StatsManager(object):
         await self.as_cl_guild_profiles.update_one({"guildId": guild_id},
                                                    {f"{CONST_INC}": guild_stats_data})
 
+    async def apply_stats(self, off_chain_stats: dict = None, user_stats: dict = None, guild_stats: dict = None,
+                          community_stats: dict = None):
+        """
+        Apply all increments produced by single activity with one bulk write per collection, collections are
+        written concurrently
+        :param off_chain_stats: ticker --> increments of Crypto Link off chain stats, written on next flush
+        :param user_stats: Discord user id --> increments of user profile
+        :param guild_stats: Discord guild id --> increments of guild profile
+        :param community_stats: Discord guild id --> increments of community wallet
+        :return: boolean
+        """
+        for ticker, increments in (off_chain_stats or {}).items():
+            self.aggregate_global_stats(kind="offChain", ticker=ticker, stats=increments)
+
+        targets = [(self.as_user_profiles, "userId", user_stats),
+                   (self.as_cl_guild_profiles, "guildId", guild_stats),
+                   (self.as_community_wallets, "communityId", community_stats)]
+
+        writes = [collection.bulk_write([UpdateOne({key: value}, {f"{CONST_INC}": increments})
+                                         for value, increments in stats.items()], ordered=False)
+                  for collection, key, stats in targets if stats]
+        try:
+            await asyncio.gather(*writes)
+            return True
+        except errors.PyMongoError as e:
+            print(f'Stats could not be applied: {e}')
+            return False
+
     async def update_registered_users(self, guild_id: int):
         await self.as_cl_guild_profiles.update_one({"guildId": guild_id},
                                                    {f"{CONST_INC}": {"registeredUsers": 1}})
 
-    def get_all_stats(self):
+    async def get_all_stats(self):
         """
-        Get all bot stats on request
+        Get all bot stats on request. Aggregated global stats are flushed first
         """
-        off_chain_xlm = self.off_chain_activities.find_one({"ticker": "xlm"},
-                                                           {"_id": 0})
-        on_chain_xlm = self.chain_activities.find_one({"ticker": "xlm"},
-                                                      {"_id": 0})
+        await self.flush_global_stats()
+        off_chain_xlm = await self.as_cl_off_chain_stats.find_one({"ticker": "xlm"},
+                                                                  {"_id": 0})
+        on_chain_xlm = await self.as_on_chain_activities.find_one({"ticker": "xlm"},
+                                                                  {"_id": 0})
 
         data = {"xlm": {"offChain": off_chain_xlm,
                         "onChain": on_chain_xlm}}
 
         return data
 
-    def get_top_builders(self, limit:int):
-        top_list = self.user_profiles.find({}).sort(
-            "bridges", DESCENDING).limit(limit)
+    async def get_top_builders(self, limit: int):
+        top_list = await self.as_user_profiles.find({}).sort(
+            "bridges", DESCENDING).limit(limit).to_list(length=limit)
         return top_list
 
@@ -6,11 +6,14 @@ into history
 import os
 import sys
 
-from pymongo import errors
+from pymongo import errors, UpdateOne
 
 project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_path)
 
+CONST_CREDIT_RETRIES = 5  # Attempts to store and credit batch when concurrent run stores same deposits
+CONST_NOT_REPLICA_SET = 20  # Error code returned by stand alone servers when transaction is requested
+
 
 class StellarManager:
     """
@@ -19,38 +22,120 @@ class StellarManager:
 
     def __init__(self, connection, as_connection):
         self.connection = connection
-        self.cl_connection = self.connection['CryptoLink']
         self.as_connection = as_connection
         self.as_cl_connection = self.as_connection['CryptoLink']
 
-        # Collections connections
-        self.xlm_wallets = self.cl_connection.userWallets  # Access to all stellar wallets
-        self.xlm_deposits = self.cl_connection.StellarDeposits  # Access to history of successful deposits
-        self.xlm_withdrawals = self.cl_connection.StellarWithdrawals  # Access to history of successful withdrawals
-        self.xlm_unprocessed = self.cl_connection.StellarUnprocessedDeposits  # history of successful deposits
-        self.xlm_unprocessed_withdrawals = self.cl_connection.StellarUnprocessedWithdrawals  # history of error withdrawals
-
         # Async support
+        self.as_xlm_wallets = self.as_cl_connection.userWallets  # Access to all stellar wallets
+        self.as_xlm_deposits = self.as_cl_connection.StellarDeposits  # Access to history of successful deposits
+        self.as_xlm_unprocessed = self.as_cl_connection.StellarUnprocessedDeposits  # history of unknown deposits
         self.as_xlm_withdrawals = self.as_cl_connection.StellarWithdrawals
         self.as_xlm_unprocessed_withdrawals = self.as_cl_connection.StellarUnprocessedWithdrawals
 
-    def stellar_deposit_history(self, deposit_type: int, tx_data):
+    async def stellar_deposit_history(self, deposit_type: int, tx_data):
         """
         Managing history of deposits
         :param deposit_type: Deposit based on if MEMO is found or not. 1=found , 2= not found
         :param tx_data: dictionary of data from TX to be stored on deposit
         :return:
         """
-        if deposit_type == 1:
-            result = self.xlm_deposits.insert_one(tx_data)
-        elif deposit_type == 2:
-            result = self.xlm_unprocessed.insert_one(tx_data)
+        try:
+            if deposit_type == 1:
+                result = await self.as_xlm_deposits.insert_one(tx_data)
+            elif deposit_type == 2:
+                result = await self.as_xlm_unprocessed.insert_one(tx_data)
+        except errors.DuplicateKeyError:
+            # Unique index on hash and operation makes sure same deposit is never stored (and credited) twice
+            print(f'Deposit {tx_data["hash"]} has been stored already')
+            return False
 
         if result.inserted_id:
             return True
         else:
             return False
 
+    async def store_deposits(self, deposit_type: int, deposits: list) -> list:
+        """
+        Store batch of deposits into history with single write
+        :param deposit_type: Deposit based on if MEMO is found or not. 1=found , 2= not found
+        :param deposits: list of transactions to be stored
+        :return: list of deposits which have been stored, duplicates are left out
+        """
+        if not deposits:
+            return []
+
+        collection = self.as_xlm_deposits if deposit_type == 1 else self.as_xlm_unprocessed
+        try:
+            await collection.insert_many(deposits, ordered=False)
+            return deposits
+        except errors.BulkWriteError as e:
+            # Deposits hitting the unique index have been stored already
+            failed = {err["index"] for err in e.details["writeErrors"]}
+            for err in e.details["writeErrors"]:
+                print(f'Deposit {deposits[err["index"]]["hash"]} could not be stored: {err["errmsg"]}')
+            return [tx for index, tx in enumerate(deposits) if index not in failed]
+
+    async def credit_deposits(self, deposits: list) -> list:
+        """
+        Store deposits to history and credit them to the wallets by memo in single multi document transaction.
+        Deposits already stored are skipped so batch can be retried blindly or processed by concurrent runs.
+        :param deposits: list of transactions with registered memo
+        :return: list of deposits stored and credited in this call
+        """
+        if not deposits:
+            return []
+
+        async def store_and_credit(session):
+            stored = await self.__stored_deposit_keys(collection=self.as_xlm_deposits,
+                                                      hashes=[tx["hash"] for tx in deposits], session=session)
+            fresh = [tx for tx in deposits if self.deposit_key(tx) not in stored]
+            if fresh:
+                await self.as_xlm_deposits.insert_many(fresh, session=session)
+                await self.as_xlm_wallets.bulk_write(
+                    [UpdateOne({"depositId": tx["memo"]},
+                               {"$inc": {f"{tx['asset_type']['code'].lower()}": int(tx['asset_type']["amount"])}})
+                     for tx in fresh], session=session)
+            return fresh
+
+        for attempt in range(CONST_CREDIT_RETRIES):
+            try:
+                async with await self.as_connection.start_session() as session:
+                    return await session.with_transaction(store_and_credit)
+            except (errors.DuplicateKeyError, errors.BulkWriteError):
+                # Concurrent run has stored some of the deposits in between, transaction is aborted so filter again
+                print(f'Deposit batch collided with concurrent run, retrying ({attempt + 1}/{CONST_CREDIT_RETRIES})')
+            except errors.OperationFailure as e:
+                if e.code != CONST_NOT_REPLICA_SET:
+                    raise
+                # Stand alone server, unique index on deposit still guards against double credit
+                return await self.__credit_deposits_without_transaction(deposits=deposits)
+        return []
+
+    async def __credit_deposits_without_transaction(self, deposits: list) -> list:
+        """
+        Fallback for deployments without transactions. Deposits rejected by the unique index are not credited.
+        """
+        stored = await self.store_deposits(deposit_type=1, deposits=deposits)
+        if stored:
+            await self.as_xlm_wallets.bulk_write(
+                [UpdateOne({"depositId": tx["memo"]},
+                           {"$inc": {f"{tx['asset_type']['code'].lower()}": int(tx['asset_type']["amount"])}})
+                 for tx in stored], ordered=False)
+        return stored
+
+    async def get_memo_owners(self, memos: list) -> dict:
+        """
+        Resolve deposit memos to owners with one query
+        :param memos: list of deposit ids
+        :return: dictionary of memo --> Discord user id for registered memos
+        """
+        owners = {}
+        if memos:
+            async for wallet in self.as_xlm_wallets.find({"depositId": {"$in": list(set(memos))}},
+                                                         {"_id": 0, "depositId": 1, "userId": 1}):
+                owners[wallet["depositId"]] = int(wallet["userId"])
+        return owners
+
     async def insert_to_withdrawal_hist(self, tx_type: int, tx_data: dict):
         """
         Managing history off withdrawals
@@ -69,53 +154,83 @@ class StellarManager:
         else:
             return False
 
-    def check_if_stellar_memo_exists(self, tx_memo):
+    async def check_if_stellar_memo_exists(self, tx_memo):
         """
         Check if deposit payment ID exists in the system
         :param tx_memo: Deposit payment ID for Stellar Wallet
         :return: boolean
         """
 
-        result = self.xlm_wallets.find_one({"depositId": tx_memo})
+        result = await self.as_xlm_wallets.find_one({"depositId": tx_memo})
         if result:
             return True
         else:
             return False
 
-    def check_if_deposit_hash_processed_succ_deposits(self, tx_hash):
+    @staticmethod
+    def deposit_key(tx: dict) -> tuple:
+        """
+        Unique key of the deposit as multiple payments can be part of same transaction. Deposits stored before
+        operation index has been introduced are treated as first operation.
+        """
+        return tx["hash"], tx.get("opIndex", 0)
+
+    async def __stored_deposit_keys(self, collection, hashes: list, session=None) -> set:
+        stored = set()
+        async for deposit in collection.find({"hash": {"$in": list(set(hashes))}},
+                                             {"_id": 0, "hash": 1, "opIndex": 1},
+                                             session=session):
+            stored.add(self.deposit_key(deposit))
+        return stored
+
+    async def get_processed_deposits(self, deposits: list) -> set:
+        """
+        Resolve which of the provided deposits have been stored already either as processed or unprocessed
+        deposit. One query per collection for whole batch of deposits.
+        :param deposits: list of deposits
+        :return: set of deposit keys (hash, opIndex) already present in the system
+        """
+        processed = set()
+        if deposits:
+            hashes = [tx["hash"] for tx in deposits]
+            for collection in (self.as_xlm_deposits, self.as_xlm_unprocessed):
+                processed |= await self.__stored_deposit_keys(collection=collection, hashes=hashes)
+        return processed
+
+    async def check_if_deposit_hash_processed_succ_deposits(self, tx_hash):
         """
         Function which checks if HASH has been already processed
         """
-        result = self.xlm_deposits.find_one({"hash": tx_hash})
+        result = await self.as_xlm_deposits.find_one({"hash": tx_hash})
 
         if result:
             return True
         else:
             return False
 
-    def check_if_deposit_hash_processed_unprocessed_deposits(self, tx_hash):
+    async def check_if_deposit_hash_processed_unprocessed_deposits(self, tx_hash):
         """
         Check if hash is stored in unprocessed deposits
         """
-        result = self.xlm_unprocessed.find_one({"hash": tx_hash})
+        result = await self.as_xlm_unprocessed.find_one({"hash": tx_hash})
 
         if result:
             return True
         else:
             return False
 
-    def get_stellar_wallet_data_by_discord_id(self, discord_id: int):
+    async def get_stellar_wallet_data_by_discord_id(self, discord_id: int):
         """
         Get users wallet details by unique Discord id.
         """
-        result = self.xlm_wallets.find_one({"userId": discord_id},
-                                           {"_id": 0})
+        result = await self.as_xlm_wallets.find_one({"userId": discord_id},
+                                                        {"_id": 0})
         if result:
             return result
         else:
             return {}
 
-    def update_stellar_balance_by_memo(self, memo, stroops: int, direction: int):
+    async def update_stellar_balance_by_memo(self, memo, stroops: int, direction: int):
         """
         Updates the balance based on stellar memo with stroops
         :param memo: Deposit payment id
@@ -129,15 +244,15 @@ class StellarManager:
             stroops *= (-1)  # Deduct
 
         try:
-            result = self.xlm_wallets.update_one({"depositId": memo},
-                                                 {'$inc': {"balance": stroops}})
+            result = await self.as_xlm_wallets.update_one({"depositId": memo},
+                                                          {'$inc': {"balance": stroops}})
 
             return result.matched_count > 0
         except errors.PyMongoError as e:
             print(f'Could not update balance by memo: {e}')
             return False
 
-    def update_stellar_balance_by_discord_id(self, discord_id: int, stroops: int, direction: int):
+    async def update_stellar_balance_by_discord_id(self, discord_id: int, stroops: int, direction: int):
         """
         Updates the balance based on discord id  with stroops
         :param discord_id: Unique Discord id
@@ -151,17 +266,17 @@ class StellarManager:
             stroops *= (-1)  # Deduct
 
         try:
-            result = self.xlm_wallets.update_one({"userId": discord_id},
-                                                 {'$inc': {"balance": int(stroops)}})
+            result = await self.as_xlm_wallets.update_one({"userId": discord_id},
+                                                          {'$inc': {"balance": int(stroops)}})
 
             return result.matched_count > 0
         except errors.PyMongoError as e:
             print(e)
             return False
 
-    def get_discord_id_from_deposit_id(self, deposit_id):
+    async def get_discord_id_from_deposit_id(self, deposit_id):
         """
         Query unique users discord if based on deposit_id / memo
         """
-        result = self.xlm_wallets.find_one({"depositId": deposit_id})
+        result = await self.as_xlm_wallets.find_one({"depositId": deposit_id})
         return result
@@ -2,28 +2,59 @@
 Handling Stellar chain
 """
 
+import asyncio
+import base64
 import os
 import sys
+import time
+from datetime import datetime, timezone
+
+from colorama import Fore, init
 
 project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_path)
 
 from stellar_sdk import Account, Server, Keypair, TransactionEnvelope, Payment, Network, TransactionBuilder, exceptions
+from stellar_sdk import PathPaymentStrictReceive, PathPaymentStrictSend
+from stellar_sdk.xdr import Xdr
 from stellar_sdk.sep import stellar_uri
 from stellar_sdk import TextMemo, Asset
 from stellar_sdk.exceptions import NotFoundError
+from stellar_sdk.client.aiohttp_client import AiohttpClient
 
 from utils.tools import Helpers
+from backOffice.sequenceManager import SequenceManager
+from backOffice.channelAccounts import ChannelPool
+from backOffice.feeOracle import FeeOracle
+
+init(autoreset=True)
+
+CONST_PAGE_LIMIT = 200  # Max records Horizon returns per page
+CONST_POOL_SIZE = 20  # Persistent connections to Horizon shared by all async calls
+CONST_OP_INDEX_MASK = 4095  # Lowest 12 bits of operation id hold 1-based index of operation inside transaction
+CONST_PAYMENT_TYPES = ['payment', 'path_payment_strict_receive', 'path_payment_strict_send']
+CONST_MAX_OPS = 100  # Max operations Stellar allows in single transaction
+CONST_SEQUENCE_RETRIES = 3  # Resubmissions after hot wallet sequence has been resynced
+CONST_TX_TIMEOUT = 30  # Seconds after which submitted transaction can no longer be included in ledger
+CONST_POLL_INTERVAL = 2  # Seconds between lookups of submitted transaction hash
+CONST_RESUBMIT_INTERVAL = 10  # Seconds after which unconfirmed transaction envelope is submitted again
+CONST_CLOSE_MARGIN = 10  # Seconds waited past transaction time bounds for last ledger to close
+CONST_PENDING_AFTER = 300  # Seconds past time bounds after which outcome is left pending if Horizon lags behind
+CONST_TX_CONFIRMED = 'confirmed'  # Transaction included in ledger and successful
+CONST_TX_FAILED = 'failed'  # Transaction included but failed, or can no longer be included
+CONST_MEMO_REQUIRED_KEY = 'config.memo_required'  # SEP-29 data entry of accounts accepting payments only with memo
+CONST_MEMO_REQUIRED_VALUE = 'MQ=='  # Base64 encoded value 1 of memo required entry
+CONST_TX_PENDING = 'pending'  # Outcome unknown as Horizon has not ingested ledgers past transaction time bounds
 
 
 class StellarWallet:
     """
     Stellar Hot Wallet Handler on chain
-    for live net use self.server = Server(horizon_url="https://horizon.stellar.org")  # Live network
+    for live net use horizon_url="https://horizon.stellar.org"  # Live network
 
     """
 
-    def __init__(self, horizon_url: str, integrated_coins):
+    def __init__(self, horizon_url: str, integrated_coins, fee_settings: dict = None):
         helpers = Helpers()
         secret_details = helpers.read_json_file(file_name="walletSecrets.json")  # Load Stellar wallet secrets
         public_details = helpers.read_json_file(file_name="hotWallets.json")  # Load hot wallet details
@@ -33,7 +64,14 @@ class StellarWallet:
         self.private_key = secret_details['stellar']
         self.root_keypair = Keypair.from_secret(self.private_key)
         self.root_account = Account(account_id=self.root_keypair.public_key, sequence=1)
-        self.server = Server(horizon_url=horizon_url)  # Testnet
+        # Async support with shared pooled session so Horizon calls do not block the event loop
+        self.as_server = Server(horizon_url=horizon_url, client=AiohttpClient(pool_size=CONST_POOL_SIZE))
+        # Hot wallet sequence numbers are handed out locally instead of loading account for every transaction
+        self.sequence = SequenceManager(as_server=self.as_server, account_id=self.public_key)
+        # Channel accounts used as transaction sources so hot wallet payments can be submitted in parallel
+        self.channels = ChannelPool(as_server=self.as_server, secrets=secret_details.get('channels', []))
+        # Base fee is refreshed in the background instead of being fetched for every transaction
+        self.fee_oracle = FeeOracle(as_server=self.as_server, fee_settings=fee_settings)
 
         # Decide network type
         if horizon_url == "https://horizon-testnet.stellar.org":
@@ -79,20 +117,34 @@ class StellarWallet:
         else:
             return result_code
 
-    def check_if_account_activate(self, address):
+    async def check_if_account_activate(self, address):
         "Try to load account on the network"
         try:
-            self.server.load_account(account_id=address)
+            await self.as_server.load_account(account_id=address)
             return True
         except NotFoundError:
             return False
 
-    def get_stellar_hot_wallet_details(self):
+    async def requires_memo(self, address: str):
+        """
+        Check if destination account requires memo on incoming payments (SEP-29). Withdrawals are sent without memo,
+        so such destinations are refused before withdrawal is queued instead of SDK checking all destinations of the
+        batch on every submission.
+        :param address: destination address
+        :return: bool, False for accounts which do not exist yet
+        """
+        try:
+            data = await self.as_server.accounts().account_id(account_id=address).call()
+        except NotFoundError:
+            return False
+        return data.get('data', {}).get(CONST_MEMO_REQUIRED_KEY) == CONST_MEMO_REQUIRED_VALUE
+
+    async def get_stellar_hot_wallet_details(self):
         """
         Return the stellar hot wallet balance
         :return:
         """
-        data = self.server.accounts().account_id(account_id=self.public_key).call()
+        data = await self.as_server.accounts().account_id(account_id=self.public_key).call()
         if 'status' not in data:
             data.pop('_links')
             data.pop('data')
@@ -108,54 +160,190 @@ class StellarWallet:
         else:
             return {}
 
-    def decode_transaction_envelope(self, envelope_xdr):
+    @staticmethod
+    def __path_payment_received_amounts(result_xdr: str) -> dict:
+        """
+        Amounts delivered by strict send path payments are known only from transaction result
+        :param result_xdr: Transaction result xdr from stellar network
+        :return: dictionary of operation index --> amount in stroops delivered to destination
         """
-        Decode envelope and get details
+        amounts = dict()
+        result = Xdr.StellarXDRUnpacker(base64.b64decode(result_xdr)).unpack_TransactionResult()
+        for index, op_result in enumerate(result.result.results):
+            try:
+                amounts[index] = int(op_result.tr.pathPaymentStrictSendResult.success.last.amount)
+            except AttributeError:
+                pass  # Not a strict send path payment
+        return amounts
+
+    def decode_transaction_envelope(self, envelope_xdr, result_xdr=None):
+        """
+        Decode envelope and get details of all payments made to hot wallet
         Credits to overcat :
         https://stellar.stackexchange.com/questions/3022/how-can-i-get-the-value-of-the-stellar-transaction/3025#3025
         :param envelope_xdr: Xdr envelope from stellar network
-        :return: Decoded transaction details
+        :param result_xdr: Xdr of transaction result, required to read amounts received through strict send path
+        :return: List of decoded payments with asset details, amount in stroops and operation index
         """
         te = TransactionEnvelope.from_xdr(envelope_xdr, self.networkPhrase)
-        operations = te.transaction.operations
+        tx_source = te.transaction.source.public_key
+        received = None
+
+        payments = list()
+        for op_index, op in enumerate(te.transaction.operations):
+            if not isinstance(op, (Payment, PathPaymentStrictReceive, PathPaymentStrictSend)):
+                continue
+            if op.destination != self.public_key or (op.source or tx_source) == self.public_key:
+                continue  # Payment not made to hot wallet by someone else
 
-        # TODO make multiple payments inside one transaction
-        amount = 0
-        for op in operations:
             if isinstance(op, Payment):
                 asset = op.asset.to_dict()
-                if asset.get('type') == 'native':
-                    asset['code'] = 'XLM'  # Appending XLM code to asset incase if native
-                asset["amount"] = op.to_xdr_amount(op.amount)
-                # TODO count all deposits
-                return asset
-
-    def get_incoming_transactions(self, pag=None):
-        """
-        Gets all incoming transactions and removes certain values
-        :return: List of incoming transfers
-        """
-        data = self.server.transactions().for_account(account_id=self.public_key).include_failed(False).order(
-            desc=False).cursor(cursor=pag).limit(200).call()
-        to_process = list()
-        for tx in data['_embedded']['records']:
-            # Get transaction envelope
-            if tx['source_account'] != self.public_key and tx['successful'] is True:  # Get only incoming transactions
-                tx.pop('_links')
-                tx.pop('fee_charged')
-                tx.pop('id')
-                tx.pop('fee_account')
-                tx.pop('fee_meta_xdr')
-                tx.pop('ledger')
-                tx.pop('max_fee')
-                tx.pop('operation_count')
-                tx.pop('result_meta_xdr')
-                tx.pop('result_xdr')
-                tx.pop('signatures')
-                tx['asset_type'] = self.decode_transaction_envelope(envelope_xdr=tx['envelope_xdr'])
-                tx.pop('envelope_xdr')
-                to_process.append(tx)
-        return to_process
+                amount = op.to_xdr_amount(op.amount)
+            elif isinstance(op, PathPaymentStrictReceive):
+                asset = op.dest_asset.to_dict()
+                amount = op.to_xdr_amount(op.dest_amount)
+            else:
+                asset = op.dest_asset.to_dict()
+                if received is None:
+                    received = self.__path_payment_received_amounts(result_xdr=result_xdr) if result_xdr else {}
+                amount = received.get(op_index, op.to_xdr_amount(op.dest_min))
+
+            if asset.get('type') == 'native':
+                asset['code'] = 'XLM'  # Appending XLM code to asset incase if native
+            asset["amount"] = amount
+            asset["opIndex"] = op_index
+            payments.append(asset)
+        return payments
+
+    def filter_incoming_transaction(self, tx: dict):
+        """
+        Removes certain values from transaction record and decodes its envelope into deposits, one per payment
+        operation made to hot wallet
+        :param tx: Transaction record as returned from Horizon
+        :return: List of incoming deposits, empty if transaction is not incoming
+        """
+        deposits = list()
+        if tx['source_account'] != self.public_key and tx['successful'] is True:  # Get only incoming transactions
+            payments = self.decode_transaction_envelope(envelope_xdr=tx['envelope_xdr'], result_xdr=tx['result_xdr'])
+            for key in ['_links', 'fee_charged', 'id', 'fee_account', 'fee_meta_xdr', 'ledger', 'max_fee',
+                        'operation_count', 'result_meta_xdr', 'result_xdr', 'signatures', 'envelope_xdr']:
+                tx.pop(key, None)
+            for payment in payments:
+                deposit = dict(tx)
+                deposit['opIndex'] = payment.pop('opIndex')
+                deposit['asset_type'] = payment
+                deposits.append(deposit)
+        return deposits
+
+    def decode_incoming_page(self, records: list) -> list:
+        """
+        Decode all transactions of Horizon page into deposit records
+        :param records: Transaction records of the page
+        :return: List of deposits made to hot wallet on the page
+        """
+        deposits = list()
+        for tx in records:
+            deposits.extend(self.filter_incoming_transaction(tx=tx))
+        return deposits
+
+    def filter_incoming_payment(self, payment: dict):
+        """
+        Builds deposit record from Horizon payment record joined with its transaction. Amount is already decoded by
+        Horizon, for path payments it is the amount delivered to the destination.
+        :param payment: Payment record with embedded transaction
+        :return: Incoming deposit or None if payment is not incoming
+        """
+        if payment['type'] not in CONST_PAYMENT_TYPES or not payment['transaction_successful']:
+            return None
+        if payment['to'] != self.public_key or payment['from'] == self.public_key:
+            return None
+
+        tx = payment['transaction']
+        if payment['asset_type'] == 'native':
+            asset = {"type": "native", "code": "XLM"}
+        else:
+            asset = {"type": payment['asset_type'], "code": payment['asset_code'], "issuer": payment['asset_issuer']}
+        asset['amount'] = Payment.to_xdr_amount(payment['amount'])
+
+        deposit = {
+            "memo_type": tx['memo_type'],
+            "hash": payment['transaction_hash'],
+            "opIndex": (int(payment['id']) & CONST_OP_INDEX_MASK) - 1,
+            "paging_token": payment['paging_token'],
+            "successful": payment['transaction_successful'],
+            "created_at": payment['created_at'],
+            "source_account": payment['from'],
+            "source_account_sequence": tx['source_account_sequence'],
+            "asset_type": asset
+        }
+        if 'memo' in tx:
+            deposit['memo'] = tx['memo']
+        return deposit
+
+    def decode_payment_page(self, records: list) -> list:
+        """
+        Turn payment records of Horizon page into deposit records
+        :param records: Payment records of the page joined with transactions
+        :return: List of deposits made to hot wallet on the page
+        """
+        deposits = list()
+        for payment in records:
+            deposit = self.filter_incoming_payment(payment=payment)
+            if deposit:
+                deposits.append(deposit)
+        return deposits
+
+    def __deposit_call_builder(self, endpoint: str, pag=None):
+        """
+        Call builder for hot wallet records on selected deposit endpoint
+        :param endpoint: transactions or payments
+        :param pag: Paging token from where records are followed
+        """
+        if endpoint == 'payments':
+            return self.as_server.payments().for_account(account_id=self.public_key).include_failed(
+                False).join('transactions').cursor(cursor=pag)
+        return self.as_server.transactions().for_account(account_id=self.public_key).include_failed(
+            False).cursor(cursor=pag)
+
+    def __deposit_decoder(self, endpoint: str):
+        return self.decode_payment_page if endpoint == 'payments' else self.decode_incoming_page
+
+    async def get_incoming_transaction_pages(self, pag=None, max_pages: int = 1, endpoint: str = 'transactions'):
+        """
+        Follows pages of hot wallet transactions or payments till the chain head is reached or page limit is hit
+        :param pag: Paging token from where pages are followed
+        :param max_pages: Maximum number of pages fetched in one run
+        :param endpoint: Horizon endpoint used for deposit detection, transactions or payments
+        :return: Async generator of incoming transfers per page and paging token of the last record on the page
+        """
+        call_builder = self.__deposit_call_builder(endpoint=endpoint, pag=pag).order(desc=False).limit(
+            CONST_PAGE_LIMIT)
+        decoder = self.__deposit_decoder(endpoint=endpoint)
+        data = await call_builder.call()
+        for page in range(max_pages):
+            records = data['_embedded']['records']
+            if not records:
+                break
+
+            paging_token = records[-1]['paging_token']
+            yield decoder(records), paging_token
+
+            # Page which is not full means that head of the chain has been reached
+            if len(records) < CONST_PAGE_LIMIT or page + 1 == max_pages:
+                break
+            data = await call_builder.next()  # Follows _links.next
+
+    async def stream_incoming_transactions(self, pag=None, endpoint: str = 'transactions'):
+        """
+        Follows Horizon SSE stream of hot wallet transactions or payments starting after the paging token
+        :param pag: Paging token from where stream resumes
+        :param endpoint: Horizon endpoint used for deposit detection, transactions or payments
+        :return: Async generator of paging token and incoming deposits of the record
+        """
+        decoder = self.__deposit_decoder(endpoint=endpoint)
+        stream = self.__deposit_call_builder(endpoint=endpoint, pag=pag).stream()
+        async for record in stream:
+            yield record['paging_token'], decoder([record])
 
     @staticmethod
     def check_if_memo(memo):
@@ -169,45 +357,191 @@ class StellarWallet:
         else:
             return False
 
-    def token_withdrawal(self, address, token, amount: str):
+    async def __build_payments_tx(self, channel, payments: list):
         """
-        Amount as full
+        Build and sign transaction with payment operation from the hot wallet per payment. When channel account is
+        provided it is the transaction source paying the fee, otherwise hot wallet is.
+        :param channel: ChannelAccount or None
+        :param payments: list of dicts with address, token and amount as full
         """
-
-        if token != 'xlm':
-            asset_issuer = self.integrated_coins[token.lower()]["assetIssuer"]
-        else:
-            asset_issuer = None
-
-        source_account = self.server.load_account(self.public_key)
-        tx = TransactionBuilder(
-            source_account=source_account,
-            network_passphrase=self.networkPhrase,
-            base_fee=self.server.fetch_base_fee()).append_payment_op(
-            asset_issuer=asset_issuer,
-            destination=address, asset_code=token.upper(), amount=amount).set_timeout(30).build()
+        sequence = channel.sequence if channel else self.sequence
+        builder = TransactionBuilder(source_account=await sequence.next_account(),
+                                     network_passphrase=self.networkPhrase,
+                                     base_fee=self.fee_oracle.get_base_fee())
+        for payment in payments:
+            token = payment["token"]
+            builder.append_payment_op(
+                asset_issuer=self.integrated_coins[token.lower()]["assetIssuer"] if token != 'xlm' else None,
+                destination=payment["address"], asset_code=token.upper(), amount=payment["amount"],
+                source=self.public_key if channel else None)
+        tx = builder.set_timeout(CONST_TX_TIMEOUT).build()
         tx.sign(self.root_keypair)
+        if channel:
+            tx.sign(channel.keypair)
+        return tx
+
+    async def __submit_and_confirm(self, tx):
+        """
+        Submit signed transaction and make sure it is included in ledger. When Horizon times out or connection drops
+        transaction may still get included, so instead of building a new one the hash is polled and the same envelope
+        resubmitted until it is found or its time bounds expire. Resubmitting identical envelope is idempotent since
+        network includes transaction with given hash at most once. Transaction is considered expired only once Horizon
+        has ingested ledger closed after its time bounds, as lagging ingestion can hide already included transaction.
+        :param tx: signed TransactionEnvelope with time bounds
+        :return: tuple of status (confirmed, failed or pending) and Horizon transaction response if confirmed
+        :raises BadRequestError: only when transaction is rejected on first submission, errors of later lookups and
+        resubmissions never raise it
+        """
+        tx_hash = tx.hash_hex()
+        envelope = tx.to_xdr()
+        max_time = tx.transaction.time_bounds.max_time
+        deadline = max_time + CONST_CLOSE_MARGIN
+
         try:
-            resp = self.server.submit_transaction(tx)
-            details = self.decode_transaction_envelope(envelope_xdr=resp['envelope_xdr'])
-            end_details = {
-                "asset": details['code'],
-                "explorer": resp['_links']['transaction']['href'],
-                "hash": resp['hash'],
-                "ledger": resp['ledger'],
-                "destination": address,
-                "amount": details['amount']
-            }
-            return end_details
-        except exceptions.BadRequestError as e:
-            # get operation from result_codes to be processed
-            error = self.__filter_error(result_code=e.extras["result_codes"]['operations'])
-            return {
-
-                "error": f'{error} with {token.upper()} issuer'
-            }
-
-    def establish_trust(self, private_key, token):
+            return CONST_TX_CONFIRMED, await self.as_server.submit_transaction(envelope,
+                                                                               skip_memo_required_check=True)
+        except exceptions.BadRequestError:
+            # Rejected by Horizon, transaction has not been accepted
+            raise
+        except Exception as e:
+            print(Fore.YELLOW + f'Submission of {tx_hash} not confirmed ({e}), polling for result')
+
+        last_submit = time.time()
+        while True:
+            await asyncio.sleep(CONST_POLL_INTERVAL)
+            # Ledger is checked before the hash so transaction missing from ingested ledger is surely not included
+            expired = time.time() > deadline and await self.__ledger_closed_after(timestamp=max_time)
+            try:
+                record = await self.as_server.transactions().transaction(tx_hash).call()
+                if not record.get('successful', True):
+                    print(Fore.RED + f'Transaction {tx_hash} included in ledger {record["ledger"]} but failed')
+                    return CONST_TX_FAILED, None
+                record['_links']['transaction'] = record['_links']['self']
+                return CONST_TX_CONFIRMED, record
+            except exceptions.NotFoundError:
+                if expired:
+                    print(Fore.RED + f'Transaction {tx_hash} expired without being included')
+                    return CONST_TX_FAILED, None
+            except (exceptions.BaseHorizonError, exceptions.ConnectionError, asyncio.TimeoutError):
+                # Rate limits and server errors of the lookup say nothing about the transaction
+                pass
+
+            now = time.time()
+            if now > deadline + CONST_PENDING_AFTER:
+                print(Fore.RED + f'Outcome of transaction {tx_hash} unknown, Horizon has not ingested ledgers past '
+                                 f'its time bounds')
+                return CONST_TX_PENDING, None
+
+            if now - last_submit >= CONST_RESUBMIT_INTERVAL and now < max_time:
+                last_submit = now
+                try:
+                    return CONST_TX_CONFIRMED, await self.as_server.submit_transaction(envelope,
+                                                                                       skip_memo_required_check=True)
+                except exceptions.BaseHorizonError as e:
+                    # Rejection of resubmission, tx_bad_seq included, means transaction may already be in ledger
+                    print(Fore.YELLOW + f'Resubmission of {tx_hash} not accepted ({e}), polling for result')
+                except (exceptions.ConnectionError, asyncio.TimeoutError):
+                    pass
+
+    async def __ledger_closed_after(self, timestamp: int):
+        """
+        Check if latest ledger ingested by Horizon has been closed after the timestamp
+        :param timestamp: unix time
+        :return: bool, False when it can not be determined
+        """
+        try:
+            data = await self.as_server.ledgers().order(desc=True).limit(1).call()
+            closed_at = data['_embedded']['records'][0]['closed_at']
+        except (exceptions.BaseHorizonError, exceptions.ConnectionError, asyncio.TimeoutError, IndexError, KeyError):
+            return False
+        closed_at = datetime.strptime(closed_at, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+        return closed_at.timestamp() > timestamp
+
+    async def batch_withdrawal(self, withdrawals: list):
+        """
+        Withdraw to multiple destinations with single transaction holding one payment operation per withdrawal.
+        When operations fail, transaction is resubmitted without them so remaining withdrawals still go through.
+        :param withdrawals: list of dicts with address, token and amount as full, max 100
+        :return: list of results in same order as withdrawals, dict with asset, explorer, hash, opIndex, ledger,
+        destination and amount in stroops, dict with pending transaction hash if outcome is unknown or dict with error
+        """
+        channel = await self.channels.acquire()
+        try:
+            return await self.__submit_batch(channel=channel, withdrawals=withdrawals)
+        finally:
+            self.channels.release(channel)
+
+    async def __submit_batch(self, channel, withdrawals: list):
+        results = [None] * len(withdrawals)
+        remaining = list(range(len(withdrawals)))
+        resyncs = 0
+
+        while remaining:
+            tx = await self.__build_payments_tx(channel=channel, payments=[withdrawals[index] for index in remaining])
+
+            try:
+                status, resp = await self.__submit_and_confirm(tx=tx)
+            except exceptions.BadRequestError as e:
+                # Transaction has been rejected on submission, none of its payments has been made
+                result_codes = (e.extras or {}).get("result_codes") or {}
+                if self.sequence.is_bad_sequence(result_codes=result_codes) and resyncs < CONST_SEQUENCE_RETRIES:
+                    resyncs += 1
+                    (channel.sequence if channel else self.sequence).resync()
+                    continue
+
+                op_codes = result_codes.get('operations', [])
+                failed = [position for position, code in enumerate(op_codes) if code != 'op_success']
+                if not failed:
+                    # Transaction level failure or rate limit, none of the withdrawals can be processed
+                    for index in remaining:
+                        results[index] = {"error": f'{result_codes.get("transaction", e.title)}'}
+                    break
+
+                for position in failed:
+                    index = remaining[position]
+                    error = self.__filter_error(result_code=op_codes[position])
+                    results[index] = {"error": f'{error} with {withdrawals[index]["token"].upper()} issuer'}
+                remaining = [index for position, index in enumerate(remaining) if position not in failed]
+                continue
+            except Exception as e:
+                # Transaction may have been accepted, outcome is left to be checked instead of failing withdrawals
+                print(Fore.RED + f'Outcome of transaction {tx.hash_hex()} unknown: {e}')
+                status, resp = CONST_TX_PENDING, None
+
+            if status == CONST_TX_PENDING:
+                # Funds may have left the hot wallet, withdrawals are neither completed nor failed
+                (channel.sequence if channel else self.sequence).resync()
+                for index in remaining:
+                    results[index] = {
+                        "pending": tx.hash_hex(),
+                        "asset": withdrawals[index]["token"].upper(),
+                        "destination": withdrawals[index]["address"],
+                        "amount": Payment.to_xdr_amount(withdrawals[index]["amount"])  # Stroops
+                    }
+                break
+
+            if status == CONST_TX_FAILED:
+                (channel.sequence if channel else self.sequence).resync()
+                for index in remaining:
+                    results[index] = {"error": 'Transaction could not be confirmed on the network'}
+                break
+
+            # Confirmed payments are reported as such even if response misses details
+            for position, index in enumerate(remaining):
+                results[index] = {
+                    "asset": withdrawals[index]["token"].upper(),
+                    "explorer": resp.get('_links', {}).get('transaction', {}).get('href'),
+                    "hash": resp.get('hash', tx.hash_hex()),
+                    "opIndex": position,
+                    "ledger": resp.get('ledger'),
+                    "destination": withdrawals[index]["address"],
+                    "amount": Payment.to_xdr_amount(withdrawals[index]["amount"])  # Stroops
+                }
+            break
+
+        return results
+
+    async def establish_trust(self, private_key, token):
         """
         Amount as full
         """
@@ -219,16 +553,15 @@ class StellarWallet:
         asset_issuer = self.integrated_coins[token.lower()]["assetIssuer"]
 
         try:
-            source_account = self.server.load_account(public_key)
+            source_account = await self.as_server.load_account(public_key)
             tx = TransactionBuilder(
                 source_account=source_account,
                 network_passphrase=self.networkPhrase,
-                base_fee=self.server.fetch_base_fee()).append_change_trust_op(asset_code=f'{token.upper()}',
-                                                                              asset_issuer=asset_issuer).set_timeout(
-                30).build()
+                base_fee=self.fee_oracle.get_base_fee()).append_change_trust_op(
+                asset_code=f'{token.upper()}', asset_issuer=asset_issuer).set_timeout(30).build()
             tx.sign(private_key)
 
-            self.server.submit_transaction(tx)
+            await self.as_server.submit_transaction(tx)
             return True
         except exceptions.NotFoundError:
             return False
@@ -8,63 +8,81 @@ sys.path.append(project_path)
 class ThirdLevelWalletManager:
     """Class dealing with the level three walets"""
 
-    def __init__(self, connection):
+    def __init__(self, connection, as_connection, registration_cache=None):
         """Connection to Database and Crypto Link collections"""
         self.connection = connection
-        self.bot_stuff = self.connection['CryptoLink']
-        self.third_level = self.bot_stuff.ThirdLevelWallets
+        self.as_connection = as_connection
+        self.registration_cache = registration_cache  # Cache of registration statuses for command checks
+        self.as_bot_stuff = self.as_connection['CryptoLink']
+        self.as_third_level = self.as_bot_stuff.ThirdLevelWallets
 
-    def third_level_user_reg_status(self, user_id: int):
+    async def third_level_user_reg_status(self, user_id: int):
         """
         Check user registration status
         """
-        data = self.third_level.find_one({"userId": int(user_id)})
+        if self.registration_cache:
+            cached = self.registration_cache.get(kind='thirdLevel', key=user_id)
+            if cached is not None:
+                return cached
+            # Taken before database read so status changed meanwhile is not cached
+            generation = self.registration_cache.generation(kind='thirdLevel', key=user_id)
+
+        data = await self.as_third_level.find_one({"userId": int(user_id)}, {"_id": 1})
+
+        if self.registration_cache:
+            self.registration_cache.set(kind='thirdLevel', key=user_id, registered=bool(data),
+                                        generation=generation)
+
         if data:
             return True
         else:
             return False
 
-    def register_rd_level_wallet(self, data_to_store: dict):
+    async def register_rd_level_wallet(self, data_to_store: dict):
         """
         Creates the user hot wallet into the database. Decryption happens in COGS
         """
-        result = self.third_level.insert_one(data_to_store)
+        result = await self.as_third_level.insert_one(data_to_store)
+        if self.registration_cache and result.inserted_id:
+            self.registration_cache.set(kind='thirdLevel', key=data_to_store["userId"], registered=True)
 
         if result.inserted_id:
             return True
         else:
             return False
 
-    def update_public_address(self, user_id: int, pub_address: str):
-        result = self.third_level.update_one({"userId": int(user_id)},
-                                             {"$set": {"publicAddress": pub_address}})
+    async def update_public_address(self, user_id: int, pub_address: str):
+        result = await self.as_third_level.update_one({"userId": int(user_id)},
+                                                      {"$set": {"publicAddress": pub_address}})
         return result.modified_count > 0
 
-    def get_third_account_details(self, user_id: int):
+    async def get_third_account_details(self, user_id: int):
         """
         Get user hot wallet details for decription in cogs
         """
-        data = self.third_level.find_one({"userId": int(user_id)},
-                                         {"_id": 0})
+        data = await self.as_third_level.find_one({"userId": int(user_id)},
+                                                  {"_id": 0})
         if data:
             return data
         else:
             return {}
 
-    def get_third_hot_wallet_addr(self, user_id: int):
+    async def get_third_hot_wallet_addr(self, user_id: int):
         """
         Get user hot wallet details for decription in cogs
         """
-        data = self.third_level.find_one({"userId": int(user_id)},
-                                         {"_id": 0,
-                                          "publicAddress": 1})
+        data = await self.as_third_level.find_one({"userId": int(user_id)},
+                                                  {"_id": 0,
+                                                   "publicAddress": 1})
         if data:
             return data["publicAddress"]
         else:
             return {}
 
-    def remove_account(self, user_id: int):
+    async def remove_account(self, user_id: int):
 
-        result = self.third_level.delete_one({"userId": int(user_id)})
+        result = await self.as_third_level.delete_one({"userId": int(user_id)})
+        if self.registration_cache:
+            self.registration_cache.invalidate(kind='thirdLevel', key=user_id)
 
         return result.deleted_count > 0
@@ -1,9 +1,14 @@
+import asyncio
 import os
 import sys
 
+from pymongo import errors, UpdateOne
+
 project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_path)
 
+CONST_NOT_REPLICA_SET = 20  # Error code returned by stand alone servers when transaction is requested
+
 
 class UserWalletManager:
     """
@@ -13,63 +18,187 @@ class UserWalletManager:
     def __init__(self, connection, as_connection):
         self.connection = connection
         self.as_connection = as_connection
-        self.crypto_link = self.connection['CryptoLink']
 
-        self.user_wallets = self.crypto_link.userWallets
         # Collections connections async
         self.as_cl_connection = self.as_connection['CryptoLink']
         self.as_user_profiles = self.as_cl_connection.userProfiles  # Connection to user profiles
         self.as_user_wallets = self.as_cl_connection.userWallets  # Connection to user profiles
 
-    def get_discord_id_from_memo(self, memo: str):
-        result = self.user_wallets.find_one({"depositId": memo},
-                                            {"_id": 0,
-                                             "userId": 1})
+    async def get_discord_id_from_memo(self, memo: str):
+        result = await self.as_user_wallets.find_one({"depositId": memo},
+                                                     {"_id": 0,
+                                                      "userId": 1})
         return int(result["userId"])
 
-    def update_coin_balance_by_memo(self, memo: str, coin: str, amount: int):
-        result = self.user_wallets.update_one({"depositId": memo},
-                                              {"$inc": {f"{coin.lower()}": int(amount)}})
+    async def update_coin_balance_by_memo(self, memo: str, coin: str, amount: int):
+        result = await self.as_user_wallets.update_one({"depositId": memo},
+                                                       {"$inc": {f"{coin.lower()}": int(amount)}})
         return result.modified_count > 0
 
-    def update_user_balance_off_chain(self, user_id, coin_details: dict):
-        result = self.user_wallets.update_one({"userId": user_id},
-                                              {"$inc": coin_details})
+    async def update_user_balance_off_chain(self, user_id, coin_details: dict):
+        result = await self.as_user_wallets.update_one({"userId": user_id},
+                                                       {"$inc": coin_details})
         return result.modified_count > 0
 
-    def update_coin_balance(self, coin, user_id: int, amount: int, direction: int):
+    async def update_coin_balance(self, coin, user_id: int, amount: int, direction: int):
         if direction == 1:  # Append
             pass
         else:
             amount *= (-1)  # Deduct
 
-        result = self.user_wallets.update_one({"userId": user_id},
-                                              {"$inc": {f"{coin}": amount}})
+        result = await self.as_user_wallets.update_one({"userId": user_id},
+                                                       {"$inc": {f"{coin}": amount}})
         return result.modified_count > 0
 
-    def get_ticker_balance(self, ticker, user_id: int):
-        result = self.user_wallets.find_one({"userId": user_id},
-                                            {"_id": 0,
-                                             f"{ticker}": 1})
+    async def transfer(self, coin: str, sender_id: int, recipient_id: int, amount: int):
+        """
+        Move funds between two off-chain wallets. Sender is debited only if balance covers the amount and recipient
+        is credited in the same multi document transaction, so parallel transfers can not overdraw the wallet.
+        :param coin: ticker of the coin
+        :param sender_id: Discord id of the sender
+        :param recipient_id: Discord id of the recipient
+        :param amount: amount in atomic units
+        :return: True if funds have been moved, False if sender balance is insufficient or recipient has no wallet
+        """
+        coin = coin.lower()
+
+        async def debit_and_credit(session):
+            debit = await self.as_user_wallets.update_one({"userId": sender_id, coin: {"$gte": int(amount)}},
+                                                          {"$inc": {coin: -int(amount)}}, session=session)
+            if debit.modified_count == 0:
+                await session.abort_transaction()
+                return False
+
+            credit = await self.as_user_wallets.update_one({"userId": recipient_id},
+                                                           {"$inc": {coin: int(amount)}}, session=session)
+            if credit.modified_count == 0:
+                await session.abort_transaction()
+                return False
+            return True
+
+        try:
+            async with await self.as_connection.start_session() as session:
+                return await session.with_transaction(debit_and_credit)
+        except errors.OperationFailure as e:
+            if e.code != CONST_NOT_REPLICA_SET:
+                raise
+            # Stand alone server, conditional debit still guards against overdraft
+            return await self.__transfer_without_transaction(coin=coin, sender_id=sender_id,
+                                                             recipient_id=recipient_id, amount=amount)
+
+    async def __transfer_without_transaction(self, coin: str, sender_id: int, recipient_id: int, amount: int):
+        """
+        Fallback for deployments without transactions. Debit is returned to sender if recipient can not be credited
+        """
+        debit = await self.as_user_wallets.update_one({"userId": sender_id, coin: {"$gte": int(amount)}},
+                                                      {"$inc": {coin: -int(amount)}})
+        if debit.modified_count == 0:
+            return False
+
+        credit = await self.as_user_wallets.update_one({"userId": recipient_id},
+                                                       {"$inc": {coin: int(amount)}})
+        if credit.modified_count == 0:
+            await self.as_user_wallets.update_one({"userId": sender_id}, {"$inc": {coin: int(amount)}})
+            return False
+        return True
+
+    async def multi_transfer(self, coin: str, sender_id: int, recipient_ids: list, amount: int):
+        """
+        Move same amount from one wallet to many. Recipients without wallet are skipped, sender is debited once for
+        the total of remaining recipients only if balance covers it and they are credited with single bulk write in the
+        same multi document transaction.
+        :param coin: ticker of the coin
+        :param sender_id: Discord id of the sender
+        :param recipient_ids: list of unique Discord ids of recipients
+        :param amount: amount per recipient in atomic units
+        :return: list of Discord ids of credited recipients, empty if sender balance is insufficient or none of the
+        recipients has a wallet
+        """
+        coin = coin.lower()
+        if not recipient_ids:
+            return []
+
+        async def wallet_owners(session=None):
+            owners = set()
+            async for wallet in self.as_user_wallets.find({"userId": {"$in": list(recipient_ids)}},
+                                                          {"_id": 0, "userId": 1}, session=session):
+                owners.add(wallet["userId"])
+            return [recipient_id for recipient_id in recipient_ids if recipient_id in owners]
+
+        def credits(credited: list):
+            return [UpdateOne({"userId": recipient_id}, {"$inc": {coin: int(amount)}}) for recipient_id in credited]
+
+        async def debit_and_credit(session):
+            credited = await wallet_owners(session=session)
+            if not credited:
+                await session.abort_transaction()
+                return []
+
+            total = int(amount) * len(credited)
+            debit = await self.as_user_wallets.update_one({"userId": sender_id, coin: {"$gte": total}},
+                                                          {"$inc": {coin: -total}}, session=session)
+            if debit.modified_count == 0:
+                await session.abort_transaction()
+                return []
+
+            credit = await self.as_user_wallets.bulk_write(credits(credited), ordered=False, session=session)
+            if credit.modified_count != len(credited):
+                await session.abort_transaction()
+                return []
+            return credited
+
+        try:
+            async with await self.as_connection.start_session() as session:
+                return await session.with_transaction(debit_and_credit)
+        except errors.OperationFailure as e:
+            if e.code != CONST_NOT_REPLICA_SET:
+                raise
+
+        # Stand alone server, conditional debit still guards against overdraft
+        credited = await wallet_owners()
+        if not credited:
+            return []
+
+        total = int(amount) * len(credited)
+        debit = await self.as_user_wallets.update_one({"userId": sender_id, coin: {"$gte": total}},
+                                                      {"$inc": {coin: -total}})
+        if debit.modified_count == 0:
+            return []
+
+        # Credited one by one so recipients whose wallets have been removed meanwhile are known exactly
+        results = await asyncio.gather(*[self.as_user_wallets.update_one({"userId": recipient_id},
+                                                                         {"$inc": {coin: int(amount)}})
+                                         for recipient_id in credited])
+        missed = [recipient_id for recipient_id, result in zip(credited, results) if result.modified_count == 0]
+        if missed:
+            # Return what has not reached recipients
+            await self.as_user_wallets.update_one({"userId": sender_id},
+                                                  {"$inc": {coin: int(amount) * len(missed)}})
+        return [recipient_id for recipient_id in credited if recipient_id not in missed]
+
+    async def get_ticker_balance(self, ticker, user_id: int):
+        result = await self.as_user_wallets.find_one({"userId": user_id},
+                                                     {"_id": 0,
+                                                      f"{ticker}": 1})
         return result[f"{ticker}"]
 
-    def get_balances(self, user_id: int):
+    async def get_balances(self, user_id: int):
         """
         Get balances of all wallets
         """
-        result = self.user_wallets.find_one({"userId": user_id},
-                                            {"_id": 0,
-                                             "depositId": 0,
-                                             "userId": 0,
-                                             "userName": 0})
+        result = await self.as_user_wallets.find_one({"userId": user_id},
+                                                     {"_id": 0,
+                                                      "depositId": 0,
+                                                      "userId": 0,
+                                                      "userName": 0})
         return result
 
-    def get_full_details(self, user_id: int):
+    async def get_full_details(self, user_id: int):
         """
         Get balances of all wallets
         """
-        result = self.user_wallets.find_one({"userId": user_id},
-                                            {"_id": 0})
+        result = await self.as_user_wallets.find_one({"userId": user_id},
+                                                     {"_id": 0})
         return result
 
 
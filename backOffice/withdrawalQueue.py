@@ -0,0 +1,100 @@
+"""
+Queue collecting withdrawal requests and submitting them to Stellar in batches
+"""
+
+import asyncio
+import os
+import sys
+
+from colorama import Fore, init
+
+project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_path)
+
+from backOffice.stellarOnChainHandler import CONST_MAX_OPS
+
+init(autoreset=True)
+
+CONST_BATCH_WINDOW = 2  # Seconds withdrawal requests are collected before batch is submitted
+
+
+class WithdrawalQueue:
+    """
+    Withdrawals requested within short window are submitted as one transaction with payment operation per request,
+    which saves fees, Horizon round trips and sequence number contention on the hot wallet. Full batch is submitted
+    without waiting for the window to pass. Batches are submitted one at a time, or in parallel up to number of
+    channel accounts when they are configured.
+    """
+
+    def __init__(self, stellar_wallet, window: float = CONST_BATCH_WINDOW):
+        self.stellar_wallet = stellar_wallet
+        self.window = window
+        self.pending = []  # list of tuples (withdrawal, future)
+        self.worker = None
+        self.batch_full = None  # Event set once pending requests fill the batch
+        self.slots = None  # Semaphore limiting batches in flight
+
+    async def withdraw(self, address: str, token: str, amount: str):
+        """
+        Queue withdrawal and wait for result of the batch it has been submitted with
+        :param address: destination address
+        :param token: ticker of the token
+        :param amount: amount as full
+        :return: dict in batch_withdrawal result format, with hash on success or error on failure
+        """
+        # Destination requiring memo would fail the whole batch, so it fails only its own request
+        try:
+            if await self.stellar_wallet.requires_memo(address=address):
+                return {"error": 'Destination account requires memo, withdrawals are sent without memo'}
+        except Exception as e:
+            return {"error": f'Destination account could not be checked: {e}'}
+
+        loop = asyncio.get_event_loop()
+        if self.batch_full is None:
+            self.batch_full = asyncio.Event()
+            self.slots = asyncio.Semaphore(max(1, len(self.stellar_wallet.channels)))
+
+        future = loop.create_future()
+        self.pending.append(({"address": address, "token": token, "amount": amount}, future))
+        if len(self.pending) >= CONST_MAX_OPS:
+            self.batch_full.set()
+
+        if self.worker is None or self.worker.done():
+            self.worker = loop.create_task(self.__process())
+        return await future
+
+    async def __process(self):
+        """
+        Submit batches until no withdrawal is pending
+        """
+        loop = asyncio.get_event_loop()
+        while self.pending:
+            try:
+                await asyncio.wait_for(self.batch_full.wait(), timeout=self.window)
+            except asyncio.TimeoutError:
+                pass
+            await self.slots.acquire()
+            batch = self.pending[:CONST_MAX_OPS]
+            self.pending = self.pending[CONST_MAX_OPS:]
+            if len(self.pending) < CONST_MAX_OPS:
+                self.batch_full.clear()
+            loop.create_task(self.__submit(batch=batch))
+
+    async def __submit(self, batch: list):
+        """
+        Submit batch and hand results to waiting requests
+        """
+        print(Fore.LIGHTBLUE_EX + f'Submitting batch of {len(batch)} withdrawals')
+        try:
+            results = await self.stellar_wallet.batch_withdrawal(withdrawals=[withdrawal for withdrawal, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.slots.release()
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
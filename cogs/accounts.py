@@ -38,7 +38,7 @@ class UserAccountCommands(commands.Cog):
     @commands.check(has_wallet)
     async def me(self, ctx):
         utc_now = datetime.utcnow()
-        wallet_data = self.backoffice.wallet_manager.get_full_details(user_id=ctx.message.author.id)
+        wallet_data = await self.backoffice.wallet_manager.get_full_details(user_id=ctx.message.author.id)
         xlm_balance = float(wallet_data["xlm"]) / (10 ** 7)
 
         rates = get_rates(coin_name='stellar')
@@ -90,21 +90,18 @@ class UserAccountCommands(commands.Cog):
     @commands.check(is_public)
     @commands.cooldown(1, 5, commands.BucketType.guild)
     async def register(self, ctx):
-        if not self.backoffice.account_mng.check_user_existence(user_id=ctx.message.author.id):
-            if self.backoffice.account_mng.register_user(discord_id=ctx.message.author.id,
-                                                         discord_username=f'{ctx.message.author}'):
+        if not await self.backoffice.account_mng.check_user_existence(user_id=ctx.message.author.id):
+            if await self.backoffice.account_mng.register_user(discord_id=ctx.message.author.id,
+                                                               discord_username=f'{ctx.message.author}'):
                 message = f'Account has been successfully registered into the system and wallets created.' \
                           f' Please use {self.command_string}acc or {self.command_string}wallet.'
                 await custom_messages.system_message(ctx=ctx, color_code=0, message=message, destination=0,
                                                      sys_msg_title=CONST_ACC_REG_STATUS)
 
                 # Send message to explorer
-                load_channels = [self.bot.get_channel(id=int(chn)) for chn in
-                                 self.backoffice.guild_profiles.get_all_explorer_applied_channels()]
-                current_total = self.backoffice.account_mng.count_registrations()
+                current_total = await self.backoffice.account_mng.count_registrations()
                 explorer_msg = f':new: user registered into ***{self.bot.user} System*** (Σ {current_total})'
-                for chn in load_channels:
-                    await chn.send(content=explorer_msg)
+                await self.bot.explorer_queue.publish(message=explorer_msg, on_chain=True)
 
                 # Update guild stats on registered users
                 await self.backoffice.stats_manager.update_registered_users(guild_id=ctx.message.guild.id)
@@ -145,7 +142,7 @@ class UserAccountCommands(commands.Cog):
         Command which returns statistical information for the wallet
         """
         utc_now = datetime.utcnow()
-        account_details = self.backoffice.account_mng.get_account_stats(discord_id=ctx.message.author.id)
+        account_details = await self.backoffice.account_mng.get_account_stats(discord_id=ctx.message.author.id)
         stats_info = Embed(title=f':bar_chart: Wallet level 1 statistics :bar_chart: ',
                            description='Below are presented stats which are automatically counted upon successful'
                                        'execution of the commands dedicated to wallet level :one: ',
@@ -166,7 +163,7 @@ class UserAccountCommands(commands.Cog):
         Returns deposit information to user
         """
         if ctx.invoked_subcommand is None:
-            user_profile = self.backoffice.account_mng.get_user_memo(user_id=ctx.message.author.id)
+            user_profile = await self.backoffice.account_mng.get_user_memo(user_id=ctx.message.author.id)
             if user_profile:
                 coins_string = ', '.join([str(coin.upper()) for coin in self.list_of_coins])
                 description = ' :warning: To top up your Discord wallets, you will need to send from your preferred' \
@@ -226,7 +223,7 @@ class UserAccountCommands(commands.Cog):
         """
         Send the QR only to user
         """
-        user_profile = self.backoffice.account_mng.get_user_memo(user_id=ctx.message.author.id)
+        user_profile = await self.backoffice.account_mng.get_user_memo(user_id=ctx.message.author.id)
         if user_profile:
             coins_string = ', '.join([str(coin.upper()) for coin in self.list_of_coins])
 
@@ -257,7 +254,7 @@ class UserAccountCommands(commands.Cog):
 
     @wallet.command(aliases=['bal', 'balances', 'b'])
     async def balance(self, ctx):
-        user_balances = self.backoffice.wallet_manager.get_balances(user_id=ctx.message.author.id)
+        user_balances = await self.backoffice.wallet_manager.get_balances(user_id=ctx.message.author.id)
         coin_data = self.backoffice.integrated_coins
         if user_balances:
             all_wallets = list(user_balances.keys())
@@ -150,7 +150,7 @@ class AutoFunctions(commands.Cog):
         """
 
         if not member.bot:
-            if self.bot.backoffice.account_mng.check_user_existence(user_id=member.id):
+            if await self.bot.backoffice.account_mng.check_user_existence(user_id=member.id):
                 print(Fore.LIGHTYELLOW_EX + f'{member} left {member.guild}... Notifying him on funds')
 
                 warning_embed = Embed(title=f':warning:  __{self.bot.user}__ :warning: ',
@@ -206,11 +206,11 @@ class AutoFunctions(commands.Cog):
         print(Fore.LIGHTGREEN_EX + f'Member reach: {reach} members')
         print(Fore.LIGHTYELLOW_EX + '===================================')
 
-        if not self.bot.guild_profiles.check_guild_registration_stats(guild_id=guild.id):
+        if not await self.bot.backoffice.guild_profiles.check_guild_registration_stats(guild_id=guild.id):
             new_guild = {
                 "guildId": guild.id,
                 "guildName": f'{guild}',
-                "explorerSettings": {"channelId": int(0)},
+                "explorerSettings": {"channelId": int(0), "digestInterval": int(0)},
                 "txFees": {"xlmFeeValue": int(0)},
                 "registeredUsers": 0,
                 "xlm": {"volume": float(0.0),
@@ -221,7 +221,7 @@ class AutoFunctions(commands.Cog):
                         "emojiTxCount": int(0),
                         "multiTxCount": int(0)}
             }
-            await self.bot.guild_profiles.register_guild(guild_data=new_guild)
+            await self.bot.backoffice.guild_profiles.register_guild(guild_data=new_guild)
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild):
@@ -229,6 +229,11 @@ class AutoFunctions(commands.Cog):
         Triggered when bot is removed from guild and system message is sent to channel on removal
         """
         print(Fore.LIGHTMAGENTA_EX + f'{self.bot.user} left {guild} ')
+        # Guild does not receive explorer feed anymore
+        await self.bot.backoffice.guild_profiles.update_guild_profile(guild_id=guild.id,
+                                                                      data_to_update={
+                                                                          "explorerSettings.channelId": int(0)})
+        self.bot.backoffice.guild_profiles.set_explorer_channel(guild_id=guild.id, channel_id=0)
         removed_guild = Embed(title='__GUILD REMOVED!!!!__',
                               description=f'{self.bot.user} has left guild',
                               colour=Colour.red())
@@ -6,13 +6,12 @@ from datetime import timedelta
 import discord
 from discord import Colour
 from discord.ext import commands
-from pycoingecko import CoinGeckoAPI
 
 from utils.customCogChecks import is_public, guild_has_merchant, has_wallet
 from cogs.utils.systemMessaages import CustomMessages
+from cogs.utils.priceCache import price_cache
 
 custom_messages = CustomMessages()
-gecko = CoinGeckoAPI()
 CONST_STELLAR_EMOJI = '<:stelaremoji:684676687425961994>'
 CONST_MERCHANT_ROLE_ERROR = "__Merchant System Role Error__"
 CONST_MERCHANT_PURCHASE_ERROR = ":warning: __Merchant System Purchase Error__:warning: "
@@ -56,7 +55,7 @@ class ConsumerCommands(commands.Cog):
         author = ctx.message.author.id
         community = ctx.message.guild.id
 
-        roles = self.backoffice.merchant_manager.check_user_roles(user_id=author, discord_id=community)
+        roles = await self.backoffice.merchant_manager.check_user_roles(user_id=author, discord_id=community)
         if roles:
             for role in roles:
                 value_in_stellar = round(int(role['atomicValue']) / 10000000, 7)
@@ -100,14 +99,14 @@ class ConsumerCommands(commands.Cog):
         Gets all available monetized roles on the community
         :return:
         """
-        roles = self.backoffice.merchant_manager.get_all_roles_community(community_id=ctx.message.guild.id)
+        roles = await self.backoffice.merchant_manager.get_all_roles_community(community_id=ctx.message.guild.id)
         title = f':circus_tent: __Available Roles on Community {ctx.message.guild}__ :circus_tent:'
-        dollar_xlm = gecko.get_price(ids='stellar', vs_currencies='usd')
+        dollar_xlm = price_cache.get_ticker_price(ticker='xlm', vs_currency='usd')
 
         if roles:
             for role in roles:
                 value = float(role["pennyValues"] / 100)
-                value_in_stellar = value / dollar_xlm['stellar']['usd']
+                value_in_stellar = value / dollar_xlm if dollar_xlm else 0
                 values = [{"name": ':person_juggling: Role :person_juggling: ',
                            "value": f'{role["roleName"]} ID({role["roleId"]})'},
                           {"name": ':vertical_traffic_light: Status :vertical_traffic_light:', "value": role["status"]},
@@ -138,7 +137,7 @@ class ConsumerCommands(commands.Cog):
         else:
             ticker = 'xlm'
 
-        role_details = self.backoffice.merchant_manager.find_role_details(
+        role_details = await self.backoffice.merchant_manager.find_role_details(
             role_id=role.id)  # Get the roles from the system
 
         # Check if community has activated merchant
@@ -150,7 +149,7 @@ class ConsumerCommands(commands.Cog):
 
                 # Calculations and conversions
                 convert_to_dollar = role_details["pennyValues"] / 100  # Convert to $
-                coin_usd_price = gecko.get_price(ids='stellar', vs_currencies='usd')['stellar']['usd']
+                coin_usd_price = price_cache.get_ticker_price(ticker=ticker, vs_currency='usd')
 
                 # Check if api returned price
                 if coin_usd_price:
@@ -159,22 +158,22 @@ class ConsumerCommands(commands.Cog):
                     role_value_atomic = int(role_value_rounded * (10 ** 7))
 
                     # Get users balance
-                    balance = self.backoffice.account_mng.get_balance_based_on_ticker(
+                    balance = await self.backoffice.account_mng.get_balance_based_on_ticker(
                         user_id=int(ctx.message.author.id),
                         ticker=ticker)
 
                     # Check if user has sufficient balance
-                    if balance >= role_value_atomic and self.backoffice.merchant_manager.modify_funds_in_community_merchant_wallet(
+                    if balance >= role_value_atomic and await self.backoffice.merchant_manager.modify_funds_in_community_merchant_wallet(
                             community_id=int(ctx.message.guild.id),
                             amount=int(role_value_atomic),
                             direction=0,
                             wallet_tick=ticker):
 
                         # Update community wallet
-                        if self.backoffice.account_mng.update_user_wallet_balance(discord_id=ctx.message.author.id,
-                                                                                  ticker=ticker,
-                                                                                  direction=1,
-                                                                                  amount=role_value_atomic):
+                        if await self.backoffice.account_mng.update_user_wallet_balance(discord_id=ctx.message.author.id,
+                                                                                        ticker=ticker,
+                                                                                        direction=1,
+                                                                                        amount=role_value_atomic):
 
                             # Assign the role to the user
                             await ctx.message.author.add_roles(role,
@@ -207,7 +206,7 @@ class ConsumerCommands(commands.Cog):
                                 "communityId": int(ctx.message.guild.id)}
 
                             # Add active user to database of applied merchant
-                            if self.backoffice.merchant_manager.add_user_to_payed_roles(purchase_data=purchase_data):
+                            if await self.backoffice.merchant_manager.add_user_to_payed_roles(purchase_data=purchase_data):
                                 purchase_role_data = {
                                     "roleStart": f"{start} UTC",
                                     "roleEnd": end,
@@ -234,11 +233,6 @@ class ConsumerCommands(commands.Cog):
                                     f'{ticker}.roleTxCount': int(1),
                                 }
 
-                                # Update user purchase stats
-                                await self.backoffice.stats_manager.as_update_role_purchase_stats(
-                                    user_id=ctx.message.author.id,
-                                    merchant_data=user_stats_update)
-
                                 global_merchant_stats = {
                                     'totalSpentInUsd': convert_to_dollar,
                                     'totalSpentInXlm': role_value_rounded
@@ -249,36 +243,31 @@ class ConsumerCommands(commands.Cog):
                                     "merchantMoved": role_value_rounded
                                 }
 
-                                # Update merchant stats of CL
-                                await self.backoffice.stats_manager.update_cl_merchant_stats(ticker='xlm',
-                                                                                             merchant_stats=global_merchant_stats,
-                                                                                             ticker_stats=global_ticker_stats)
-
                                 guild_stats = {
                                     f"{ticker}.roleTxCount": 1,
                                     f"{ticker}.volume": role_value_rounded
 
                                 }
-                                # Update guild stats
-                                await self.backoffice.stats_manager.update_guild_stats(guild_id=ctx.message.guild.id,
-                                                                                       guild_stats_data=guild_stats)
 
-                                data = {
+                                community_stats = {
                                     "overallGained": role_value_rounded,
                                     "rolesObtained": 1
                                 }
-                                await self.backoffice.guild_profiles.update_stellar_community_wallet_stats(
-                                    guild_id=ctx.guild.id, data=data)
+
+                                # Update user, merchant, guild and community wallet stats at once
+                                await self.backoffice.stats_manager.apply_stats(
+                                    off_chain_stats={'xlm': global_ticker_stats,
+                                                     'merchant': global_merchant_stats},
+                                    user_stats={ctx.message.author.id: user_stats_update},
+                                    guild_stats={ctx.message.guild.id: guild_stats},
+                                    community_stats={ctx.guild.id: community_stats})
 
                                 # Send notifcications
-                                load_channels = [self.bot.get_channel(id=int(chn)) for chn in
-                                                 self.backoffice.guild_profiles.get_all_explorer_applied_channels()]
                                 explorer_msg = f':man_juggling: purchased in value {role_value_rounded} {CONST_STELLAR_EMOJI} ' \
                                                f'(${convert_to_dollar}) on ' \
                                                f'{ctx.message.guild}'
-                                await custom_messages.explorer_messages(applied_channels=load_channels,
-                                                                        message=explorer_msg, on_chain=False,
-                                                                        tx_type='role_purchase')
+                                await self.bot.explorer_queue.publish(message=explorer_msg, on_chain=False,
+                                                                      tx_type='role_purchase')
                         else:
                             message = f'Error while trying to deduct funds from user'
                             await custom_messages.system_message(ctx=ctx, message=message,
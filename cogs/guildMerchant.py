@@ -42,10 +42,10 @@ class MerchantCommunityOwner(commands.Cog):
         :return:
         """
 
-        if not self.merchant.check_if_community_exist(community_id=ctx.message.guild.id):  # Check if not registered
-            if self.merchant.register_community_wallet(community_id=ctx.message.guild.id,
-                                                       community_owner_id=ctx.message.author.id,
-                                                       community_name=f'{ctx.message.guild}'):  # register community wallet
+        if not await self.merchant.check_if_community_exist(community_id=ctx.message.guild.id):  # Check if not registered
+            if await self.merchant.register_community_wallet(community_id=ctx.message.guild.id,
+                                                             community_owner_id=ctx.message.author.id,
+                                                             community_name=f'{ctx.message.guild}'):  # register community wallet
                 msg_title = ':rocket: __Community Wallet Registration Status___ :rocket:'
                 message = f'You have successfully merchant system on ***{ctx.message.guild}***. You can proceed' \
                           f' with `{self.command_string}merchant` in order to familiarize yourself with all available' \
@@ -189,7 +189,7 @@ class MerchantCommunityOwner(commands.Cog):
                                 "status": "active"
                             }
 
-                            if self.merchant.register_role(new_role):
+                            if await self.merchant.register_role(new_role):
 
                                 # Send the message to the owner
                                 msg_title = ':convenience_store: __Merchant System Information___ :convenience_store: '
@@ -273,9 +273,9 @@ class MerchantCommunityOwner(commands.Cog):
         :param discord_role:
         :return:
         """
-        if self.merchant.find_role_details(role_id=discord_role.id):
-            if self.merchant.remove_monetized_role_from_system(role_id=discord_role.id,
-                                                               community_id=ctx.message.guild.id):
+        if await self.merchant.find_role_details(role_id=discord_role.id):
+            if await self.merchant.remove_monetized_role_from_system(role_id=discord_role.id,
+                                                                     community_id=ctx.message.guild.id):
                 await discord_role.delete()
                 title = ':convenience_store: Merchant System Notification__:convenience_store: '
                 message = f'Monetized role has been successfully removed from the Crypto Link Merchant System, ' \
@@ -299,11 +299,11 @@ class MerchantCommunityOwner(commands.Cog):
         Command used to change activity status of the role
         """
 
-        role_details = self.merchant.find_role_details(role_id=role.id)
+        role_details = await self.merchant.find_role_details(role_id=role.id)
         if role_details:
             if role_details['status'] == 'active':
                 role_details['status'] = 'inactive'
-                if self.merchant.change_role_details(role_data=role_details):
+                if await self.merchant.change_role_details(role_data=role_details):
                     title = '__Role status change notification__'
                     message = f'Role has been deactivated successfully. in order to re-activate it and make it ' \
                               f'available to users again, use command' \
@@ -338,11 +338,11 @@ class MerchantCommunityOwner(commands.Cog):
         :return:
         """
 
-        role_details = self.merchant.find_role_details(role_id=role.id)
+        role_details = await self.merchant.find_role_details(role_id=role.id)
         if role_details:
             if role_details['status'] == 'inactive':
                 role_details['status'] = 'active'
-                if self.merchant.change_role_details(role_data=role_details):
+                if await self.merchant.change_role_details(role_data=role_details):
                     title = '__Role status change notification__'
                     message = f'Role {role} has been re-activate successfully.'
                     await customMessages.system_message(ctx=ctx, sys_msg_title=title, message=message, color_code=0,
@@ -375,7 +375,7 @@ class MerchantCommunityOwner(commands.Cog):
         :return:
         """
 
-        roles = self.merchant.get_all_roles_community(community_id=ctx.message.guild.id)
+        roles = await self.merchant.get_all_roles_community(community_id=ctx.message.guild.id)
         title = f':circus_tent: __Available Roles on Community {ctx.message.guild}__ :circus_tent: '
         description = 'Details on monetized role.'
         if roles:
@@ -421,7 +421,7 @@ class MerchantCommunityOwner(commands.Cog):
         :param ctx:
         :return:
         """
-        data = self.merchant.get_wallet_balance(community_id=ctx.message.guild.id)
+        data = await self.merchant.get_wallet_balance(community_id=ctx.message.guild.id)
 
         if data:
             stellar_balance = data['xlm']
@@ -461,7 +461,7 @@ class MerchantCommunityOwner(commands.Cog):
         current_time = datetime.utcnow()
 
         # Fee limits on Crypto Link system for merchant
-        withdrawal_min = self.backoffice.bot_manager.get_fees_by_category(key='merchant_min')  # Minimum withdrawal in $
+        withdrawal_min = await self.backoffice.bot_manager.get_fees_by_category(key='merchant_min')  # Minimum withdrawal in $
         withdrawal_min_dollar = withdrawal_min['fee']  # #TODO set high minimum in db after deployment
 
         min_in_xlm = convert_to_currency(withdrawal_min_dollar,
@@ -477,13 +477,13 @@ class MerchantCommunityOwner(commands.Cog):
             withdrawal_limit_stroops = min_in_xlm['total']  # Stroop value of minimal withdrawal limit
 
             # community wallet balance in stroops
-            com_balance_stroops = self.merchant.get_balance_based_on_ticker(community_id=ctx.message.guild.id,
-                                                                            ticker=ticker)  # Stroops returned
+            com_balance_stroops = await self.merchant.get_balance_based_on_ticker(community_id=ctx.message.guild.id,
+                                                                                  ticker=ticker)  # Stroops returned
 
             # balance of community needs to be greater than final withdrawal limit and final fee stroops
             if com_balance_stroops >= withdrawal_limit_stroops:
 
-                wallet_transfer_fee = self.backoffice.bot_manager.get_fees_by_category(
+                wallet_transfer_fee = await self.backoffice.bot_manager.get_fees_by_category(
                     key='wallet_transfer')  # Percentage as INT
 
                 fee_perc = wallet_transfer_fee['fee']
@@ -494,24 +494,24 @@ class MerchantCommunityOwner(commands.Cog):
                 net_owner = com_balance_stroops - cl_earnings  # Earning for the community wallet
 
                 # Empty the community wallet
-                if self.merchant.modify_funds_in_community_merchant_wallet(direction=1,
-                                                                           community_id=ctx.message.guild.id,
-                                                                           wallet_tick='xlm',
-                                                                           amount=com_balance_stroops):
+                if await self.merchant.modify_funds_in_community_merchant_wallet(direction=1,
+                                                                                 community_id=ctx.message.guild.id,
+                                                                                 wallet_tick='xlm',
+                                                                                 amount=com_balance_stroops):
 
                     # Notification channel
                     notification_channel = self.bot.get_channel(id=int(self.merchant_channel_info))
                     # credit fee to launch pad investment wallet
 
-                    if self.backoffice.bot_manager.update_cl_wallet_balance(to_update={"balance": cl_earnings},
-                                                                            ticker='xlm'):
+                    if await self.backoffice.bot_manager.update_cl_wallet_balance(to_update={"balance": cl_earnings},
+                                                                                  ticker='xlm'):
 
                         # Append withdrawal amount to the community owner personal wallet
-                        if self.backoffice.account_mng.update_user_wallet_balance(discord_id=ctx.author.id,
-                                                                                  ticker='xlm',
-                                                                                  # TODO fix this when multi
-                                                                                  direction=0,
-                                                                                  amount=net_owner):
+                        if await self.backoffice.account_mng.update_user_wallet_balance(discord_id=ctx.author.id,
+                                                                                        ticker='xlm',
+                                                                                        # TODO fix this when multi
+                                                                                        direction=0,
+                                                                                        amount=net_owner):
 
                             info_embed = Embed(
                                 title=' :money_with_wings: __Community account Transaction details__  '
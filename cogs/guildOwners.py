@@ -10,6 +10,8 @@ customMessages = CustomMessages()
 CONST_STELLAR_EMOJI = '<:stelaremoji:684676687425961994>'
 CONST_SYS_ERROR = '__System error__'
 CONST_SYS_MSG = '__System Message__'
+CONST_MIN_DIGEST_INTERVAL = 30  # Seconds
+CONST_MAX_DIGEST_INTERVAL = 3600  # Seconds
 
 
 class GuildOwnerCommands(commands.Cog):
@@ -42,11 +44,11 @@ class GuildOwnerCommands(commands.Cog):
     @owner.command()
     @commands.check(has_wallet)
     async def register(self, ctx):
-        if not self.backoffice.guild_profiles.check_guild_registration_stats(guild_id=ctx.guild.id):
+        if not await self.backoffice.guild_profiles.check_guild_registration_stats(guild_id=ctx.guild.id):
             new_guild = {
                 "guildId": ctx.message.guild.id,
                 "guildName": f'{ctx.guild}',
-                "explorerSettings": {"channelId": int(0)},
+                "explorerSettings": {"channelId": int(0), "digestInterval": int(0)},
                 "txFees": {"xlmFeeValue": int(0)},
                 "registeredUsers": 0,
                 "xlm": {"volume": float(0.0),
@@ -122,7 +124,9 @@ class GuildOwnerCommands(commands.Cog):
                 {"name": "Apply Channel for CL feed",
                  "value": f"`{self.command_string}owner uplink apply <#discord.Channel>`"},
                 {"name": "Remove Channel for CL feed",
-                 "value": f"`{self.command_string}owner uplink remove`"}
+                 "value": f"`{self.command_string}owner uplink remove`"},
+                {"name": "Summarize CL feed into one message per interval (0 turns it off)",
+                 "value": f"`{self.command_string}owner uplink digest <seconds>`"}
             ]
 
             await customMessages.embed_builder(ctx=ctx, title=title, description=description, data=list_of_values,
@@ -162,6 +166,33 @@ class GuildOwnerCommands(commands.Cog):
                                                                                'Please try again later',
                                                 destination=ctx.message.channel, sys_msg_title=CONST_SYS_ERROR)
 
+    @uplink.command()
+    async def digest(self, ctx, interval: int):
+        if interval != 0 and not CONST_MIN_DIGEST_INTERVAL <= interval <= CONST_MAX_DIGEST_INTERVAL:
+            await customMessages.system_message(ctx=ctx, color_code=1,
+                                                message=f'Digest interval needs to be between '
+                                                        f'{CONST_MIN_DIGEST_INTERVAL} and {CONST_MAX_DIGEST_INTERVAL} '
+                                                        f'seconds, or 0 to receive every activity as it happens.',
+                                                destination=ctx.message.channel, sys_msg_title=CONST_SYS_ERROR)
+            return
+
+        data_to_update = {
+            "explorerSettings.digestInterval": int(interval)
+        }
+
+        if await self.backoffice.guild_profiles.update_guild_profile(guild_id=ctx.guild.id,
+                                                                     data_to_update=data_to_update):
+            if interval > 0:
+                message = f'Crypto Link Network Activity feed will be summarized every {interval} seconds'
+            else:
+                message = f'Crypto Link Network Activity feed will stream every activity as it happens'
+            await customMessages.system_message(ctx=ctx, color_code=0, message=message,
+                                                destination=ctx.message.author, sys_msg_title=CONST_SYS_MSG)
+        else:
+            await customMessages.system_message(ctx=ctx, color_code=1, message='There has been an issue while trying'
+                                                                               'to update data.',
+                                                destination=ctx.message.channel, sys_msg_title=CONST_SYS_ERROR)
+
     @owner.group(aliases=['merchant'])
     @commands.check(is_owner)
     @commands.check(has_wallet)
@@ -182,10 +213,10 @@ class GuildOwnerCommands(commands.Cog):
 
     @merch.command()
     async def open(self, ctx):
-        if not self.merchant.check_if_community_exist(community_id=ctx.message.guild.id):  # Check if not registered
-            if self.merchant.register_community_wallet(community_id=ctx.message.guild.id,
-                                                       community_owner_id=ctx.message.author.id,
-                                                       community_name=f'{ctx.message.guild}'):  # register community wallet
+        if not await self.merchant.check_if_community_exist(community_id=ctx.message.guild.id):  # Check if not registered
+            if await self.merchant.register_community_wallet(community_id=ctx.message.guild.id,
+                                                             community_owner_id=ctx.message.author.id,
+                                                             community_name=f'{ctx.message.guild}'):  # register community wallet
                 msg_title = ':rocket: __Community Wallet Registration Status___ :rocket:'
                 message = f'You have successfully merchant system on ***{ctx.message.guild}***. You can proceed' \
                           f' with `{self.command_string}merchant` in order to familiarize yourself with all available' \
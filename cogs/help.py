@@ -213,7 +213,11 @@ class HelpCommands(commands.Cog):
                       f"Example:`{self.command_string}send 10 xlm @animus Have a nice day`"},
             {"name": f":detective: Private transactions :detective:  ",
              "value": f"`{self.command_string}private <@Discord User> <amount> <ticker> <message=optional>`\n"
-                      f"Example: `{self.command_string}private 10 xlm @animus Dont tell anyone`"}
+                      f"Example: `{self.command_string}private 10 xlm @animus Dont tell anyone`"},
+            {"name": f":parachute: Multi transactions :parachute: ",
+             "value": f"`{self.command_string}multi <amount> <ticker> <@Discord Users/@Roles> <message=optional>`\n"
+                      f"Amount is sent to each recipient\n"
+                      f"Example: `{self.command_string}multi 1 xlm @animus @Builders Thanks for building`"}
         ]
 
         await custom_messages.embed_builder(ctx=ctx, title=title, description=description, data=list_of_values,
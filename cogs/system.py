@@ -110,7 +110,7 @@ class BotManagementCommands(commands.Cog):
         """
         Check the off-chain balance status of Crypto Link system
         """
-        data = self.backoffice.bot_manager.get_bot_wallets_balance()
+        data = await self.backoffice.bot_manager.get_bot_wallets_balance()
         values = Embed(title="Balance of Crypto-Link Off chain balance",
                        description="Current state of Crypto Link Lumen wallet",
                        color=Colour.blurple())
@@ -128,7 +128,7 @@ class BotManagementCommands(commands.Cog):
         """
         Statistical information on Crypto Link system
         """
-        data = self.backoffice.stats_manager.get_all_stats()
+        data = await self.backoffice.stats_manager.get_all_stats()
         cl_off_chain = data["xlm"]["offChain"]
         cl_on_chain = data['xlm']['onChain']
 
@@ -187,7 +187,7 @@ class BotManagementCommands(commands.Cog):
 
     @cl.command()
     async def bridges(self, ctx):
-        stats = self.backoffice.stats_manager.get_top_builders(limit=10)
+        stats = await self.backoffice.stats_manager.get_top_builders(limit=10)
 
         bridges = '\U0001F309'
         string = ''
@@ -214,31 +214,32 @@ class BotManagementCommands(commands.Cog):
         Transfer funds from Crypto Link to develop wallet
         """
         if ticker in list(integrated_coins.keys()):
-            balance = int(self.backoffice.bot_manager.get_bot_wallet_balance_by_ticker(ticker=ticker))
+            balance = int(await self.backoffice.bot_manager.get_bot_wallet_balance_by_ticker(ticker=ticker))
             print(balance)
             if balance > 0:  # Check if balance greater than -
                 # Checks if recipient exists
-                if not self.backoffice.account_mng.check_user_existence(user_id=ctx.message.author.id):
-                    self.backoffice.account_mng.register_user(discord_id=ctx.message.author.id,
-                                                              discord_username=f'{ctx.message.author}')
+                if not await self.backoffice.account_mng.check_user_existence(user_id=ctx.message.author.id):
+                    await self.backoffice.account_mng.register_user(discord_id=ctx.message.author.id,
+                                                                    discord_username=f'{ctx.message.author}')
 
-                if self.backoffice.stellar_manager.update_stellar_balance_by_discord_id(
-                        discord_id=ctx.message.author.id,
-                        stroops=int(balance), direction=1):
+                if await self.backoffice.stellar_manager.update_stellar_balance_by_discord_id(
+                              discord_id=ctx.message.author.id,
+                              stroops=int(balance), direction=1):
                     # Deduct the balance from the community balance
-                    if self.backoffice.bot_manager.update_lpi_wallet_balance(amount=balance, wallet="xlm", direction=2):
+                    if await self.backoffice.bot_manager.update_cl_wallet_balance(ticker="xlm",
+                                                                                  to_update={"balance": -int(balance)}):
                         # Store in history and send notifications to owner and to channel
                         dec_point = 7
                         normal_amount = get_normal(str(balance), decimal_point=dec_point)
 
                         # Store into the history of corporate transfers
-                        self.backoffice.corporate_hist_mng.store_transfer_from_corp_wallet(time_utc=int(time.time()),
-                                                                                           author=f'{ctx.message.author}',
-                                                                                           destination=int(
-                                                                                               ctx.message.author.id),
-                                                                                           amount_atomic=balance,
-                                                                                           amount=normal_amount,
-                                                                                           currency='xlm')
+                        await self.backoffice.corporate_hist_mng.store_transfer_from_corp_wallet(time_utc=int(time.time()),
+                                                                                                 author=f'{ctx.message.author}',
+                                                                                                 destination=int(
+                                                                                                     ctx.message.author.id),
+                                                                                                 amount_atomic=balance,
+                                                                                                 amount=normal_amount,
+                                                                                                 currency='xlm')
 
                         # notification to corp account discord channel
                         stellar_channel_id = auto_channels['stellar']
@@ -252,9 +253,9 @@ class BotManagementCommands(commands.Cog):
 
                     else:
                         # Revert the user balance if community balance can not be updated
-                        self.backoffice.stellar_manager.update_stellar_balance_by_discord_id(
-                            discord_id=ctx.message.author.id,
-                            stroops=int(balance), direction=2)
+                        await self.backoffice.stellar_manager.update_stellar_balance_by_discord_id(
+                                  discord_id=ctx.message.author.id,
+                                  stroops=int(balance), direction=2)
 
                         message = f"Stellar funds could not be deducted from corporate account. Please try again later"
                         await custom_messages.system_message(ctx, color_code=1, message=message, destination=0,
@@ -460,7 +461,7 @@ class BotManagementCommands(commands.Cog):
         """
         Check Stellar hot wallet details
         """
-        data = self.backoffice.stellar_wallet.get_stellar_hot_wallet_details()
+        data = await self.backoffice.stellar_wallet.get_stellar_hot_wallet_details()
 
         if data:
             bal_start = Embed(title='Stellar hot wallet details',
@@ -489,7 +490,7 @@ class BotManagementCommands(commands.Cog):
 
     @commands.command()
     async def fees(self, ctx):
-        fees = self.backoffice.bot_manager.get_all_fees()
+        fees = await self.backoffice.bot_manager.get_all_fees()
         fee_info = Embed(title='Applied fees for system',
                          description='State of fees for each segment of the bot',
                          colour=Colour.blue())
@@ -577,7 +578,7 @@ class BotManagementCommands(commands.Cog):
             fee_data = {
                 f"fee_list.{ticker}": rounded
             }
-            if self.backoffice.bot_manager.manage_fees_and_limits(key='withdrawals', data_to_update=fee_data):
+            if await self.backoffice.bot_manager.manage_fees_and_limits(key='withdrawals', data_to_update=fee_data):
                 message = f'You have successfully set Stellar Lumen withdrawal fee to be {rounded}$.'
                 await custom_messages.system_message(ctx=ctx, color_code=0, message=message, destination=1,
                                                      sys_msg_title=CONST_FEE_INFO)
@@ -606,7 +607,7 @@ class BotManagementCommands(commands.Cog):
         merch_data = {
             f"fee": rounded
         }
-        if self.backoffice.bot_manager.manage_fees_and_limits(key='merchant_min', data_to_update=merch_data):
+        if await self.backoffice.bot_manager.manage_fees_and_limits(key='merchant_min', data_to_update=merch_data):
             message = f'You have successfully set merchant minimum withdrawal to be {rounded}$ per currency used.'
             await custom_messages.system_message(ctx=ctx, color_code=0, message=message, destination=1,
                                                  sys_msg_title=CONST_MERCHANT_LICENSE_CHANGE)
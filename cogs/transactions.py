@@ -1,13 +1,16 @@
+from typing import Union
+
 from discord.ext import commands
-from discord import User
+from discord import User, Member, Role
 import re
-from cogs.utils import monetaryConversions
+from cogs.utils.priceCache import price_cache
 from utils.customCogChecks import is_public, has_wallet
 from cogs.utils.systemMessaages import CustomMessages
 
 custom_messages = CustomMessages()
 CONST_STELLAR_EMOJI = '<:stelaremoji:684676687425961994>'
 CONST_TX_ERROR_TITLE = ":exclamation: __Transaction Error__ :exclamation: "
+CONST_MULTI_MAX_RECIPIENTS = 500
 
 
 def process_message(message):
@@ -83,18 +86,12 @@ class TransactionCommands(commands.Cog):
         """
         processed_stats = self.build_stats(transaction_data=transaction_data, tx_type=tx_type)
 
-        # Update stats stats
-        await self.backoffice.stats_manager.update_cl_off_chain_stats(ticker=transaction_data["ticker"],
-                                                                      ticker_stats=processed_stats["globalBot"])
-
-        # Updates sender and recipient public transaction stats
-        await self.backoffice.stats_manager.update_usr_tx_stats(user_id=ctx.message.author.id,
-                                                                tx_stats_data=processed_stats['senderStats'])
-        await self.backoffice.stats_manager.update_usr_tx_stats(user_id=transaction_data["recipientId"],
-                                                                tx_stats_data=processed_stats["recipientStats"])
-
-        await self.backoffice.stats_manager.update_guild_stats(guild_id=ctx.message.guild.id,
-                                                               guild_stats_data=processed_stats["guildStats"])
+        # Global bot, sender, recipient and guild stats in single round trip per collection
+        await self.backoffice.stats_manager.apply_stats(
+            off_chain_stats={transaction_data["ticker"]: processed_stats["globalBot"]},
+            user_stats={ctx.message.author.id: processed_stats['senderStats'],
+                        transaction_data["recipientId"]: processed_stats["recipientStats"]},
+            guild_stats={ctx.message.guild.id: processed_stats["guildStats"]})
 
     async def stream_transaction(self, ctx, recipient, tx_details: dict, message: str, tx_type: str):
         """
@@ -105,14 +102,14 @@ class TransactionCommands(commands.Cog):
         msg = process_message(message=message)
 
         # Send to channel where tx has been executed
-        if tx_details['ticker'] == 'stellar':
-            in_dollar = monetaryConversions.convert_to_usd(amount=tx_details["amount"], coin_name='stellar')
+        usd_price = price_cache.get_ticker_price(ticker=tx_details['ticker'], vs_currency='usd')
+        if usd_price:
+            total_dollar_value = round(float(tx_details["amount"] * usd_price), 6)
             tx_report_msg = f"{recipient.mention} member {ctx.message.author} just sent you {tx_details['amount']:.7f}" \
-                            f" {tx_details['emoji']} (${in_dollar['total']:.4f})"
-            explorer_msg = f'💵  {tx_details["amount"]:.7f} {CONST_STELLAR_EMOJI} (${in_dollar["total"]:.4f}) on ' \
+                            f" {tx_details['emoji']} (${total_dollar_value:.4f})"
+            explorer_msg = f'💵  {tx_details["amount"]:.7f} {tx_details["emoji"]} (${total_dollar_value:.4f}) on ' \
                            f'{ctx.message.guild} channel {ctx.message.channel}'
-            total_dollar_value = in_dollar['total']
-            conversion_rate = in_dollar["usd"]
+            conversion_rate = usd_price
         else:
             tx_report_msg = f"{recipient.mention} member {ctx.message.author} just sent you {tx_details['amount']}" \
                             f" {tx_details['emoji']}"
@@ -139,11 +136,7 @@ class TransactionCommands(commands.Cog):
                                                          message=msg)
 
         # Send out explorer
-        load_channels = [self.bot.get_channel(id=int(chn)) for chn in
-                         self.backoffice.guild_profiles.get_all_explorer_applied_channels()]
-
-        await custom_messages.explorer_messages(applied_channels=load_channels,
-                                                message=explorer_msg, tx_type=tx_type)
+        await self.bot.explorer_queue.publish(message=explorer_msg, tx_type=tx_type)
 
     async def send_impl(self, ctx, amount: float, ticker: str, recipient: User, *, tx_type: str, message: str = None):
         coin = ticker.lower()
@@ -153,72 +146,58 @@ class TransactionCommands(commands.Cog):
                     coin_data = self.backoffice.integrated_coins[ticker]
                     atomic_value = (int(amount * (10 ** 7)))
 
-                    # Get user wallet ticker balance
-                    wallet_value = self.backoffice.wallet_manager.get_ticker_balance(ticker=ticker,
-                                                                                     user_id=ctx.message.author.id)
-                    if wallet_value >= atomic_value:
-                        # Check if recipient has wallet or not
-                        if not self.backoffice.account_mng.check_user_existence(user_id=recipient.id):
-                            self.backoffice.account_mng.register_user(discord_id=recipient.id,
-                                                                      discord_username=f'{recipient}')
-
-                            # Update user count in guild system
-                            await self.backoffice.stats_manager.update_registered_users(guild_id=ctx.message.guild.id)
-
-                            # Increase bridge
-                            await self.backoffice.stats_manager.create_bridge(user_id=ctx.message.author.id)
-
+                    # Check if recipient has wallet or not, new wallet is bridged only if sender can cover the amount
+                    if not await self.backoffice.account_mng.check_user_existence(user_id=recipient.id):
+                        wallet_value = await self.backoffice.wallet_manager.get_ticker_balance(
+                            ticker=ticker, user_id=ctx.message.author.id)
+                        if wallet_value < atomic_value:
+                            message = f'You have insufficient balance! Your current wallet balance is' \
+                                      f' {wallet_value / (10**7)} XLM'
+                            await custom_messages.system_message(ctx=ctx, color_code=1, message=message,
+                                                                 destination=1, sys_msg_title=CONST_TX_ERROR_TITLE)
+                            return
 
-                            # Send up link
-                            load_channels = [self.bot.get_channel(id=int(chn)) for chn in
-                                             self.backoffice.guild_profiles.get_all_explorer_applied_channels()]
-                            current_total = self.backoffice.account_mng.count_registrations()
+                        await self.backoffice.account_mng.register_user(discord_id=recipient.id,
+                                                                        discord_username=f'{recipient}')
 
-                            explorer_msg = f':new: user registered into ***{self.bot.user} System*** (Σ {current_total})'
-                            for chn in load_channels:
-                                await chn.send(content=explorer_msg)
+                        # Update user count in guild system
+                        await self.backoffice.stats_manager.update_registered_users(guild_id=ctx.message.guild.id)
 
-                            await custom_messages.bridge_notification(ctx,recipient=recipient)
+                        # Increase bridge
+                        await self.backoffice.stats_manager.create_bridge(user_id=ctx.message.author.id)
 
+                        # Send up link
+                        current_total = await self.backoffice.account_mng.count_registrations()
 
+                        explorer_msg = f':new: user registered into ***{self.bot.user} System*** (Σ {current_total})'
+                        await self.bot.explorer_queue.publish(message=explorer_msg, on_chain=True)
 
-                        # Deduct balance from sender
-                        if self.backoffice.wallet_manager.update_coin_balance(coin=ticker,
-                                                                              user_id=ctx.message.author.id,
-                                                                              amount=int(atomic_value), direction=2):
-                            # Append to recipient
-                            if self.backoffice.wallet_manager.update_coin_balance(coin=ticker, user_id=recipient.id,
-                                                                                  amount=int(atomic_value),
-                                                                                  direction=1):
-                                coin_data["amount"] = (atomic_value / (10 ** 7))
-                                coin_data["ticker"] = ticker
+                        await custom_messages.bridge_notification(ctx,recipient=recipient)
 
-                                # Produce dict for streamer
-                                await self.stream_transaction(ctx=ctx, recipient=recipient, tx_details=coin_data,
-                                                              message=message, tx_type=tx_type)
+                    # Debit sender only if balance covers the amount and credit recipient atomically
+                    if await self.backoffice.wallet_manager.transfer(coin=ticker,
+                                                                     sender_id=ctx.message.author.id,
+                                                                     recipient_id=recipient.id,
+                                                                     amount=int(atomic_value)):
+                        coin_data["amount"] = (atomic_value / (10 ** 7))
+                        coin_data["ticker"] = ticker
 
-                                coin_data["recipientId"] = recipient.id
+                        # Produce dict for streamer
+                        await self.stream_transaction(ctx=ctx, recipient=recipient, tx_details=coin_data,
+                                                      message=message, tx_type=tx_type)
 
-                                await self.update_stats(ctx=ctx, transaction_data=coin_data, tx_type=tx_type)
+                        coin_data["recipientId"] = recipient.id
 
-                            else:
-                                self.backoffice.wallet_manager.update_coin_balance(coin=ticker,
-                                                                                   user_id=ctx.message.author.id,
-                                                                                   amount=int(atomic_value),
-                                                                                   direction=1)
-                                message = f'{amount} XLA could not be sent to the {recipient} please try again later'
-                                await custom_messages.system_message(ctx=ctx, color_code=1, message=message,
-                                                                     destination=1,
-                                                                     sys_msg_title=CONST_TX_ERROR_TITLE)
+                        await self.update_stats(ctx=ctx, transaction_data=coin_data, tx_type=tx_type)
 
+                    else:
+                        wallet_value = await self.backoffice.wallet_manager.get_ticker_balance(
+                            ticker=ticker, user_id=ctx.message.author.id)
+                        if wallet_value < atomic_value:
+                            message = f'You have insufficient balance! Your current wallet balance is' \
+                                      f' {wallet_value / (10**7)} XLM'
                         else:
                             message = f'There has been an error while making P2P transaction please try again later'
-                            await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=1,
-                                                                 sys_msg_title=CONST_TX_ERROR_TITLE)
-                    else:
-
-                        message = f'You have insufficient balance! Your current wallet balance is' \
-                                  f' {wallet_value / (10**7)} XLM'
                         await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=1,
                                                              sys_msg_title=CONST_TX_ERROR_TITLE)
                 else:
@@ -252,6 +231,118 @@ class TransactionCommands(commands.Cog):
     async def private(self, ctx, recipient: User, amount: float, ticker: str, *, message: str = None):
         await self.send_impl(ctx, amount, ticker.lower(), recipient, tx_type="private", message=message)
 
+    @commands.command(aliases=['rain'])
+    @commands.check(is_public)
+    @commands.check(has_wallet)
+    @commands.cooldown(1, 60, commands.BucketType.user)
+    async def multi(self, ctx, amount: float, ticker: str, targets: commands.Greedy[Union[Member, Role]], *,
+                    message: str = None):
+        """
+        Send same amount to each of mentioned members and members of mentioned roles
+        """
+        ticker = ticker.lower()
+        atomic_value = int(amount * (10 ** 7))
+        if atomic_value <= 0:
+            message = 'Amount needs to be greater than 0.0000000 XLM'
+            await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=1,
+                                                 sys_msg_title=CONST_TX_ERROR_TITLE)
+            return
+
+        if re.search("[~!#$%^&*()_+{}:;\']", ticker) or ticker not in self.list_of_coins:
+            message = f'Coin {ticker} has not been integrated yet into {self.bot.user}.'
+            await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=1,
+                                                 sys_msg_title=CONST_TX_ERROR_TITLE)
+            return
+
+        # Unique recipients from mentions and roles, without bots and sender
+        recipients = {}
+        for target in targets:
+            for member in (target.members if isinstance(target, Role) else [target]):
+                if not member.bot and member.id != ctx.message.author.id:
+                    recipients[member.id] = member
+        recipients = list(recipients.values())
+
+        if not recipients or len(recipients) > CONST_MULTI_MAX_RECIPIENTS:
+            message = f'Multi transaction requires between 1 and {CONST_MULTI_MAX_RECIPIENTS} recipients other ' \
+                      f'than yourself and bots. Mention members or roles after amount and ticker.'
+            await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=1,
+                                                 sys_msg_title=CONST_TX_ERROR_TITLE)
+            return
+
+        total_atomic = atomic_value * len(recipients)
+
+        # Bridge recipients without wallet in bulk, only if sender can cover the total
+        registered = await self.backoffice.account_mng.get_registered_users(
+            user_ids=[recipient.id for recipient in recipients])
+        missing = [recipient for recipient in recipients if recipient.id not in registered]
+        bridges = []
+        if missing:
+            wallet_value = await self.backoffice.wallet_manager.get_ticker_balance(ticker=ticker,
+                                                                                   user_id=ctx.message.author.id)
+            if wallet_value < total_atomic:
+                message = f'You have insufficient balance! Your current wallet balance is' \
+                          f' {wallet_value / (10 ** 7)} XLM'
+                await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=1,
+                                                     sys_msg_title=CONST_TX_ERROR_TITLE)
+                return
+            bridges = await self.backoffice.account_mng.register_users(
+                users=[(recipient.id, f'{recipient}') for recipient in missing])
+
+        # Debit sender once and credit all recipients atomically
+        credited = await self.backoffice.wallet_manager.multi_transfer(coin=ticker, sender_id=ctx.message.author.id,
+                                                                       recipient_ids=[recipient.id for recipient in
+                                                                                      recipients],
+                                                                       amount=atomic_value)
+        recipients = [recipient for recipient in recipients if recipient.id in credited]
+        if not recipients:
+            wallet_value = await self.backoffice.wallet_manager.get_ticker_balance(ticker=ticker,
+                                                                                   user_id=ctx.message.author.id)
+            if wallet_value < total_atomic:
+                message = f'You have insufficient balance! Your current wallet balance is' \
+                          f' {wallet_value / (10 ** 7)} XLM'
+            else:
+                message = f'There has been an error while making multi transaction please try again later'
+            await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=1,
+                                                 sys_msg_title=CONST_TX_ERROR_TITLE)
+            return
+
+        tx_details = self.backoffice.integrated_coins[ticker].copy()
+        tx_details["amount"] = atomic_value / (10 ** 7)
+        tx_details["total"] = atomic_value * len(recipients) / (10 ** 7)
+
+        await custom_messages.multi_transaction_report(ctx=ctx, recipients=recipients, tx_details=tx_details,
+                                                       bridges=len(bridges), message=process_message(message))
+
+        if bridges:
+            current_total = await self.backoffice.account_mng.count_registrations()
+            explorer_msg = f':new: {len(bridges)} users registered into ***{self.bot.user} System*** ' \
+                           f'(Σ {current_total})'
+            await self.bot.explorer_queue.publish(message=explorer_msg, on_chain=True)
+        explorer_msg = f':parachute: {tx_details["total"]:.7f} {tx_details["emoji"]} to {len(recipients)} members ' \
+                       f'on {ctx.message.guild} channel {ctx.message.channel}'
+        await self.bot.explorer_queue.publish(message=explorer_msg)
+
+        # Sender, guild and global stats including new bridges
+        sender_stats = {f"{ticker}.multiTxCount": 1,
+                        f"{ticker}.multiTotalCount": tx_details["total"]}
+        guild_stats = {f"{ticker}.multiTxCount": 1,
+                       f"{ticker}.txCount": 1,
+                       f"{ticker}.volume": tx_details["total"]}
+        if bridges:
+            sender_stats["bridges"] = len(bridges)
+            guild_stats["registeredUsers"] = len(bridges)
+        await self.backoffice.stats_manager.apply_stats(
+            off_chain_stats={ticker: {"totalTx": 1,
+                                      "totalMoved": tx_details["total"],
+                                      "multiTxCount": 1,
+                                      "multiTxMoved": tx_details["total"]}},
+            user_stats={ctx.message.author.id: sender_stats},
+            guild_stats={ctx.message.guild.id: guild_stats})
+
+    @multi.error
+    async def multi_error(self, ctx, error):
+        await self.send_error(ctx, error)
+
     @send.error
     async def send_error(self, ctx, error):
         if isinstance(error, commands.CheckFailure):
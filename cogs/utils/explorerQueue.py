@@ -0,0 +1,166 @@
+"""
+Background broadcast queue delivering explorer messages to all subscribed channels
+"""
+
+import asyncio
+from datetime import datetime
+
+from discord import errors, Embed, Colour
+from colorama import Fore, init
+
+from cogs.utils.systemMessaages import CustomMessages
+
+init(autoreset=True)
+
+CONST_EXPLORER_CONCURRENCY = 10  # Maximum number of channels sent to at the same time
+CONST_COALESCE_DELAY = 1  # Seconds messages are collected for the channel before being sent out
+CONST_MESSAGE_LIMIT = 2000  # Discord message length limit
+CONST_EMBED_DESCRIPTION_LIMIT = 2048  # Discord embed description length limit
+
+
+class ExplorerQueue:
+    """
+    Explorer fan out running in the background. Messages are appended to per channel buffers and each channel has at
+    most one send in flight, so requests stay within Discord per channel route bucket while different channels are
+    served concurrently with bounded parallelism. Messages arriving while channel is busy are coalesced into single
+    digest message. Channels in digest mode collect messages for the whole interval applied by guild owner and
+    receive one summary embed. Channels which Discord reports as gone or forbidden are removed from explorer feed.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.guild_profiles = bot.backoffice.guild_profiles
+        self.semaphore = None  # Created lazily so it binds to the running loop
+        self.pending = {}  # channelId --> list of messages waiting to be sent
+        self.intervals = {}  # channelId --> digest interval in seconds, 0 when messages are streamed
+        self.workers = {}  # channelId --> task delivering messages to the channel
+
+    async def publish(self, message: str, tx_type: str = None, on_chain: bool = None):
+        """
+        Queue message for all explorer applied channels and return immediately
+        :param message: Message to be streamed
+        :param tx_type: type of off-chain transaction used to filter message content
+        :param on_chain: True if message is sent as is
+        """
+        if not on_chain and tx_type:
+            message = CustomMessages.filter_message(message=message, tx_type=tx_type)
+        if not message:
+            return
+
+        feed = await self.guild_profiles.get_explorer_feed()
+        for channel_id, interval in feed.items():
+            self.intervals[int(channel_id)] = interval
+            self.pending.setdefault(int(channel_id), []).append(message)
+            self.__schedule(channel_id=int(channel_id))
+
+    def __schedule(self, channel_id: int):
+        """
+        Start worker for the channel if it is not running already
+        """
+        worker = self.workers.get(channel_id)
+        if worker is None or worker.done():
+            self.workers[channel_id] = asyncio.get_event_loop().create_task(self.__deliver(channel_id=channel_id))
+
+    @staticmethod
+    def coalesce(messages: list) -> list:
+        """
+        Join messages into as few Discord messages as possible
+        """
+        digests = []
+        current = ''
+        for message in messages:
+            message = message[:CONST_MESSAGE_LIMIT]
+            if current and len(current) + len(message) + 1 > CONST_MESSAGE_LIMIT:
+                digests.append(current)
+                current = message
+            else:
+                current = f'{current}\n{message}' if current else message
+        if current:
+            digests.append(current)
+        return digests
+
+    @staticmethod
+    def digest_embed(messages: list, interval: int) -> Embed:
+        """
+        Summarize messages collected during digest interval into single embed
+        """
+        lines = []
+        length = 0
+        for message in messages:
+            length += len(message) + 1
+            if length > CONST_EMBED_DESCRIPTION_LIMIT - 50:
+                lines.append(f'... and {len(messages) - len(lines)} more')
+                break
+            lines.append(message)
+
+        digest = Embed(title=':satellite_orbital: Crypto Link Network Activity :satellite_orbital:',
+                       description='\n'.join(lines),
+                       colour=Colour.dark_gold(),
+                       timestamp=datetime.utcnow())
+        digest.set_footer(text=f'{len(messages)} events in last {interval} seconds')
+        return digest
+
+    async def __deliver(self, channel_id: int):
+        """
+        Send out messages buffered for the channel until buffer is empty
+        """
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(CONST_EXPLORER_CONCURRENCY)
+
+        # Deposits can be published by scheduler before channel cache is populated
+        await self.bot.wait_until_ready()
+
+        while self.pending.get(channel_id):
+            # Let the burst collect, channels in digest mode collect for the whole interval
+            interval = self.intervals.get(channel_id, 0)
+            await asyncio.sleep(interval if interval > 0 else CONST_COALESCE_DELAY)
+            messages = self.pending.pop(channel_id, [])
+
+            channel = await self.__get_channel(channel_id=channel_id)
+            if channel is None:
+                continue
+
+            async with self.semaphore:
+                if interval > 0:
+                    digests = [{"embed": self.digest_embed(messages=messages, interval=interval)}]
+                else:
+                    digests = [{"content": digest} for digest in self.coalesce(messages=messages)]
+
+                for digest in digests:
+                    try:
+                        await channel.send(**digest)
+                    except (errors.Forbidden, errors.NotFound) as e:
+                        await self.__drop_channel(channel_id=channel_id, reason=e.text)
+                        return
+                    except errors.HTTPException as e:
+                        print(Fore.RED + f'Explorer message could not be sent to {channel_id}: {e}')
+
+        self.workers.pop(channel_id, None)
+
+    async def __get_channel(self, channel_id: int):
+        """
+        Get channel from cache or from Discord if it is not cached. Channel is removed from explorer feed only when
+        Discord reports it as gone or forbidden, missing cache entry alone (unavailable guild) keeps subscription.
+        :return: channel or None if messages can not be delivered at this point
+        """
+        channel = self.bot.get_channel(id=channel_id)
+        if channel is not None:
+            return channel
+
+        try:
+            return await self.bot.fetch_channel(channel_id)
+        except (errors.Forbidden, errors.NotFound) as e:
+            await self.__drop_channel(channel_id=channel_id, reason=e.text)
+        except (errors.HTTPException, errors.InvalidData) as e:
+            print(Fore.YELLOW + f'Explorer channel {channel_id} currently not available, messages skipped: {e}')
+        return None
+
+    async def __drop_channel(self, channel_id: int, reason: str):
+        """
+        Remove channel from explorer feed
+        """
+        self.pending.pop(channel_id, None)
+        self.intervals.pop(channel_id, None)
+        self.workers.pop(channel_id, None)
+        await self.guild_profiles.remove_explorer_channel(channel_id=channel_id)
+        print(Fore.YELLOW + f'Channel {channel_id} removed from explorer feed: {reason}')
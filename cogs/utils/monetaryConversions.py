@@ -1,61 +1,53 @@
-from pycoingecko import CoinGeckoAPI
-
-gecko = CoinGeckoAPI()
+from cogs.utils.priceCache import price_cache
 
 
 def convert_to_currency(amount, coin_name):
     """
     Converts the amount to specific currency
     """
-    try:
-        data = gecko.get_price(ids=coin_name, vs_currencies='usd')
-        if coin_name == 'stellar':
-            usd_stellar = data['stellar']['usd']
-            conversion_to_xlm = amount / usd_stellar
-            xlm_to_stroops = int(conversion_to_xlm * (10 ** 7))
-            details = {
-                "usd": usd_stellar,
-                "total": xlm_to_stroops
-            }
-            return details
-    except Exception:
-        return {"error", "Some error with api"}
+    usd_price = price_cache.get_price(coin=coin_name, vs_currency='usd')
+    if not usd_price:
+        return {"error": "Price not available"}
+
+    if coin_name == 'stellar':
+        conversion_to_xlm = amount / usd_price
+        xlm_to_stroops = int(conversion_to_xlm * (10 ** 7))
+        details = {
+            "usd": usd_price,
+            "total": xlm_to_stroops
+        }
+        return details
 
 
 def get_rates(coin_name):
     """
     Getting rates for Stellar
     """
-    try:
-        data = gecko.get_price(ids=coin_name, vs_currencies='usd,eur,rub,btc,eth,ltc')
-        return data
-    except Exception:
-        return {}
+    return price_cache.get_prices(coin=coin_name, vs_currencies=['usd', 'eur', 'rub', 'btc', 'eth', 'ltc'])
 
 
 def convert_to_usd(amount, coin_name):
     """
     Function converts crypto value to $ and returns the per unit and total amount
     """
-    try:
-        data = gecko.get_price(ids=coin_name, vs_currencies='usd')
-        details = dict()
-        if coin_name == 'stellar':
-            usd_stellar = data['stellar']['usd']
-            details = {
-                "usd": usd_stellar,
-                "total": round(float(amount * usd_stellar), 6)
-
-            }
-        return details
-    except Exception as e:
+    usd_price = price_cache.get_price(coin=coin_name, vs_currency='usd')
+    if usd_price is None:
         details = {
             "usd": '0',
-            "total": f"{e}"
+            "total": "Price not available"
 
         }
         return details
 
+    details = dict()
+    if coin_name == 'stellar':
+        details = {
+            "usd": usd_price,
+            "total": round(float(amount * usd_price), 6)
+
+        }
+    return details
+
 
 def get_normal(value, decimal_point: int):
     """
@@ -0,0 +1,137 @@
+"""
+Shared price cache serving CoinGecko rates to all cogs without network calls on command execution
+"""
+
+import asyncio
+import time
+from types import MappingProxyType
+
+import aiohttp
+from colorama import Fore, init
+
+init(autoreset=True)
+
+CONST_PRICE_TTL = 60  # Seconds after which price is considered stale and refreshed in background
+CONST_GECKO_SIMPLE_PRICE = 'https://api.coingecko.com/api/v3/simple/price'
+CONST_GECKO_TIMEOUT = 10  # Seconds
+CONST_DEFAULT_COINS = ['stellar']
+CONST_DEFAULT_VS_CURRENCIES = ['usd', 'eur', 'rub', 'btc', 'eth', 'ltc']
+
+
+class PriceCache:
+    """
+    TTL cache of coin prices per vs currency. All tracked coins and currencies are fetched with single simple price
+    call and published as immutable snapshot. Reads are served from memory, stale entries trigger refresh in the
+    background (stale-while-revalidate) and last known good price is kept if refresh fails.
+    """
+
+    def __init__(self, ttl: int = CONST_PRICE_TTL):
+        self.ttl = ttl
+        self.coins = set(CONST_DEFAULT_COINS)
+        self.vs_currencies = set(CONST_DEFAULT_VS_CURRENCIES)
+        self.ticker_ids = {}  # Integrated coin ticker --> CoinGecko id
+        self.snapshot = MappingProxyType({})  # coin --> read only mapping of vs_currency --> price
+        self.fetched = {}  # (coin, vs_currency) --> time of fetch
+        self.refreshing = None  # Task of refresh in progress
+        self.session = None
+
+    def track(self, coin: str, vs_currencies: list = None):
+        """
+        Add coin and vs currencies to be refreshed
+        """
+        self.coins.add(coin)
+        if vs_currencies:
+            self.vs_currencies.update(vs_currencies)
+
+    def track_integrated_coins(self, integrated_coins: dict):
+        """
+        Track all coins from integratedCoins.json which are listed on CoinGecko
+        """
+        for ticker, coin in integrated_coins.items():
+            if coin.get("coinGeckoListing") and coin.get("coinGeckoId"):
+                self.ticker_ids[ticker] = coin["coinGeckoId"]
+                self.track(coin=coin["coinGeckoId"])
+
+    def is_stale(self, coin: str, vs_currency: str):
+        fetched = self.fetched.get((coin, vs_currency))
+        return fetched is None or time.time() - fetched > self.ttl
+
+    def get_price(self, coin: str, vs_currency: str = 'usd'):
+        """
+        Get cached price of the coin
+        :param coin: CoinGecko coin id
+        :param vs_currency: currency in which price is expressed
+        :return: price or None if price has never been obtained
+        """
+        if coin not in self.coins or vs_currency not in self.vs_currencies:
+            self.track(coin=coin, vs_currencies=[vs_currency])
+        if self.is_stale(coin=coin, vs_currency=vs_currency):
+            self.schedule_refresh()
+        return self.snapshot.get(coin, {}).get(vs_currency)
+
+    def get_ticker_price(self, ticker: str, vs_currency: str = 'usd'):
+        """
+        Get cached price of integrated coin by its ticker
+        :return: price or None if coin is not listed or price has never been obtained
+        """
+        coin = self.ticker_ids.get(ticker.lower())
+        if not coin:
+            return None
+        return self.get_price(coin=coin, vs_currency=vs_currency)
+
+    def get_prices(self, coin: str, vs_currencies: list):
+        """
+        Get cached prices in CoinGecko simple price response format
+        :return: {coin: {vs_currency: price}} with currencies which have price available
+        """
+        rates = dict()
+        for vs_currency in vs_currencies:
+            price = self.get_price(coin=coin, vs_currency=vs_currency)
+            if price is not None:
+                rates[vs_currency] = price
+        return {coin: rates} if rates else {}
+
+    def schedule_refresh(self):
+        """
+        Start refresh in background if it is not already running
+        """
+        if self.refreshing and not self.refreshing.done():
+            return
+        try:
+            self.refreshing = asyncio.get_event_loop().create_task(self.refresh())
+        except RuntimeError:
+            pass  # No running loop, scheduled refresher will update prices
+
+    async def fetch_prices(self):
+        """
+        Fetch prices of all tracked coins in all tracked vs currencies with single call
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=CONST_GECKO_TIMEOUT))
+        params = {"ids": ','.join(sorted(self.coins)),
+                  "vs_currencies": ','.join(sorted(self.vs_currencies))}
+        async with self.session.get(CONST_GECKO_SIMPLE_PRICE, params=params) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+    async def refresh(self):
+        """
+        Fetch all tracked prices and publish new snapshot. On failure last known good prices are kept.
+        """
+        try:
+            data = await self.fetch_prices()
+        except Exception as e:
+            print(Fore.RED + f'Could not refresh prices from CoinGecko: {e}')
+            return False
+
+        now = time.time()
+        prices = {coin: dict(rates) for coin, rates in self.snapshot.items()}
+        for coin, rates in data.items():
+            for vs_currency, price in rates.items():
+                prices.setdefault(coin, {})[vs_currency] = price
+                self.fetched[(coin, vs_currency)] = now
+        self.snapshot = MappingProxyType({coin: MappingProxyType(rates) for coin, rates in prices.items()})
+        return True
+
+
+price_cache = PriceCache()
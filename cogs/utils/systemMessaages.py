@@ -33,6 +33,9 @@ class CustomMessages:
         elif tx_type == 'multi':
             msg_streamed += ":parachute: "
 
+        elif tx_type == 'role_purchase':
+            msg_streamed += message
+
         return msg_streamed
 
     @staticmethod
@@ -117,6 +120,37 @@ class CustomMessages:
         except Exception:
             await ctx.channel.send(embed=embed)
 
+    @staticmethod
+    async def multi_transaction_report(ctx, recipients: list, tx_details: dict, bridges: int, message: str):
+        """
+        Single report of multi transaction to the channel where it has been executed
+        :param ctx: Discord Context
+        :param recipients: list of Discord members who received funds
+        :param tx_details: amount per recipient, total and emoji of the coin
+        :param bridges: number of recipients registered with this transaction
+        :param message: Optional user message
+        """
+        multi_report = Embed(title=f':parachute: Multi transaction :parachute: ',
+                             description=f'{ctx.message.author} has sent ***{tx_details["amount"]:.7f}*** '
+                                         f'{tx_details["emoji"]} to each of {len(recipients)} members',
+                             colour=Colour.green(),
+                             timestamp=datetime.utcnow())
+        multi_report.add_field(name=':money_with_wings: Total value :money_with_wings: ',
+                               value=f'`{tx_details["total"]:.7f}` {tx_details["emoji"]}')
+        multi_report.add_field(name=':bridge_at_night: New bridges :bridge_at_night: ',
+                               value=f'`{bridges}`')
+        multi_report.add_field(name=':love_letter: Note :love_letter: ',
+                               value=f'`{message}`',
+                               inline=False)
+
+        mentions = ''
+        for recipient in recipients:
+            if len(mentions) + len(recipient.mention) + 1 > 1900:
+                mentions += '...'
+                break
+            mentions += f'{recipient.mention} '
+        await ctx.channel.send(content=mentions, embed=multi_report)
+
     @staticmethod
     async def bridge_notification(ctx, recipient):
         bridge_info = Embed(title=f':bridge_at_night: New Bridge Created :bridge_at_night: ',
@@ -464,18 +498,6 @@ class CustomMessages:
                                      inline=False)
                 await ctx.author.send(embed=coin_stats)
 
-    async def explorer_messages(self, applied_channels: list, message: str, tx_type: str, on_chain: bool = None):
-        """
-        Transactin reports to all explorer applied channels
-        """
-        if not on_chain:
-            msg_streamed = self.filter_message(message=message, tx_type=tx_type)
-            for explorer_channel in applied_channels:
-                await explorer_channel.send(msg_streamed)
-        else:
-            for explorer_channel in applied_channels:
-                await explorer_channel.send(message)
-
     async def transaction_report_to_channel(self, ctx, message: str, tx_type: str):
         """
         Discord Transaction report to the channel
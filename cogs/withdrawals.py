@@ -1,6 +1,7 @@
 import time
 from discord.ext import commands
 from discord import TextChannel
+from colorama import Fore
 import time
 from utils.customCogChecks import has_wallet, check
 from cogs.utils.monetaryConversions import convert_to_usd
@@ -11,6 +12,7 @@ helper = Helpers()
 custom_messages = CustomMessages()
 CONST_STELLAR_EMOJI = '<:stelaremoji:684676687425961994>'
 CONST_WITHDRAWAL_ERROR = "__Withdrawal error___"
+CONST_WITHDRAWAL_PENDING = "__Withdrawal pending__"
 integrated_coins = helper.read_json_file(file_name='integratedCoins.json')
 
 
@@ -23,6 +25,15 @@ class WithdrawalCommands(commands.Cog):
         self.earnings = bot.backoffice.auto_messaging_channels["earnings"]
         self.with_channel = bot.backoffice.auto_messaging_channels["withdrawals"]
         self.help_functions = bot.backoffice.helper
+        self.withdrawal_tasks = set()  # Withdrawals completing in the background
+
+    def __withdrawal_done(self, task):
+        """
+        Release finished background withdrawal and log error which escaped it
+        """
+        self.withdrawal_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(Fore.RED + f'Background withdrawal failed: {task.exception()}')
 
     @commands.group()
     @commands.check(has_wallet)
@@ -131,7 +142,7 @@ class WithdrawalCommands(commands.Cog):
     #                                                                                                token=token):
     #
     #                                     # Initiate on chain withdrawal from hot wallet
-    #                                     result = self.backoffice.stellar_wallet.token_withdrawal(address=strip_address,
+    #                                     result = await self.backoffice.withdrawal_queue.withdraw(address=strip_address,
     #                                                                                              token=ticker.upper(),
     #                                                                                              amount=f'{withdrawal_amount}')
     #
@@ -298,7 +309,7 @@ class WithdrawalCommands(commands.Cog):
                 string=strip_address):
             if strip_address != self.bot.backoffice.stellar_wallet.public_key:
                 # Get the fee for stellar withdrawal
-                stellar_fee = self.backoffice.bot_manager.get_fees_by_category(key='withdrawals')['fee_list']['xlm']
+                stellar_fee = (await self.backoffice.bot_manager.get_fees_by_category(key='withdrawals'))['fee_list']['xlm']
 
                 print('getting fee in stroops')
                 # Conversions
@@ -321,8 +332,8 @@ class WithdrawalCommands(commands.Cog):
                     final_normal = final_stroop / (10 ** 7)
 
                     # Get user balance
-                    wallet_details = self.backoffice.wallet_manager.get_ticker_balance(ticker='xlm',
-                                                                                       user_id=ctx.message.author.id)
+                    wallet_details = await self.backoffice.wallet_manager.get_ticker_balance(ticker='xlm',
+                                                                                             user_id=ctx.message.author.id)
 
                     #  Check if user has sufficient balance to cover the withdrawal fee + amount
                     if wallet_details >= final_stroop:
@@ -345,90 +356,26 @@ class WithdrawalCommands(commands.Cog):
                             }
 
                             # Withdraw balance from user wallet
-                            if self.backoffice.wallet_manager.update_user_balance_off_chain(
-                                    user_id=ctx.message.author.id,
-                                    coin_details=to_deduct):
-
-                                # Initiate on chain withdrawal
-                                result = self.backoffice.stellar_wallet.token_withdrawal(address=strip_address,
-                                                                                         token='xlm',
-                                                                                         amount=str(amount_major))
-                                if result.get("hash"):
-                                    # Store withdrawal details to database
-                                    result['userId'] = int(ctx.message.author.id)
-                                    result["time"] = int(time.time())
-                                    result['offChainData'] = {"xlmFee": stellar_fee}
-
-                                    # Insert in the history of withdrawals
-                                    await self.backoffice.stellar_manager.insert_to_withdrawal_hist(tx_type=1,
-                                                                                                    tx_data=result)
-
-                                    # Update user withdrawal stats
-                                    withdrawal_data = {
-                                        "xlm.withdrawalsCount": 1,
-                                        "xlm.totalWithdrawn": stroops / (10 ** 7),
-                                    }
-                                    await self.backoffice.stats_manager.update_usr_tx_stats(
-                                        user_id=ctx.message.author.id,
-                                        tx_stats_data=withdrawal_data)
-
-                                    # Update bot stats
-                                    bot_stats_data = {
-                                        "withdrawalCount": 1,
-                                        "withdrawnAmount": stroops / (10 ** 7)
-                                    }
-                                    await self.backoffice.stats_manager.update_cl_on_chain_stats(ticker='xlm',
-                                                                                                 stat_details=bot_stats_data)
-
-                                    # Stores in earnings for tax office
-                                    await self.backoffice.stats_manager.update_cl_earnings(time=int(time.time()),
-                                                                                           amount=fee_in_stroops,
-                                                                                           system='withdrawal',
-                                                                                           token="xlm",
-                                                                                           user=ctx.message.author.id)
-
-                                    self.backoffice.bot_manager.update_cl_wallet_balance(ticker='xlm',
-                                                                                         to_update={'balance': int(
-                                                                                             fee_in_stroops)})
-
-                                    # Send message to user on withdrawal
-                                    await custom_messages.withdrawal_notify(ctx, withdrawal_data=result,
-                                                                            fee=f'{stellar_fee} XLM and')
-
-                                    # # System channel notification on withdrawal processed
-                                    channel_sys = self.bot.get_channel(id=int(self.with_channel))
-                                    await custom_messages.withdrawal_notification_channel(ctx=ctx,
-                                                                                          channel=channel_sys,
-                                                                                          withdrawal_data=result)
-
-                                    # Notify staff on incoming funds
-                                    incoming_funds = self.bot.get_channel(
-                                        id=int(self.earnings))
-                                    await custom_messages.cl_staff_incoming_funds_notification(
-                                        sys_channel=incoming_funds,
-                                        incoming_fees=f'{stellar_fee} {CONST_STELLAR_EMOJI}')
-                                    # Message to explorer
-                                    in_dollar = convert_to_usd(amount=final_normal, coin_name='stellar')
-                                    load_channels = [self.bot.get_channel(id=int(chn)) for chn in
-                                                     self.backoffice.guild_profiles.get_all_explorer_applied_channels()]
-                                    explorer_msg = f':outbox_tray: {final_normal} {CONST_STELLAR_EMOJI} ' \
-                                                   f'(${in_dollar["total"]}) on {ctx.message.guild}'
-                                    await custom_messages.explorer_messages(applied_channels=load_channels,
-                                                                            message=explorer_msg,
-                                                                            tx_type='withdrawal',
-                                                                            on_chain=True)
-                                else:
-                                    message = 'Funds could not be withdrawn at this point. Please try again later.'
-                                    # return user funds to off-chain wallet
-                                    to_append = {
-                                        "xlm": int(final_stroop)
-                                    }
-                                    self.backoffice.wallet_manager.update_user_balance_off_chain(
-                                        user_id=ctx.message.author.id,
-                                        coin_details=to_append)
-                                    await custom_messages.system_message(ctx=ctx, color_code=1, message=message,
-                                                                         destination=0,
-                                                                         sys_msg_title=CONST_WITHDRAWAL_ERROR)
+                            if await self.backoffice.wallet_manager.update_user_balance_off_chain(
+                                          user_id=ctx.message.author.id,
+                                          coin_details=to_deduct):
+
+                                # On chain withdrawal is completed in the background, user is notified once confirmed
+                                task = self.bot.loop.create_task(self.complete_withdrawal(ctx=ctx,
+                                                                                          address=strip_address,
+                                                                                          amount_major=amount_major,
+                                                                                          stroops=stroops,
+                                                                                          final_stroop=final_stroop,
+                                                                                          fee_in_stroops=fee_in_stroops,
+                                                                                          final_normal=final_normal,
+                                                                                          stellar_fee=stellar_fee))
+                                self.withdrawal_tasks.add(task)
+                                task.add_done_callback(self.__withdrawal_done)
+                                message = f'Withdrawal of {amount_major} {CONST_STELLAR_EMOJI} has been submitted to ' \
+                                          f'the network. You will be notified once it is confirmed.'
+                                await custom_messages.system_message(ctx=ctx, color_code=0, message=message,
+                                                                     destination=0,
+                                                                     sys_msg_title='Withdrawal submitted')
                             else:
                                 message = 'Funds could not be withdrawn at this point. Please try again later.'
                                 await custom_messages.system_message(ctx=ctx, color_code=1, message=message,
@@ -466,6 +413,128 @@ class WithdrawalCommands(commands.Cog):
             await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=0,
                                                  sys_msg_title=CONST_WITHDRAWAL_ERROR)
 
+    async def complete_withdrawal(self, ctx, address: str, amount_major: float, stroops: int, final_stroop: int,
+                                  fee_in_stroops: int, final_normal: float, stellar_fee: float):
+        """
+        Submits withdrawal on chain and waits for it to be included in ledger, outside of the command so command
+        returns without waiting on ledger close. Funds are returned to user only if withdrawal has surely not been
+        included in ledger, withdrawal with unknown outcome is left pending for staff.
+        :param ctx: Discord Context
+        :param address: Destination address of withdrawal
+        :param amount_major: Amount sent on chain in XLM
+        :param stroops: Amount sent on chain in stroops
+        :param final_stroop: Amount deducted from user wallet in stroops, including fee
+        :param fee_in_stroops: Withdrawal fee in stroops
+        :param final_normal: Amount deducted from user wallet in XLM, including fee
+        :param stellar_fee: Withdrawal fee in XLM
+        :return:
+        """
+        # Initiate on chain withdrawal, submitted together with other pending withdrawals
+        try:
+            result = await self.backoffice.withdrawal_queue.withdraw(address=address,
+                                                                     token='xlm',
+                                                                     amount=str(amount_major))
+        except Exception as e:
+            # Failures after submission are reported as pending by the wallet, so nothing has been sent on chain
+            print(Fore.RED + f'Withdrawal of {ctx.message.author} failed before submission: {e}')
+            result = {"error": f'{e}'}
+        if result.get("hash"):
+            # Funds have left the hot wallet, failures from here on are only logged and never refunded
+            try:
+                # Store withdrawal details to database
+                result['userId'] = int(ctx.message.author.id)
+                result["time"] = int(time.time())
+                result['offChainData'] = {"xlmFee": stellar_fee}
+
+                # Insert in the history of withdrawals
+                await self.backoffice.stellar_manager.insert_to_withdrawal_hist(tx_type=1,
+                                                                                tx_data=result)
+
+                # Update user withdrawal stats
+                withdrawal_data = {
+                    "xlm.withdrawalsCount": 1,
+                    "xlm.totalWithdrawn": stroops / (10 ** 7),
+                }
+                await self.backoffice.stats_manager.update_usr_tx_stats(
+                    user_id=ctx.message.author.id,
+                    tx_stats_data=withdrawal_data)
+
+                # Update bot stats
+                bot_stats_data = {
+                    "withdrawalCount": 1,
+                    "withdrawnAmount": stroops / (10 ** 7)
+                }
+                await self.backoffice.stats_manager.update_cl_on_chain_stats(ticker='xlm',
+                                                                             stat_details=bot_stats_data)
+
+                # Stores in earnings for tax office
+                await self.backoffice.stats_manager.update_cl_earnings(time=int(time.time()),
+                                                                       amount=fee_in_stroops,
+                                                                       system='withdrawal',
+                                                                       token="xlm",
+                                                                       user=ctx.message.author.id)
+
+                await self.backoffice.bot_manager.update_cl_wallet_balance(ticker='xlm',
+                                                                           to_update={'balance': int(
+                                                                               fee_in_stroops)})
+
+                # Send message to user on withdrawal
+                await custom_messages.withdrawal_notify(ctx, withdrawal_data=result,
+                                                        fee=f'{stellar_fee} XLM and')
+
+                # # System channel notification on withdrawal processed
+                channel_sys = self.bot.get_channel(id=int(self.with_channel))
+                await custom_messages.withdrawal_notification_channel(ctx=ctx,
+                                                                      channel=channel_sys,
+                                                                      withdrawal_data=result)
+
+                # Notify staff on incoming funds
+                incoming_funds = self.bot.get_channel(
+                    id=int(self.earnings))
+                await custom_messages.cl_staff_incoming_funds_notification(
+                    sys_channel=incoming_funds,
+                    incoming_fees=f'{stellar_fee} {CONST_STELLAR_EMOJI}')
+                # Message to explorer
+                in_dollar = convert_to_usd(amount=final_normal, coin_name='stellar')
+                explorer_msg = f':outbox_tray: {final_normal} {CONST_STELLAR_EMOJI} ' \
+                               f'(${in_dollar["total"]}) on {ctx.message.guild}'
+                await self.bot.explorer_queue.publish(message=explorer_msg, on_chain=True)
+            except Exception as e:
+                print(Fore.RED + f'Withdrawal {result["hash"]} of {ctx.message.author} confirmed but could not '
+                                 f'be recorded: {e}')
+        elif result.get("pending"):
+            # Transaction may be in ledger while Horizon lags behind, funds are kept until staff checks it
+            print(Fore.RED + f'Withdrawal {result["pending"]} of {ctx.message.author} ({ctx.message.author.id}) '
+                             f'pending, {final_stroop} stroops deducted')
+            message = f'Withdrawal of {amount_major} {CONST_STELLAR_EMOJI} has been submitted with transaction ' \
+                      f'`{result["pending"]}` but could not be confirmed yet. Staff has been notified and will ' \
+                      f'check its outcome.'
+            try:
+                await custom_messages.system_message(ctx=ctx, color_code=1, message=message, destination=0,
+                                                     sys_msg_title=CONST_WITHDRAWAL_PENDING)
+                channel_sys = self.bot.get_channel(id=int(self.with_channel))
+                await channel_sys.send(content=f':warning: Pending withdrawal {result["pending"]} of '
+                                               f'{ctx.message.author} ({ctx.message.author.id}), '
+                                               f'{final_normal} XLM deducted')
+            except Exception as e:
+                print(Fore.RED + f'Pending withdrawal notifications could not be sent: {e}')
+        else:
+            message = 'Funds could not be withdrawn at this point. Please try again later.'
+            # return user funds to off-chain wallet
+            to_append = {
+                "xlm": int(final_stroop)
+            }
+            try:
+                await self.backoffice.wallet_manager.update_user_balance_off_chain(
+                          user_id=ctx.message.author.id,
+                          coin_details=to_append)
+                await custom_messages.system_message(ctx=ctx, color_code=1, message=message,
+                                                     destination=0,
+                                                     sys_msg_title=CONST_WITHDRAWAL_ERROR)
+            except Exception as e:
+                print(Fore.RED + f'Failed withdrawal of {ctx.message.author} ({ctx.message.author.id}) could not be '
+                                 f'refunded with {final_stroop} stroops: {e}')
+
     @withdraw.error
     async def withdrawal_error(self, ctx, error):
         if isinstance(error, commands.CheckFailure):
@@ -23,7 +23,7 @@ class HorizonAccounts(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.hor_accounts = self.bot.backoffice.stellar_wallet.server.accounts()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
         self.help_functions = bot.backoffice.helper
 
     @commands.group(aliases=["account", "acc"])
@@ -72,7 +72,7 @@ class HorizonAccounts(commands.Cog):
         """
         if self.help_functions.check_public_key(address=address):
             try:
-                data = self.hor_accounts.account_id(account_id=address).call()
+                data = await self.server.accounts().account_id(account_id=address).call()
                 if data:
                     for coin in reversed(data["balances"]):
                         date_fm = format_date(data["last_modified_time"])
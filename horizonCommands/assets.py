@@ -19,7 +19,7 @@ class HorizonAssets(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.hor_assets = self.bot.backoffice.stellar_wallet.server.assets()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
 
     @commands.group()
     @commands.cooldown(1, 30, commands.BucketType.user)
@@ -44,7 +44,7 @@ class HorizonAssets(commands.Cog):
     async def get(self, ctx, asset_code: str, asset_issuer: str):
 
         try:
-            data = self.hor_assets.for_code(asset_code=asset_code.upper()).for_issuer(
+            data = await self.server.assets().for_code(asset_code=asset_code.upper()).for_issuer(
                 asset_issuer=asset_issuer.upper()).call()
             if data['_embedded']["records"]:
                 await send_asset_details(destination=ctx.message.author, data=data, request='***asset***')
@@ -61,7 +61,7 @@ class HorizonAssets(commands.Cog):
     @assets.command()
     async def code(self, ctx, asset_code: str):
         try:
-            data = self.hor_assets.for_code(asset_code=asset_code.upper()).call()
+            data = await self.server.assets().for_code(asset_code=asset_code.upper()).call()
             if data['_embedded']['records']:
                 records = data['_embedded']['records']
                 if len(records) == 1:
@@ -81,7 +81,7 @@ class HorizonAssets(commands.Cog):
     @assets.command()
     async def issuer(self, ctx, issuer: str):
         try:
-            data = self.hor_assets.for_issuer(asset_issuer=issuer).call()
+            data = await self.server.assets().for_issuer(asset_issuer=issuer).call()
             if data['_embedded']['records']:
                 await send_asset_details(destination=ctx.message.author, data=data, request='issuer')
 
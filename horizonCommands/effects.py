@@ -23,7 +23,7 @@ class HorizonEffects(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.hor_effects = self.bot.backoffice.stellar_wallet.server.effects()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
         self.help_functions = bot.backoffice.helper
 
     @commands.group(aliases=["ef", 'effect'])
@@ -59,7 +59,7 @@ class HorizonEffects(commands.Cog):
     async def account(self, ctx, address: str):
         if self.help_functions.check_public_key(address=address):
             try:
-                data = self.hor_effects.for_account(account_id=address).call()
+                data = await self.server.effects().for_account(account_id=address).call()
                 await send_effects(destination=ctx.message.author, data=data, usr_query=f'{address}',
                                    key_query='Account')
 
@@ -83,7 +83,7 @@ class HorizonEffects(commands.Cog):
     @effects.command()
     async def ledger(self, ctx, ledger_id: int):
         try:
-            data = self.hor_effects.for_ledger(sequence=ledger_id).call()
+            data = await self.server.effects().for_ledger(sequence=ledger_id).call()
             await send_effects(destination=ctx.message.author, data=data, usr_query=f'{ledger_id}',
                                key_query='Ledger')
             effects = data['_embedded']["records"]
@@ -102,7 +102,7 @@ class HorizonEffects(commands.Cog):
     @effects.command(aliases=['op'])
     async def operation(self, ctx, operation_id: int):
         try:
-            data = self.hor_effects.for_operation(operation_id=operation_id).call()
+            data = await self.server.effects().for_operation(operation_id=operation_id).call()
             await send_effects(destination=ctx.message.author, data=data, usr_query=f'{operation_id}',
                                key_query='Operation')
             effects = data['_embedded']["records"]
@@ -120,7 +120,7 @@ class HorizonEffects(commands.Cog):
     @effects.command(aliases=["tx", "hash"])
     async def transaction(self, ctx, tx_hash: str):
         try:
-            data = self.hor_effects.for_transaction(transaction_hash=tx_hash).call()
+            data = await self.server.effects().for_transaction(transaction_hash=tx_hash).call()
             await send_effects(destination=ctx.message.author, data=data, usr_query=f'{tx_hash}',
                                key_query='Transaction Hash')
             effects = data['_embedded']["records"]
@@ -3,8 +3,9 @@ COGS which handle explanation  on commands available to communicate with the Led
 """
 
 
+import asyncio
+
 from discord.ext import commands
-import requests
 from discord import Embed, Colour
 from cogs.utils.systemMessaages import CustomMessages
 from horizonCommands.utils.customMessages import horizon_error_msg
@@ -22,30 +23,21 @@ class HorizonLedger(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.hor_ledgers = self.bot.backoffice.stellar_wallet.server.ledgers()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
 
     @commands.command()
     @commands.cooldown(1, 30, commands.BucketType.user)
     async def ledger(self, ctx, ledger_number: int):
         try:
-            data = self.hor_ledgers.ledger(sequence=ledger_number).call()
+            data = await self.server.ledgers().ledger(sequence=ledger_number).call()
             if data:
-                operations_count = len(
-                    requests.get(f'https://horizon-testnet.stellar.org/ledgers/{ledger_number}/operations').json()[
-                        '_embedded'][
-                        "records"])
-                effects_count = len(
-                    requests.get(f'https://horizon-testnet.stellar.org/ledgers/{ledger_number}/effects').json()[
-                        '_embedded'][
-                        "records"])
-                payments_count = len(
-                    requests.get(f'https://horizon-testnet.stellar.org/ledgers/{ledger_number}/payments').json()[
-                        '_embedded'][
-                        "records"])
-                transactions_count = len(
-                    requests.get(f'https://horizon-testnet.stellar.org/ledgers/{ledger_number}/transactions').json()[
-                        '_embedded'][
-                        "records"])
+                activity = await asyncio.gather(
+                    self.server.operations().for_ledger(sequence=ledger_number).call(),
+                    self.server.effects().for_ledger(sequence=ledger_number).call(),
+                    self.server.payments().for_ledger(sequence=ledger_number).call(),
+                    self.server.transactions().for_ledger(sequence=ledger_number).call())
+                operations_count, effects_count, payments_count, transactions_count = [
+                    len(records['_embedded']['records']) for records in activity]
 
                 ledger_info = Embed(title=f':ledger: Ledger :id: {ledger_number} Information :ledger:',
                                     description='Bellow is represent information for requested ledger.',
@@ -21,7 +21,7 @@ class HorizonOffers(commands.Cog):
         self.bot = bot
         self.backoffice = bot.backoffice
         self.command_string = bot.get_command_str()
-        self.hor_offers = self.bot.backoffice.stellar_wallet.server.offers()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
 
     @commands.group()
     @commands.cooldown(1, 30, commands.BucketType.user)
@@ -48,7 +48,7 @@ class HorizonOffers(commands.Cog):
     @offers.command(aliases=['id'])
     async def single(self, ctx, offer_id: int):
         try:
-            data = self.hor_offers.offer(offer_id=offer_id).call()
+            data = await self.server.offers().offer(offer_id=offer_id).call()
             await offer_details(destination=ctx.message.author, offer=data)
         except BadRequestError as e:
             extras = e.extras
@@ -57,7 +57,7 @@ class HorizonOffers(commands.Cog):
     @offers.command(aliases=["addr"])
     async def address(self, ctx, address: str):
         try:
-            data = self.hor_offers.account(account_id=address).limit(100).order(desc=True).call()
+            data = await self.server.offers().account(account_id=address).limit(100).order(desc=True).call()
 
             if data["_embedded"]["records"]:
                 await send_offers(destination=ctx.message.author, address=address,
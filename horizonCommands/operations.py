@@ -21,7 +21,7 @@ class HorizonOperations(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.hor_operations = self.bot.backoffice.stellar_wallet.server.operations()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
 
     @commands.group(aliases=['op'])
     @commands.cooldown(1, 30, commands.BucketType.user)
@@ -144,7 +144,7 @@ class HorizonOperations(commands.Cog):
     @operations.command(aliases=["id"])
     async def operation(self, ctx, operation_id):
         try:
-            data = self.hor_operations.operation(operation_id=operation_id).call()
+            data = await self.server.operations().operation(operation_id=operation_id).call()
             if data['_embedded']["records"]:
                 await send_operations_basic_details(destination=ctx.message.author, key_query="Operation",
                                                     hrz_link=data['_links']['self']['href'])
@@ -162,8 +162,8 @@ class HorizonOperations(commands.Cog):
     @operations.command(aliases=['acc', 'addr'])
     async def account(self, ctx, address: str):
         try:
-            data = self.hor_operations.for_account(account_id=address).include_failed(False).order(desc=True).limit(
-                200).call()
+            data = await self.server.operations().for_account(account_id=address).include_failed(False).order(
+                desc=True).limit(200).call()
             if data['_embedded']["records"]:
                 await send_operations_basic_details(destination=ctx.message.author, key_query="Account",
                                                     hrz_link=data['_links']['self']['href'])
@@ -179,8 +179,8 @@ class HorizonOperations(commands.Cog):
     @operations.command()
     async def ledger(self, ctx, ledger_id: int):
         try:
-            data = self.hor_operations.for_ledger(sequence=ledger_id).include_failed(False).order(desc=True).limit(
-                200).call()
+            data = await self.server.operations().for_ledger(sequence=ledger_id).include_failed(False).order(
+                desc=True).limit(200).call()
             if data['_embedded']["records"]:
                 await send_operations_basic_details(destination=ctx.message.author, key_query="Ledger",
                                                     hrz_link=data['_links']['self']['href'])
@@ -197,7 +197,7 @@ class HorizonOperations(commands.Cog):
     async def transaction(self, ctx, tx_hash: str):
         try:
 
-            data = self.hor_operations.for_transaction(transaction_hash=tx_hash).include_failed(False).order(
+            data = await self.server.operations().for_transaction(transaction_hash=tx_hash).include_failed(False).order(
                 desc=True).limit(
                 200).call()
             if data['_embedded']["records"]:
@@ -20,9 +20,9 @@ class HorizonOrderBook(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.server = self.bot.backoffice.stellar_wallet.server
+        self.server = self.bot.backoffice.stellar_wallet.as_server
 
-    def check_asset(self, asset_query):
+    async def check_asset(self, asset_query):
 
         # Check if it is native
         if asset_query == 'XLM':
@@ -31,7 +31,7 @@ class HorizonOrderBook(commands.Cog):
 
         # Check if asset is alphanumeric 4 or 12
         elif len(asset_query) <= 12:
-            asset = self.server.assets().for_code(asset_code=asset_query).call()
+            asset = await self.server.assets().for_code(asset_code=asset_query).call()
             all_assets = asset["_embedded"]['records']
 
             # If only one asset with code exists
@@ -43,7 +43,7 @@ class HorizonOrderBook(commands.Cog):
 
         # If not alphanumeric than issuer address check required
         else:
-            data = self.server.assets().for_issuer(asset_issuer=asset_query).call()
+            data = await self.server.assets().for_issuer(asset_issuer=asset_query).call()
             issuer_assets = data["_embedded"]['records']
 
             # If issuer only issued one asset
@@ -82,13 +82,13 @@ class HorizonOrderBook(commands.Cog):
 
     @book.command(aliases=['get'])
     async def details(self, ctx, selling: str, buying: str):
-        selling_asset = self.check_asset(asset_query=selling.upper())
+        selling_asset = await self.check_asset(asset_query=selling.upper())
 
         if self.is_asset(asset_to_check=selling_asset):
-            buying_asset = self.check_asset(asset_query=buying.upper())
+            buying_asset = await self.check_asset(asset_query=buying.upper())
             if self.is_asset(asset_to_check=buying_asset):
                 try:
-                    data = self.server.orderbook(selling=selling_asset, buying=buying_asset).call()
+                    data = await self.server.orderbook(selling=selling_asset, buying=buying_asset).call()
                     base_asset_details = data["base"]
                     counter_asset_details = data["counter"]
 
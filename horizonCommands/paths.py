@@ -16,7 +16,7 @@ class HorizonPaths(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.server = self.bot.backoffice.stellar_wallet.server
+        self.server = self.bot.backoffice.stellar_wallet.as_server
         self.help_functions = bot.backoffice.helper
 
     @commands.group()
@@ -50,8 +50,8 @@ class HorizonPaths(commands.Cog):
                 asset_issuer):
             asset_obj = get_asset(asset_code=asset_code.upper(), asset_issuer=asset_issuer)
             try:
-                data = self.server.strict_send_paths(source_asset=asset_obj, source_amount=normal,
-                                                     destination=to_address).call()
+                data = await self.server.strict_send_paths(source_asset=asset_obj, source_amount=normal,
+                                                           destination=to_address).call()
                 records = data["_embedded"]["records"]
 
                 if records:
@@ -93,8 +93,8 @@ class HorizonPaths(commands.Cog):
             asset_boj = get_asset(asset_code=asset_code, asset_issuer=asset_issuer)
 
             try:
-                data = self.server.strict_receive_paths(destination_asset=asset_boj,
-                                                        destination_amount=normal).call()
+                data = await self.server.strict_receive_paths(destination_asset=asset_boj,
+                                                              destination_amount=normal).call()
                 records = data["_embedded"]["records"][:3]
 
                 if records:
@@ -16,7 +16,7 @@ class HorizonPayments(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.hor_payments = self.bot.backoffice.stellar_wallet.server.payments()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
         self.help_functions = bot.backoffice.helper
 
     @staticmethod
@@ -124,7 +124,7 @@ class HorizonPayments(commands.Cog):
     async def address(self, ctx, address: str):
         try:
             if self.help_functions.check_public_key(address=address):
-                data = self.hor_payments.for_account(account_id=address).order(
+                data = await self.server.payments().for_account(account_id=address).order(
                     desc=True).limit(limit=200).call()
                 if data['_embedded']['records']:
                     await self.process_server_response(ctx, data=data, query_key='address', user_query=f'{address}')
@@ -143,7 +143,7 @@ class HorizonPayments(commands.Cog):
     @payments.command()
     async def ledger(self, ctx, ledger_sequence: int):
         try:
-            data = self.hor_payments.for_ledger(sequence=ledger_sequence).order(
+            data = await self.server.payments().for_ledger(sequence=ledger_sequence).order(
                 desc=True).limit(limit=200).call()
             records = data['_embedded']['records']
             if records:
@@ -169,7 +169,7 @@ class HorizonPayments(commands.Cog):
     @commands.cooldown(1, 30, commands.BucketType.user)
     async def transaction(self, ctx, transaction_hash: str):
         try:
-            data = self.hor_payments.for_transaction(transaction_hash=transaction_hash).order(
+            data = await self.server.payments().for_transaction(transaction_hash=transaction_hash).order(
                 desc=True).limit(limit=20).call()
             if data['_embedded']['records']:
                 await self.process_server_response(ctx, data=data, query_key='transaction hash',
@@ -15,7 +15,7 @@ class HorizonTradeAggregations(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.server = self.bot.backoffice.stellar_wallet.server
+        self.server = self.bot.backoffice.stellar_wallet.as_server
 
     @staticmethod
     def process_resolution(resolution: int):
@@ -61,7 +61,7 @@ class HorizonTradeAggregations(commands.Cog):
         base = Asset(code="XLM").native()
         counter = Asset(code=counter_asset.upper(), issuer=counter_issuer)
         resolution_actual = self.process_resolution(resolution=resolution)
-        data = self.server.trade_aggregations(base=base, counter=counter, resolution=resolution_actual).call()
+        data = await self.server.trade_aggregations(base=base, counter=counter, resolution=resolution_actual).call()
 
         # Embed
         agg_details = Embed(title=f':bar_chart: Aggregated Trades result :bar_chart: ',
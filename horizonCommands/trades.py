@@ -16,7 +16,7 @@ class HorizonTrades(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.hor_trades = self.bot.backoffice.stellar_wallet.server.trades()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
 
     @commands.group()
     @commands.cooldown(1, 30, commands.BucketType.user)
@@ -42,7 +42,7 @@ class HorizonTrades(commands.Cog):
     @trades.command(aliases=["acc", "addr"])
     async def account(self, ctx, address: str):
         try:
-            data = self.hor_trades.for_account(account_id=address).limit(100).order(desc=True).call()
+            data = await self.server.trades().for_account(account_id=address).limit(100).order(desc=True).call()
             records = data["_embedded"]["records"]
             if records:
                 await send_trades_basic_details(destination=ctx.message.author,
@@ -71,7 +71,7 @@ class HorizonTrades(commands.Cog):
     @trades.command()
     async def offer(self, ctx, offer_id: int):
         try:
-            data = self.hor_trades.for_offer(offer_id=offer_id).limit(100).order(desc=True).call()
+            data = await self.server.trades().for_offer(offer_id=offer_id).limit(100).order(desc=True).call()
             records = data["_embedded"]["records"]
             if records:
                 await send_trades_basic_details(destination=ctx.message.author,
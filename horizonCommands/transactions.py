@@ -20,7 +20,7 @@ class HorizonTransactions(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.command_string = bot.get_command_str()
-        self.hor_transactions = self.bot.backoffice.stellar_wallet.server.transactions()
+        self.server = self.bot.backoffice.stellar_wallet.as_server
 
     @commands.group(aliases=["tx"])
     @commands.cooldown(1, 30, commands.BucketType.user)
@@ -47,7 +47,7 @@ class HorizonTransactions(commands.Cog):
     @transactions.command(aliases=["hash"])
     async def single(self, ctx, transaction_hash: str):
         try:
-            data = self.hor_transactions.transaction(transaction_hash=transaction_hash).call()
+            data = await self.server.transactions().transaction(transaction_hash=transaction_hash).call()
 
             sig_str = '\n'.join([f'`{sig}`' for sig in data['signatures']])
             date_fm = format_date(data["created_at"])
@@ -70,7 +70,7 @@ class HorizonTransactions(commands.Cog):
         Get last three transactions for the account
         """
         try:
-            data = self.hor_transactions.for_account(account_id=account_address).order(desc=True).call()
+            data = await self.server.transactions().for_account(account_id=account_address).order(desc=True).call()
             records = data['_embedded']['records']
             if records:
                 account_info = Embed(title=f':map: Account Transactions Information :map:',
@@ -103,7 +103,7 @@ class HorizonTransactions(commands.Cog):
     @transactions.command()
     async def ledger(self, ctx, ledger_id: int):
         try:
-            data = self.hor_transactions.for_ledger(sequence=ledger_id).call()
+            data = await self.server.transactions().for_ledger(sequence=ledger_id).call()
             if data:
                 records = data['_embedded']['records']
                 ledger_info = Embed(title=f':ledger: Ledger {ledger_id} Information :ledger:',
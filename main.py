@@ -25,4 +25,7 @@ if __name__ == '__main__':
     scheduler = start_scheduler(periodic_tasks)
     # Discord Token
     bot.run()
+
+    # Write out global stats aggregated since last flush
+    backoffice.stats_manager.flush_global_stats_sync()
     print("DONE")
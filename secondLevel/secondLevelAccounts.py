@@ -16,7 +16,7 @@ from utils.customMessages import user_account_info, dev_fee_option_notification,
 from secondLevel.utils.secondLevelCustMsg import account_layer_selection_message, sign_message_information, \
     send_transaction_report, \
     send_new_account_information, verification_request_explanation, second_level_account_reg_info, \
-    server_error_response, send_operation_details, recipient_incoming_notification, send_uplink_message
+    server_error_response, send_operation_details, recipient_incoming_notification
 
 security_manager = SecurityManager()
 custom_messages = CustomMessages()
@@ -29,7 +29,7 @@ class LevelTwoAccountCommands(commands.Cog):
         self.bot = bot
         self.backoffice = bot.backoffice
         self.command_string = bot.get_command_str()
-        self.server = self.backoffice.stellar_wallet.server
+        self.server = self.backoffice.stellar_wallet.as_server
         self.available_layers = [1, 2, 3]
         self.network_type = Network.TESTNET_NETWORK_PASSPHRASE
         self.help_functions = self.backoffice.helper
@@ -46,11 +46,8 @@ class LevelTwoAccountCommands(commands.Cog):
                                      network_type=self.network_type)
 
         # Send notification on transaction to Crypto Link Uplink
-        load_channels = [self.bot.get_channel(id=int(chn)) for chn in
-                         self.backoffice.guild_profiles.get_all_explorer_applied_channels()]
-
         message = f":two::dollar: {data['netValue']} {data['token']} sent to ***{data['walletLevel']}***"
-        await send_uplink_message(destinations=load_channels, message=message)
+        await self.bot.explorer_queue.publish(message=message, on_chain=True)
 
     @staticmethod
     async def show_typing(ctx):
@@ -75,18 +72,18 @@ class LevelTwoAccountCommands(commands.Cog):
                     err += "Destination address does not exist or has not been activate yet"
         return err
 
-    def check_user_wallet_layer_level(self, layer, user_id):
+    async def check_user_wallet_layer_level(self, layer, user_id):
         """
         Check if user has registered account under selected wallet level
         """
         if layer == 1:
-            return self.backoffice.account_mng.check_user_existence(user_id=user_id)
+            return await self.backoffice.account_mng.check_user_existence(user_id=user_id)
         elif layer == 2:
-            return self.backoffice.second_level_manager.second_level_user_reg_status(user_id=user_id)
+            return await self.backoffice.second_level_manager.second_level_user_reg_status(user_id=user_id)
         elif layer == 3:
-            return self.backoffice.second_level_manager.second_level_user_reg_status(user_id=user_id)
+            return await self.backoffice.second_level_manager.second_level_user_reg_status(user_id=user_id)
 
-    def get_recipient_details_based_on_layer(self, layer: int, user_id: int):
+    async def get_recipient_details_based_on_layer(self, layer: int, user_id: int):
         """
         Produce destination from the database
         """
@@ -94,35 +91,35 @@ class LevelTwoAccountCommands(commands.Cog):
             # Details for transaction to level 1 wallet
             user_data = {
                 "address": self.backoffice.stellar_wallet.public_key,
-                "memo": self.backoffice.account_mng.get_user_memo(user_id=user_id)["stellarDepositId"]
+                "memo": (await self.backoffice.account_mng.get_user_memo(user_id=user_id))["stellarDepositId"]
             }
             return user_data
         elif layer == 2:
             # Details for transaction to level 2 wallet
             user_data = {
-                "address": self.backoffice.second_level_manager.get_custodial_hot_wallet_addr(user_id=user_id),
-                "memo": self.backoffice.account_mng.get_user_memo(user_id=user_id)["stellarDepositId"]
+                "address": await self.backoffice.second_level_manager.get_custodial_hot_wallet_addr(user_id=user_id),
+                "memo": (await self.backoffice.account_mng.get_user_memo(user_id=user_id))["stellarDepositId"]
             }
             return user_data
         elif layer == 3:
             # Details for transaction to level 3 wallet
             user_data = {
-                "address": self.backoffice.get_third_hot_wallet_addr.get_custodial_hot_wallet_addr(user_id=user_id),
-                "memo": self.backoffice.account_mng.get_user_memo(user_id=user_id)["stellarDepositId"]
+                "address": await self.backoffice.third_level_manager.get_third_hot_wallet_addr(user_id=user_id),
+                "memo": (await self.backoffice.account_mng.get_user_memo(user_id=user_id))["stellarDepositId"]
             }
             return user_data
 
-    def stream_transaction_to_network(self, private_key: str, amount: str, tx_data: dict,
+    async def stream_transaction_to_network(self, private_key: str, amount: str, tx_data: dict,
                                       dev_fee_status: bool = None):
         """
         Place Transaction on the network
         """
         key_pair = Keypair.from_secret(private_key)
-        source_account = self.backoffice.stellar_wallet.server.load_account(key_pair.public_key)
+        source_account = await self.server.load_account(key_pair.public_key)
         tx = TransactionBuilder(
             source_account=source_account,
             network_passphrase=Network.TESTNET_NETWORK_PASSPHRASE,
-            base_fee=self.server.fetch_base_fee()
+            base_fee=self.backoffice.stellar_wallet.fee_oracle.get_base_fee()
 
         ).append_payment_op(
             destination=tx_data["toAddress"],
@@ -140,7 +137,7 @@ class LevelTwoAccountCommands(commands.Cog):
 
         try:
             # Sign Submit transaction to server
-            result = self.server.submit_transaction(new_tx)
+            result = await self.server.submit_transaction(new_tx)
 
             return True, result
         except BadRequestError as e:
@@ -228,7 +225,7 @@ class LevelTwoAccountCommands(commands.Cog):
                     }
 
                     # Storing data
-                    if self.backoffice.second_level_manager.create_user_wallet(data_to_store=data_to_store):
+                    if await self.backoffice.second_level_manager.create_user_wallet(data_to_store=data_to_store):
                         message = f"You have successfully verified your secret key and registered level 2 account" \
                                   f" into Crypto Link system. Public address and 1/2 of private" \
                                   f" key have been securely stored under your Discord User ID {ctx.author.id}. I" \
@@ -240,10 +237,8 @@ class LevelTwoAccountCommands(commands.Cog):
                                                                            ' Created :white_check_mark:',
                                                              message=message)
 
-                        load_channels = [self.bot.get_channel(id=int(chn)) for chn in
-                                         self.backoffice.guild_profiles.get_all_explorer_applied_channels()]
                         msg = ':new: User register for wallet level 2. :rocket: '
-                        await send_uplink_message(destinations=load_channels, message=msg)
+                        await self.bot.explorer_queue.publish(message=msg, on_chain=True)
 
                     else:
                         message = 'There has been an issue while storing data into the system. Please re-initiate the' \
@@ -288,10 +283,10 @@ class LevelTwoAccountCommands(commands.Cog):
     @account.command(aliases=['nfo'])
     async def info(self, ctx):
         # Get address from database
-        user_public = self.backoffice.second_level_manager.get_custodial_hot_wallet_addr(user_id=ctx.message.author.id)
+        user_public = await self.backoffice.second_level_manager.get_custodial_hot_wallet_addr(user_id=ctx.message.author.id)
         # Getting data from server for account
         try:
-            data = self.server.accounts().account_id(account_id=user_public).call()
+            data = await self.server.accounts().account_id(account_id=user_public).call()
             if data and 'status' not in data:
                 # Send user account info
                 await user_account_info(ctx=ctx, data=data, bot_avatar_url=self.bot.user.avatar_url)
@@ -355,7 +350,7 @@ class LevelTwoAccountCommands(commands.Cog):
                 # Check for minimum requirements to be met
                 if atomic_amount >= 100:
                     # 3. Check if user has registered wallet level where user is planning to send funds
-                    if self.check_user_wallet_layer_level(layer=wallet_level, user_id=recipient.id):
+                    if await self.check_user_wallet_layer_level(layer=wallet_level, user_id=recipient.id):
                         # DEV FEE Procedure
                         # Send notification to user about dev fee
                         await dev_fee_option_notification(destination=ctx.message.author)
@@ -403,8 +398,8 @@ class LevelTwoAccountCommands(commands.Cog):
                         net_amount = atomic_amount / (10 ** 7)
 
                         # 3. Send information to the user to verify transaction with an answer with request to sign
-                        recipient_details = self.get_recipient_details_based_on_layer(layer=wallet_level,
-                                                                                      user_id=recipient.id)
+                        recipient_details = await self.get_recipient_details_based_on_layer(layer=wallet_level,
+                                                                                            user_id=recipient.id)
                         data = {"txTotal": f'{requested_amount:.7f}',
                                 "netValue": f'{net_amount:.7f}',
                                 "devFee": f'{dev_fee_normal:.7f}',
@@ -433,7 +428,7 @@ class LevelTwoAccountCommands(commands.Cog):
                             first_half_of_key = await self.bot.wait_for('message', check=check(ctx.message.author),
                                                                         timeout=80)
                             # DB 1/2 Private key
-                            private_encrypted = self.backoffice.second_level_manager.get_private_key(
+                            private_encrypted = await self.backoffice.second_level_manager.get_private_key(
                                 user_id=int(ctx.author.id))
 
                             second_half_of_key = security_manager.decrypt(token=private_encrypted["privateKey"]).decode(
@@ -447,10 +442,10 @@ class LevelTwoAccountCommands(commands.Cog):
                                 await self.show_typing(ctx=ctx)
 
                                 # Initiate transaction stream
-                                result = self.stream_transaction_to_network(private_key=private_full,
-                                                                            amount=net_amount,
-                                                                            dev_fee_status=dev_fee_activated,
-                                                                            tx_data=data)
+                                result = await self.stream_transaction_to_network(private_key=private_full,
+                                                                                  amount=net_amount,
+                                                                                  dev_fee_status=dev_fee_activated,
+                                                                                  tx_data=data)
 
                                 # Process result returned from stream
                                 if result[0]:
@@ -585,7 +580,7 @@ class LevelTwoAccountCommands(commands.Cog):
                                                                 timeout=80)
 
                     # DB 1/2 Private key
-                    private_encrypted = self.backoffice.second_level_manager.get_private_key(
+                    private_encrypted = await self.backoffice.second_level_manager.get_private_key(
                         user_id=int(ctx.author.id))
 
                     # decipher secret key and use it for transaction stream
@@ -600,10 +595,10 @@ class LevelTwoAccountCommands(commands.Cog):
                             ctx=ctx)  # Shows the typing on discord so user knows that something is going on
 
                         # Stream tx and return tuple (Boolean , dict response)
-                        result = self.stream_transaction_to_network(private_key=private_full,
-                                                                    amount=net_amount,
-                                                                    dev_fee_status=dev_fee_activated,
-                                                                    tx_data=data)
+                        result = await self.stream_transaction_to_network(private_key=private_full,
+                                                                          amount=net_amount,
+                                                                          dev_fee_status=dev_fee_activated,
+                                                                          tx_data=data)
                         if result[0]:
                             await self.transaction_report_dispatcher(ctx=ctx, result=result[1], data=data)
                         else:
@@ -42,7 +42,7 @@ class LevelThreeAccountCommands(commands.Cog):
         self.backoffice = bot.backoffice
         self.command_string = bot.get_command_str()
         self.hot_wallet = self.backoffice.stellar_wallet
-        self.server = self.hot_wallet.server
+        self.server = self.hot_wallet.as_server
         self.acc_mng_rd_lvl = self.backoffice.third_level_manager
         self.supported = list(integrated_coins.keys())
         self.available_levels = [1, 2, 3]
@@ -61,23 +61,20 @@ class LevelThreeAccountCommands(commands.Cog):
         Dispatch informational embeds to sender and Crypto Link Upling
         """
         # Send notification on transaciton to Crypto Link Uplink
-        load_channels = [self.bot.get_channel(id=int(chn)) for chn in
-                         self.backoffice.guild_profiles.get_all_explorer_applied_channels()]
-        for dest in load_channels:
-            await dest.send(content=message)
+        await self.bot.explorer_queue.publish(message=message, on_chain=True)
 
-    def check_user_wallet_layer_level(self, layer, user_id):
+    async def check_user_wallet_layer_level(self, layer, user_id):
         """
         Check if user has registered account under selected wallet level
         """
         if layer == 1:
-            return self.backoffice.account_mng.check_user_existence(user_id=user_id)
+            return await self.backoffice.account_mng.check_user_existence(user_id=user_id)
         elif layer == 2:
-            return self.backoffice.second_level_manager.second_level_user_reg_status(user_id=user_id)
+            return await self.backoffice.second_level_manager.second_level_user_reg_status(user_id=user_id)
         elif layer == 3:
-            return self.backoffice.third_level_manager.third_level_user_reg_status(user_id=user_id)
+            return await self.backoffice.third_level_manager.third_level_user_reg_status(user_id=user_id)
 
-    def get_recipient_details_based_on_layer(self, layer: int, user_id: int):
+    async def get_recipient_details_based_on_layer(self, layer: int, user_id: int):
         """
         Produce destination from the database
         """
@@ -85,21 +82,21 @@ class LevelThreeAccountCommands(commands.Cog):
             # Details for transaction to level 1 wallet
             user_data = {
                 "address": self.backoffice.stellar_wallet.public_key,
-                "memo": self.backoffice.account_mng.get_user_memo(user_id=user_id)["stellarDepositId"]
+                "memo": (await self.backoffice.account_mng.get_user_memo(user_id=user_id))["stellarDepositId"]
             }
             return user_data
         elif layer == 2:
             # Details for transaction to level 2 wallet
 
             user_data = {
-                "address": self.backoffice.second_level_manager.get_custodial_hot_wallet_addr(user_id=user_id),
-                "memo": self.backoffice.account_mng.get_user_memo(user_id=user_id)["stellarDepositId"]
+                "address": await self.backoffice.second_level_manager.get_custodial_hot_wallet_addr(user_id=user_id),
+                "memo": (await self.backoffice.account_mng.get_user_memo(user_id=user_id))["stellarDepositId"]
             }
             return user_data
 
         elif layer == 3:
             user_data = {
-                "address": self.acc_mng_rd_lvl.get_third_hot_wallet_addr(user_id=int(user_id)),
+                "address": await self.acc_mng_rd_lvl.get_third_hot_wallet_addr(user_id=int(user_id)),
                 "memo": None
             }
             return user_data
@@ -132,15 +129,15 @@ class LevelThreeAccountCommands(commands.Cog):
                 process_op.append(payment)
         return process_op
 
-    def produce_envelope(self, tx_data: dict, dev_fee_status: bool):
+    async def produce_envelope(self, tx_data: dict, dev_fee_status: bool):
         """
         Returns Transaction as envelope
         """
-        source_account = self.server.load_account(tx_data["fromAddr"])
+        source_account = await self.server.load_account(tx_data["fromAddr"])
         tx_build = TransactionBuilder(
             source_account=source_account,
             network_passphrase=Network.TESTNET_NETWORK_PASSPHRASE,
-            base_fee=self.server.fetch_base_fee()
+            base_fee=self.hot_wallet.fee_oracle.get_base_fee()
 
         ).append_payment_op(
             destination=tx_data["toAddr"],
@@ -156,12 +153,12 @@ class LevelThreeAccountCommands(commands.Cog):
         envelope = tx_build.set_timeout(240).build()
         return envelope.to_xdr()
 
-    def stream_transaction_from_envelope(self, xdr_string: str, private_key: str):
+    async def stream_transaction_from_envelope(self, xdr_string: str, private_key: str):
         envelope = TransactionEnvelope.from_xdr(xdr_string, network_passphrase=Network.TESTNET_NETWORK_PASSPHRASE)
         envelope.sign(signer=private_key)
 
         try:
-            result = self.server.submit_transaction(envelope)
+            result = await self.server.submit_transaction(envelope)
             result.pop("envelope_xdr")
             result.pop("fee_meta_xdr")
             result.pop("result_meta_xdr")
@@ -268,7 +265,7 @@ class LevelThreeAccountCommands(commands.Cog):
                         "userId": int(ctx.message.author.id),
                         "publicAddress": details["address"]
                     }
-                    if self.acc_mng_rd_lvl.register_rd_level_wallet(data_to_store=details):
+                    if await self.acc_mng_rd_lvl.register_rd_level_wallet(data_to_store=details):
                         await new_acc_details(author=ctx.author, details=details)
                         msg = ':new: User register wallet level 3. :rocket: '
                         await self.uplink_notification(message=msg)
@@ -313,7 +310,7 @@ class LevelThreeAccountCommands(commands.Cog):
                         "publicAddress": str(public_address)
                     }
 
-                    if self.acc_mng_rd_lvl.register_rd_level_wallet(data_to_store=details):
+                    if await self.acc_mng_rd_lvl.register_rd_level_wallet(data_to_store=details):
                         await new_acc_details(author=ctx.author, details=details)
                         msg = ':new: User register wallet level 3. :rocket: '
                         await self.uplink_notification(message=msg)
@@ -354,7 +351,7 @@ class LevelThreeAccountCommands(commands.Cog):
                         "publicAddress": str(public_address)
                     }
 
-                    if self.acc_mng_rd_lvl.update_public_address(user_id=ctx.author.id, pub_address=public_address):
+                    if await self.acc_mng_rd_lvl.update_public_address(user_id=ctx.author.id, pub_address=public_address):
                         await new_acc_details(author=ctx.author, details=details)
                     else:
                         await custom_messages.system_message(ctx=ctx, message=CONST_REG_ERROR, color_code=1,
@@ -418,7 +415,7 @@ class LevelThreeAccountCommands(commands.Cog):
         verification = await self.bot.wait_for('message', check=check(ctx.message.author), timeout=60)
 
         if verification.content.upper() in ["YES", "Y"]:
-            if self.acc_mng_rd_lvl.remove_account(user_id=ctx.author.id):
+            if await self.acc_mng_rd_lvl.remove_account(user_id=ctx.author.id):
                 sys_msg_title = 'Wallet level 3 removed from system'
                 message = 'You have successfully removed wallet from the Crypto Link system.'
                 await custom_messages.system_message(ctx=ctx, color_code=Colour.green(), message=message, destination=0,
@@ -438,9 +435,9 @@ class LevelThreeAccountCommands(commands.Cog):
     @account.command(aliases=["nfo", "i"])
     async def info(self, ctx):
 
-        user_public = self.backoffice.third_level_manager.get_third_hot_wallet_addr(user_id=ctx.author.id)
+        user_public = await self.backoffice.third_level_manager.get_third_hot_wallet_addr(user_id=ctx.author.id)
         try:
-            data = self.server.accounts().account_id(account_id=user_public).call()
+            data = await self.server.accounts().account_id(account_id=user_public).call()
             if data and 'status' not in data:
                 # Send user account info
                 await user_account_info(ctx=ctx, data=data, bot_avatar_url=self.bot.user.avatar_url)
@@ -491,16 +488,16 @@ class LevelThreeAccountCommands(commands.Cog):
             if recipient_check or wallet_level_check:
                 if atomic_amount >= 100:
                     # Does recipient have registered selected wallet
-                    if self.check_user_wallet_layer_level(layer=wallet_level, user_id=recipient.id):
+                    if await self.check_user_wallet_layer_level(layer=wallet_level, user_id=recipient.id):
 
                         # Get data of the user
-                        recipient_data = self.get_recipient_details_based_on_layer(layer=wallet_level,
-                                                                                   user_id=recipient.id)
+                        recipient_data = await self.get_recipient_details_based_on_layer(layer=wallet_level,
+                                                                                         user_id=recipient.id)
 
                         # Check if account is live on network
                         if self.hot_wallet.check_if_account_activated(address=recipient_data["address"]):
                             # get sender details
-                            sender = self.acc_mng_rd_lvl.get_third_hot_wallet_addr(user_id=int(ctx.author.id))
+                            sender = await self.acc_mng_rd_lvl.get_third_hot_wallet_addr(user_id=int(ctx.author.id))
 
                             await dev_fee_option_notification(destination=ctx.message.author)
 
@@ -555,8 +552,8 @@ class LevelThreeAccountCommands(commands.Cog):
                                             "memo": recipient_data["memo"],
                                             "walletLevel": f"{wallet_level}"
                                             }
-                            xdr_envelope = self.produce_envelope(tx_data=request_data,
-                                                                 dev_fee_status=dev_fee_activated)
+                            xdr_envelope = await self.produce_envelope(tx_data=request_data,
+                                                                       dev_fee_status=dev_fee_activated)
 
                             message = f":new::envelope: Has been created for Discord Transaction to wallet level {wallet_level} " \
                                       f" in value of ***{request_data['txTotal']} {request_data['token']}*** :rocket: "
@@ -604,7 +601,7 @@ class LevelThreeAccountCommands(commands.Cog):
             # Get sender hot wallet
             if self.help_functions.check_public_key(address=public_address):
                 if self.hot_wallet.check_if_account_activated(address=public_address):
-                    user_address = self.acc_mng_rd_lvl.get_third_hot_wallet_addr(user_id=int(ctx.author.id))
+                    user_address = await self.acc_mng_rd_lvl.get_third_hot_wallet_addr(user_id=int(ctx.author.id))
                     if public_address != user_address:
                         if public_address != self.bot.backoffice.stellar_wallet.public_key:
                             request_data = {"fromAddr": user_address,
@@ -619,8 +616,8 @@ class LevelThreeAccountCommands(commands.Cog):
                                             "walletLevel": f"External Wallet"
                                             }
 
-                            xdr_envelope = self.produce_envelope(tx_data=request_data,
-                                                                 dev_fee_status=CONST_DEV_ACTIVATED)
+                            xdr_envelope = await self.produce_envelope(tx_data=request_data,
+                                                                       dev_fee_status=CONST_DEV_ACTIVATED)
 
                             # Send details to sender on produced envelope
                             await send_xdr_info(ctx=ctx, request_data=request_data, envelope=xdr_envelope,
@@ -708,7 +705,7 @@ class LevelThreeAccountCommands(commands.Cog):
                         private_key=private_key) and not self.help_functions.check_for_special_char(private_key):
                     await self.show_typing(ctx)
 
-                    result = self.stream_transaction_from_envelope(private_key=private_key, xdr_string=xdr_envelope)
+                    result = await self.stream_transaction_from_envelope(private_key=private_key, xdr_string=xdr_envelope)
                     if result[0]:
                         result_data = result[1]
 
@@ -29,13 +29,13 @@ def is_dm(ctx):
     return not ctx.message.guild
 
 
-def has_wallet(ctx):
+async def has_wallet(ctx):
     """
     Check if user has already registered personal wallet to the system
     :param ctx: Context
     :return: Boolean
     """
-    return ctx.bot.backoffice.account_mng.check_user_existence(user_id=ctx.message.author.id)
+    return await ctx.bot.backoffice.account_mng.check_user_existence(user_id=ctx.message.author.id)
 
 
 def is_owner(ctx):
@@ -45,70 +45,70 @@ def is_owner(ctx):
     return int(ctx.message.author.id) == int(ctx.message.guild.owner_id)
 
 
-def merchant_com_reg_stats(ctx):
+async def merchant_com_reg_stats(ctx):
     """
     Checks if community is registered in the merchant system
     """
     try:
-        return ctx.bot.backoffice.merchant_manager.check_if_community_exist(community_id=int(ctx.message.guild.id))
+        return await ctx.bot.backoffice.merchant_manager.check_if_community_exist(community_id=int(ctx.message.guild.id))
     except AttributeError:
         return False
 
 
-def community_missing(ctx):
+async def community_missing(ctx):
     """
     Check if community not registered in the system
     """
-    return ctx.bot.backoffice.merchant_manager.check_if_community_exist(community_id=ctx.message.guild.id) is None
+    return await ctx.bot.backoffice.merchant_manager.check_if_community_exist(community_id=ctx.message.guild.id) is None
 
 
-def user_has_wallet(ctx):
+async def user_has_wallet(ctx):
     """
     Check if user has wallet registered in the system
     """
-    return ctx.bot.backoffice.account_mng.check_user_existence(user_id=ctx.message.author.id)
+    return await ctx.bot.backoffice.account_mng.check_user_existence(user_id=ctx.message.author.id)
 
 
-def guild_has_merchant(ctx):
+async def guild_has_merchant(ctx):
     """
     Check if community has activate merchant system
     """
-    return ctx.bot.backoffice.merchant_manager.check_if_community_exist(int(ctx.message.guild.id))
+    return await ctx.bot.backoffice.merchant_manager.check_if_community_exist(int(ctx.message.guild.id))
 
 
-def guild_has_stats(ctx):
+async def guild_has_stats(ctx):
     """
     Guild registration status check for stats
     """
-    return ctx.bot.backoffice.guild_profiles.check_guild_registration_stats(guild_id=ctx.guild.id)
+    return await ctx.bot.backoffice.guild_profiles.check_guild_registration_stats(guild_id=ctx.guild.id)
 
 
-def user_has_second_level(ctx):
+async def user_has_second_level(ctx):
     """
     Custom check for custodial wallet
     """
-    return ctx.bot.backoffice.second_level_manager.second_level_user_reg_status(user_id=ctx.author.id)
+    return await ctx.bot.backoffice.second_level_manager.second_level_user_reg_status(user_id=ctx.author.id)
 
 
-def user_has_no_second(ctx):
+async def user_has_no_second(ctx):
     """
     Check if user has not registered for second wallet
     """
-    return not ctx.bot.backoffice.second_level_manager.second_level_user_reg_status(user_id=ctx.author.id)
+    return not await ctx.bot.backoffice.second_level_manager.second_level_user_reg_status(user_id=ctx.author.id)
 
 
-def user_has_third_level(ctx):
+async def user_has_third_level(ctx):
     """
     Check if user has registered for third level
     """
-    return ctx.bot.backoffice.third_level_manager.third_level_user_reg_status(user_id=ctx.author.id)
+    return await ctx.bot.backoffice.third_level_manager.third_level_user_reg_status(user_id=ctx.author.id)
 
 
-def user_has_no_third_level(ctx):
+async def user_has_no_third_level(ctx):
     """
     Check if user has not registered for third level
     """
-    return not ctx.bot.backoffice.third_level_manager.third_level_user_reg_status(user_id=ctx.author.id)
+    return not await ctx.bot.backoffice.third_level_manager.third_level_user_reg_status(user_id=ctx.author.id)
 
 
 def check(author):